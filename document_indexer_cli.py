@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 """Standalone document indexer CLI tool."""
 
-import os
 import sys
 from pathlib import Path
 import argparse
@@ -10,8 +9,8 @@ from typing import List, Optional
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from dotenv import load_dotenv
-from src.migration.models.config import GCSConfig, TurbopufferConfig, IndexingConfig
+from src.migration.models.config import IndexingConfig
+from src.migration.utils.config_loader import load_indexing_config
 from src.migration.models.migration import ProjectRecord, DocumentRecord
 from src.indexing.document_indexer import DocumentIndexer
 from src.indexing.query_interface import DocumentQueryInterface
@@ -19,27 +18,11 @@ from src.indexing.query_interface import DocumentQueryInterface
 
 def load_config() -> IndexingConfig:
     """Load configuration from environment variables."""
-    load_dotenv()
-    
-    gcs_config = GCSConfig(
-        project_id=os.getenv("GCS_PROJECT_ID", "webapp-466015"),
-        bucket_name=os.getenv("GCS_BUCKET_NAME", "filevine-backup"),
-        credentials_path=os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
-    )
-    
-    turbopuffer_config = TurbopufferConfig(
-        api_key=os.getenv("TURBOPUFFER_API_KEY", ""),
-        region=os.getenv("TURBOPUFFER_REGION", "gcp-us-central1")
-    )
-    
-    if not turbopuffer_config.api_key:
-        print("Error: TURBOPUFFER_API_KEY environment variable is required")
+    try:
+        return load_indexing_config()
+    except ValueError as e:
+        print(f"Error: {e}")
         sys.exit(1)
-    
-    return IndexingConfig(
-        gcs=gcs_config,
-        turbopuffer=turbopuffer_config
-    )
 
 
 def cmd_index_gcs(args):
@@ -48,10 +31,15 @@ def cmd_index_gcs(args):
     indexer = DocumentIndexer(config)
     
     print("Indexing documents from GCS bucket scan...")
-    results = indexer.scan_and_index_gcs_bucket(batch_size=args.batch_size)
+    results = indexer.scan_and_index_gcs_bucket(
+        batch_size=args.batch_size,
+        resume=args.resume,
+        incremental=args.incremental
+    )
     
     print(f"Indexing completed!")
     print(f"Files indexed: {results['indexed_files']}")
+    print(f"Files unchanged: {results['unchanged_files']}")
 
 
 def cmd_index_from_db(args):
@@ -81,7 +69,7 @@ def cmd_stats(args):
     config = load_config()
     query_interface = DocumentQueryInterface(config)
     
-    stats = query_interface.get_index_statistics()
+    stats = query_interface.get_index_statistics(force_refresh=True)
     print(f"Index Statistics:")
     for key, value in stats.items():
         print(f"  {key}: {value}")
@@ -100,8 +88,20 @@ def main():
     index_gcs_parser.add_argument(
         '--batch-size', 
         type=int, 
-        default=100, 
-        help='Batch size for indexing (default: 100)'
+        default=1000, 
+        help='Initial batch size for indexing, adapted to upsert latency (default: 1000)'
+    )
+    index_gcs_parser.add_argument(
+        '--resume', 
+        action=argparse.BooleanOptionalAction, 
+        default=True, 
+        help='Continue from the cursor left by an interrupted scan (default: enabled)'
+    )
+    index_gcs_parser.add_argument(
+        '--incremental', 
+        action=argparse.BooleanOptionalAction, 
+        default=True, 
+        help='Skip blobs already indexed at their current generation (default: enabled)'
     )
     index_gcs_parser.set_defaults(func=cmd_index_gcs)
     
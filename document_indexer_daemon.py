@@ -8,11 +8,12 @@ import argparse
 from pathlib import Path
 
 import uvicorn
-from dotenv import load_dotenv
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+from src.migration.utils.config_loader import load_indexing_config
+
 
 def handle_signal(signum, frame):
     """Handle shutdown signals."""
@@ -40,8 +41,14 @@ def main():
     parser.add_argument(
         '--workers', 
         type=int, 
-        default=1, 
-        help='Number of worker processes (default: 1)'
+        default=None, 
+        help='Number of worker processes (default: $WEB_CONCURRENCY or CPU count)'
+    )
+    parser.add_argument(
+        '--limit-concurrency', 
+        type=int, 
+        default=None, 
+        help='Maximum concurrent connections per worker before returning 503 (default: unlimited)'
     )
     parser.add_argument(
         '--reload', 
@@ -62,12 +69,13 @@ def main():
     
     args = parser.parse_args()
     
-    # Load environment variables
-    load_dotenv()
+    workers = args.workers or int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
     
-    # Check required environment variables
-    if not os.getenv("TURBOPUFFER_API_KEY"):
-        print("Error: TURBOPUFFER_API_KEY environment variable is required")
+    # Load and validate configuration once; the API reuses the cached result
+    try:
+        indexing_config = load_indexing_config()
+    except ValueError as e:
+        print(f"Error: {e}")
         sys.exit(1)
     
     # Set up signal handlers for graceful shutdown
@@ -76,27 +84,27 @@ def main():
     
     print(f"Starting Document Indexer API daemon...")
     print(f"Host: {args.host}:{args.port}")
-    print(f"Workers: {args.workers}")
+    print(f"Workers: {workers}")
     print(f"Log level: {args.log_level}")
-    print(f"GCS Bucket: {os.getenv('GCS_BUCKET_NAME', 'filevine-backup')}")
-    print(f"Turbopuffer Region: {os.getenv('TURBOPUFFER_REGION', 'gcp-us-central1')}")
+    print(f"GCS Bucket: {indexing_config.gcs.bucket_name}")
+    print(f"Turbopuffer Region: {indexing_config.turbopuffer.region}")
     print("API Documentation available at: http://{}:{}/docs".format(args.host, args.port))
     
-    # Configure uvicorn
-    config = uvicorn.Config(
-        "src.indexing.api:app",
-        host=args.host,
-        port=args.port,
-        workers=args.workers,
-        log_level=args.log_level,
-        reload=args.reload,
-        access_log=args.access_log
-    )
-    
-    server = uvicorn.Server(config)
-    
     try:
-        server.run()
+        # uvicorn.run supervises multiple worker processes; Server.run ignores workers
+        uvicorn.run(
+            "src.indexing.api:app",
+            host=args.host,
+            port=args.port,
+            workers=workers,
+            loop="uvloop",
+            http="httptools",
+            limit_concurrency=args.limit_concurrency,
+            backlog=2048,
+            log_level=args.log_level,
+            reload=args.reload,
+            access_log=args.access_log
+        )
     except KeyboardInterrupt:
         print("\nShutdown requested by user")
     except Exception as e:
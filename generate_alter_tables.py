@@ -5,9 +5,47 @@ Generate ALTER TABLE statements to add primary key constraints for tables in ret
 
 import csv
 import json
+import re
 import sys
 from pathlib import Path
 
+# SQLSTATE codes we know how to fix; 42P10 wins when both appear
+_SQLSTATE_RE = re.compile(r'42P10|42703')
+
+
+def classify_error_message(error_message: str) -> str:
+    """Return the SQLSTATE to fix for an error message in one left-to-right pass.
+    
+    42703 = column doesn't exist; 42P10 = no unique constraint, which is also
+    the default if we can't determine the error.
+    """
+    match = _SQLSTATE_RE.search(error_message)
+    if match is None or match.group() == '42P10':
+        return '42P10'
+    # Found 42703 first; only a later 42P10 can override it
+    if error_message.find('42P10', match.end()) != -1:
+        return '42P10'
+    return '42703'
+
+
+SQL_HEADER = (
+    "-- ALTER TABLE statements to fix primary key issues\n"
+    "-- Run these in Supabase SQL Editor\n"
+)
+
+# Column doesn't exist - ADD id column with PRIMARY KEY
+ADD_COLUMN_TEMPLATE = (
+    "\n-- Table: {t} (Error: {code})\n"
+    "ALTER TABLE \"{t}\" ADD COLUMN id uuid DEFAULT gen_random_uuid() PRIMARY KEY;\n"
+)
+
+# 42P10 or other - ALTER existing id to be UNIQUE (nullable)
+ADD_UNIQUE_TEMPLATE = (
+    "\n-- Table: {t} (Error: {code})\n"
+    "ALTER TABLE \"{t}\" DROP CONSTRAINT IF EXISTS {t}_id_unique;\n"
+    "ALTER TABLE \"{t}\" ADD CONSTRAINT {t}_id_unique UNIQUE (id);\n"
+)
+
 
 def extract_table_errors_from_retry_file(csv_file_path: str) -> dict:
     """Extract table names and their error codes from the retry CSV file."""
@@ -17,22 +55,25 @@ def extract_table_errors_from_retry_file(csv_file_path: str) -> dict:
     csv.field_size_limit(10 * 1024 * 1024)  # 10MB limit
     
     try:
-        with open(csv_file_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+        with open(csv_file_path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            
+            header = next(reader, None)
+            if not header:
+                return {}
+            table_index = header.index('table_name')
+            error_index = header.index('error_message')
+            min_length = max(table_index, error_index) + 1
             
             for row in reader:
-                table_name = row.get('table_name', '').strip()
-                error_message = row.get('error_message', '').strip()
+                if len(row) < min_length:
+                    continue
+                
+                table_name = row[table_index].strip()
+                error_message = row[error_index]
                 
-                if table_name and error_message:
-                    # Check for specific error codes in the error message
-                    if '42P10' in error_message:
-                        table_errors[table_name] = '42P10'  # No unique constraint
-                    elif '42703' in error_message:
-                        table_errors[table_name] = '42703'  # Column doesn't exist
-                    else:
-                        # Default to 42P10 if we can't determine the error
-                        table_errors[table_name] = '42P10'
+                if table_name and error_message and not error_message.isspace():
+                    table_errors[table_name] = classify_error_message(error_message)
                     
     except Exception as e:
         print(f"Error reading CSV file: {e}")
@@ -41,30 +82,18 @@ def extract_table_errors_from_retry_file(csv_file_path: str) -> dict:
     return table_errors
 
 
+def iter_alter_table_sql(table_errors: dict):
+    """Yield ALTER TABLE SQL, one block per table, based on error codes."""
+    yield SQL_HEADER
+    
+    for table_name, error_code in sorted(table_errors.items()):
+        template = ADD_COLUMN_TEMPLATE if error_code == '42703' else ADD_UNIQUE_TEMPLATE
+        yield template.format_map({'t': table_name, 'code': error_code})
+
+
 def generate_alter_table_sql(table_errors: dict) -> str:
     """Generate ALTER TABLE SQL statements based on error codes."""
-    sql_statements = []
-    
-    sql_statements.append("-- ALTER TABLE statements to fix primary key issues")
-    sql_statements.append("-- Run these in Supabase SQL Editor")
-    sql_statements.append("")
-    
-    for table_name in sorted(table_errors.keys()):
-        error_code = table_errors[table_name]
-        
-        sql_statements.append(f"-- Table: {table_name} (Error: {error_code})")
-        
-        if error_code == '42703':
-            # Column doesn't exist - ADD id column with PRIMARY KEY
-            sql_statements.append(f"ALTER TABLE \"{table_name}\" ADD COLUMN id uuid DEFAULT gen_random_uuid() PRIMARY KEY;")
-        else:
-            # 42P10 or other - ALTER existing id to be UNIQUE (nullable)
-            sql_statements.append(f"ALTER TABLE \"{table_name}\" DROP CONSTRAINT IF EXISTS {table_name}_id_unique;")
-            sql_statements.append(f"ALTER TABLE \"{table_name}\" ADD CONSTRAINT {table_name}_id_unique UNIQUE (id);")
-        
-        sql_statements.append("")
-    
-    return '\n'.join(sql_statements)
+    return ''.join(iter_alter_table_sql(table_errors))
 
 
 def main():
@@ -92,18 +121,14 @@ def main():
         print(f"  {table_name}: {error_code}")
     print()
     
-    # Generate ALTER TABLE SQL
-    sql = generate_alter_table_sql(table_errors)
-    
-    # Output SQL to console
-    print(sql)
-    
-    # Also save to file
+    # Generate ALTER TABLE SQL, streaming each block to the console and to file
     output_file = "alter_tables_for_retry.sql"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(sql)
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        for block in iter_alter_table_sql(table_errors):
+            print(block, end='')
+            f.write(block)
     
-    print(f"\nSQL also saved to: {output_file}")
+    print(f"\n\nSQL also saved to: {output_file}")
 
 
 if __name__ == "__main__":
@@ -1,21 +1,23 @@
 """FastAPI web service for document indexing and search."""
 
-import os
+import asyncio
 import sys
 from pathlib import Path
 from contextlib import asynccontextmanager
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from dotenv import load_dotenv
+from fastapi.responses import ORJSONResponse
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.migration.models.config import GCSConfig, TurbopufferConfig, IndexingConfig
+from src.migration.utils.config_loader import load_indexing_config
+from src.migration.core.gcs_mapper import create_storage_client
 from src.indexing.document_indexer import DocumentIndexer
 from src.indexing.query_interface import DocumentQueryInterface
+from src.indexing.turbopuffer_client import SearchHit, TurbopufferClient
 from src.indexing.models import (
     SearchRequest, SearchResponse, DocumentResult,
     IndexStats, IndexRequest, IndexResponse
@@ -27,39 +29,21 @@ indexer: DocumentIndexer = None
 query_interface: DocumentQueryInterface = None
 
 
-def load_config() -> IndexingConfig:
-    """Load configuration from environment variables."""
-    load_dotenv()
-    
-    gcs_config = GCSConfig(
-        project_id=os.getenv("GCS_PROJECT_ID", "webapp-466015"),
-        bucket_name=os.getenv("GCS_BUCKET_NAME", "filevine-backup"),
-        credentials_path=os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
-    )
-    
-    turbopuffer_config = TurbopufferConfig(
-        api_key=os.getenv("TURBOPUFFER_API_KEY", ""),
-        region=os.getenv("TURBOPUFFER_REGION", "gcp-us-central1")
-    )
-    
-    if not turbopuffer_config.api_key:
-        raise ValueError("TURBOPUFFER_API_KEY environment variable is required")
-    
-    return IndexingConfig(
-        gcs=gcs_config,
-        turbopuffer=turbopuffer_config
-    )
-
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize services on startup."""
     global indexer, query_interface
     
     try:
-        config = load_config()
-        indexer = DocumentIndexer(config)
-        query_interface = DocumentQueryInterface(config)
+        config = load_indexing_config()
+        app.state.config = config
+        app.state.gcs_client = create_storage_client(config.gcs)
+        # One Turbopuffer client so writes from /index invalidate the caches /search reads
+        turbopuffer_client = TurbopufferClient(config.turbopuffer)
+        indexer = DocumentIndexer(
+            config, gcs_client=app.state.gcs_client, turbopuffer_client=turbopuffer_client
+        )
+        query_interface = DocumentQueryInterface(config, client=turbopuffer_client)
         print(f"Document indexer service initialized")
         print(f"GCS Bucket: {config.gcs.bucket_name}")
         print(f"Turbopuffer Region: {config.turbopuffer.region}")
@@ -70,6 +54,8 @@ async def lifespan(app: FastAPI):
     yield
     
     # Cleanup on shutdown
+    await query_interface.client.aclose()
+    app.state.gcs_client.close()
     indexer = None
     query_interface = None
 
@@ -78,6 +64,7 @@ app = FastAPI(
     title="Document Indexer API",
     description="Search and index documents stored in Google Cloud Storage",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -91,6 +78,23 @@ app.add_middleware(
 )
 
 
+def _document_results(hits: List[SearchHit]) -> List[DocumentResult]:
+    """Build response models from search hits without re-validating them."""
+    construct = DocumentResult.model_construct
+    return [
+        construct(
+            id=hit.id,
+            filename=hit.filename,
+            gcs_path=hit.gcs_path,
+            project_name=hit.project_name,
+            project_id=hit.project_id,
+            gcs_url=hit.gcs_url,
+            public_url=hit.public_url
+        )
+        for hit in hits
+    ]
+
+
 @app.get("/")
 async def root():
     """Root endpoint with service information."""
@@ -107,11 +111,16 @@ async def root():
     }
 
 
-@app.post("/search", response_model=SearchResponse)
+@app.post(
+    "/search",
+    response_model=SearchResponse,
+    response_model_exclude_none=True,
+    response_class=ORJSONResponse
+)
 async def search_documents(request: SearchRequest):
     """Search for documents with various filter options."""
     try:
-        results = query_interface.search_documents(
+        results = await query_interface.async_search_documents(
             query=request.query or "",
             project_name=request.project_name or "",
             project_id=request.project_id,
@@ -119,19 +128,6 @@ async def search_documents(request: SearchRequest):
             limit=request.limit
         )
         
-        # Convert results to proper format
-        document_results = []
-        for result in results:
-            document_results.append(DocumentResult(
-                id=result.get('id', ''),
-                filename=result.get('filename', ''),
-                gcs_path=result.get('gcs_path', ''),
-                project_name=result.get('project_name', ''),
-                project_id=result.get('project_id', 0),
-                gcs_url=result.get('gcs_url', ''),
-                public_url=result.get('public_url', '')
-            ))
-        
         query_info = {
             "query": request.query,
             "project_name": request.project_name,
@@ -140,9 +136,10 @@ async def search_documents(request: SearchRequest):
             "limit": request.limit
         }
         
-        return SearchResponse(
-            results=document_results,
-            total_found=len(document_results),
+        # Hits are already shaped by the query interface; skip re-validation
+        return SearchResponse.model_construct(
+            results=_document_results(results),
+            total_found=len(results),
             query_info=query_info
         )
         
@@ -157,21 +154,9 @@ async def search_by_project_id(project_id: int, limit: int = 10):
         results = query_interface.get_project_documents(project_id)
         limited_results = results[:limit]
         
-        document_results = []
-        for result in limited_results:
-            document_results.append(DocumentResult(
-                id=result.get('id', ''),
-                filename=result.get('filename', ''),
-                gcs_path=result.get('gcs_path', ''),
-                project_name=result.get('project_name', ''),
-                project_id=result.get('project_id', 0),
-                gcs_url=result.get('gcs_url', ''),
-                public_url=result.get('public_url', '')
-            ))
-        
-        return SearchResponse(
-            results=document_results,
-            total_found=len(document_results),
+        return SearchResponse.model_construct(
+            results=_document_results(limited_results),
+            total_found=len(limited_results),
             query_info={"project_id": project_id, "limit": limit}
         )
         
@@ -179,7 +164,7 @@ async def search_by_project_id(project_id: int, limit: int = 10):
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
 
 
-@app.get("/stats", response_model=IndexStats)
+@app.get("/stats", response_model=IndexStats, response_class=ORJSONResponse)
 async def get_index_stats():
     """Get index statistics."""
     try:
@@ -195,7 +180,11 @@ async def trigger_indexing(request: IndexRequest, background_tasks: BackgroundTa
     try:
         def run_indexing():
             try:
-                results = indexer.scan_and_index_gcs_bucket(batch_size=request.batch_size)
+                results = indexer.scan_and_index_gcs_bucket(
+                    batch_size=request.batch_size,
+                    resume=request.resume,
+                    incremental=request.incremental
+                )
                 print(f"Indexing completed: {results}")
             except Exception as e:
                 print(f"Indexing failed: {e}")
@@ -216,8 +205,10 @@ async def trigger_indexing(request: IndexRequest, background_tasks: BackgroundTa
 async def health_check():
     """Health check endpoint."""
     try:
-        # Quick health check by getting stats
-        stats = query_interface.get_index_statistics()
-        return {"status": "healthy", "index_status": stats.get("status", "unknown")}
+        # Only check connectivity; index statistics are left to /stats. The ping is a
+        # blocking HTTP call, so it runs off the event loop
+        if await asyncio.to_thread(query_interface.is_reachable):
+            return {"status": "healthy"}
+        return {"status": "unhealthy", "error": "Turbopuffer API unreachable"}
     except Exception as e:
         return {"status": "unhealthy", "error": str(e)}
\ No newline at end of file
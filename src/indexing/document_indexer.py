@@ -1,30 +1,289 @@
 """Document indexer that integrates with existing GCS mapping system."""
 
-from typing import List, Dict, Any, Optional
+import json
+import os
+import queue
+import sqlite3
+import statistics
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import blake2b
+from pathlib import Path
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple
+import turbopuffer
 from tqdm import tqdm
 from google.cloud import storage
 
 from ..migration.models.config import IndexingConfig  
-from ..migration.core.gcs_mapper import ProjectGCSMapper
+from ..migration.core.gcs_mapper import ProjectGCSMapper, create_storage_client
 from ..migration.models.migration import ProjectRecord, DocumentRecord
-from .turbopuffer_client import TurbopufferClient
+from .turbopuffer_client import DocumentColumns, TurbopufferClient
+
+
+# Only object names and generations are needed when scanning; GCS caps list pages at 1000 items
+LIST_FIELDS = "items(name,generation),nextPageToken"
+LIST_PAGE_SIZE = 1000
+
+# The bucket scan lists each second-level prefix under docs/ concurrently
+SCAN_ROOT = "docs/"
+SCAN_WORKERS = 16
+
+# Upper bound on document batches waiting for the background uploader
+MAX_PENDING_BATCHES = 4
+
+# Where bucket scans record how far each shard has been indexed; scoped per bucket and prefix
+DEFAULT_CURSOR_PATH = ".indexer_cursor"
+
+# Where bucket scans record the generation of every indexed blob; scoped per bucket and prefix
+DEFAULT_STATE_PATH = ".indexer_state.db"
+
+# Bucket scans grow batches while upserts are fast and shrink them when slow
+DEFAULT_BATCH_SIZE = 1000
+MIN_ADAPTIVE_BATCH_SIZE = 100
+MAX_BATCH_SIZE = 10000
+FAST_UPSERT_SECONDS = 0.2
+SLOW_UPSERT_SECONDS = 2.0
+
+_SHARD_DONE = object()
+
+# One lock per state file so concurrent scans in this process never interleave writes
+_path_locks: Dict[str, threading.Lock] = {}
+_path_locks_guard = threading.Lock()
+
+
+def scoped_state_path(base_path: str, bucket_name: str, prefix: str = SCAN_ROOT) -> str:
+    """Derive a state file name unique to a bucket and scan prefix from a base path."""
+    scope = blake2b(f"{bucket_name}/{prefix}".encode(), digest_size=4).hexdigest()
+    root, ext = os.path.splitext(base_path)
+    return f"{root}.{bucket_name}.{scope}{ext}"
+
+
+def _lock_for_path(path: str) -> threading.Lock:
+    """Return the process-wide lock guarding writes to a state file."""
+    key = os.path.abspath(path)
+    with _path_locks_guard:
+        return _path_locks.setdefault(key, threading.Lock())
+
+
+def stable_blob_ids(blob_names: List[str]) -> List[str]:
+    """Compute deterministic 64-bit document IDs for a batch of blob names."""
+    return [
+        f"gcs_{blake2b(name.encode(), digest_size=8).hexdigest()}"
+        for name in blob_names
+    ]
+
+
+class ScanCursor:
+    """Persists the last indexed blob name per scan shard so bucket scans can resume.
+    
+    GCS lists each prefix in lexicographic order, so a shard's cursor can be
+    passed back as start_offset to skip everything already indexed.
+    """
+    
+    def __init__(self, path: str, bucket_name: str):
+        self.path = Path(path)
+        self.bucket_name = bucket_name
+        self.shards: Dict[str, str] = {}
+        self._lock = _lock_for_path(path)
+    
+    def load(self) -> Dict[str, str]:
+        """Load saved shard cursors, ignoring cursors from a different bucket."""
+        try:
+            data = json.loads(self.path.read_text())
+        except (FileNotFoundError, ValueError):
+            return {}
+        if data.get("bucket") != self.bucket_name:
+            return {}
+        self.shards = dict(data.get("shards", {}))
+        return dict(self.shards)
+    
+    def update(self, checkpoint: Dict[str, str]) -> None:
+        """Merge newly indexed shard positions and write them atomically."""
+        with self._lock:
+            self.shards.update(checkpoint)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self.path.parent, prefix=self.path.name + ".", suffix=".tmp", delete=False
+            ) as tmp:
+                tmp.write(json.dumps({"bucket": self.bucket_name, "shards": self.shards}))
+            try:
+                os.replace(tmp.name, self.path)
+            except OSError:
+                os.unlink(tmp.name)
+                raise
+    
+    def clear(self) -> None:
+        """Remove the cursor once a scan has completed."""
+        with self._lock:
+            self.shards = {}
+            self.path.unlink(missing_ok=True)
+
+
+class BlobGenerationState:
+    """Records the GCS generation of each indexed blob so unchanged blobs can be skipped.
+    
+    A blob's generation changes whenever its content is overwritten, so a
+    matching generation means the indexed document is still current.
+    """
+    
+    def __init__(self, path: str, bucket_name: str):
+        self.bucket_name = bucket_name
+        # Looked up by the scanning thread and written by the uploader thread; the
+        # lock is shared with any other scan in this process using the same file
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = _lock_for_path(path)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS blob_state ("
+                "bucket TEXT NOT NULL, blob_name TEXT NOT NULL, generation INTEGER NOT NULL, "
+                "PRIMARY KEY (bucket, blob_name)) WITHOUT ROWID"
+            )
+    
+    def get(self, blob_name: str) -> Optional[int]:
+        """Return the generation last indexed for a blob, if any."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT generation FROM blob_state WHERE bucket = ? AND blob_name = ?",
+                (self.bucket_name, blob_name)
+            ).fetchone()
+        return row[0] if row else None
+    
+    def record(self, blobs: List[Tuple[str, int]]) -> None:
+        """Store (blob_name, generation) pairs for an indexed batch in one transaction."""
+        bucket_name = self.bucket_name
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO blob_state (bucket, blob_name, generation) VALUES (?, ?, ?)",
+                [(bucket_name, name, generation) for name, generation in blobs]
+            )
+    
+    def close(self) -> None:
+        """Close the state database."""
+        self._conn.close()
+
+
+class AdaptiveBatchSize:
+    """Tunes the batch size from the median latency of recent upserts."""
+    
+    def __init__(
+        self,
+        initial: int,
+        maximum: int = MAX_BATCH_SIZE,
+        window: int = 5
+    ):
+        self.size = initial
+        self.minimum = min(initial, MIN_ADAPTIVE_BATCH_SIZE)
+        self.maximum = max(initial, maximum)
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+    
+    def record(self, seconds: float) -> None:
+        """Record one upsert's latency, resizing once a full window is observed."""
+        with self._lock:
+            self._latencies.append(seconds)
+            if len(self._latencies) < self._latencies.maxlen:
+                return
+            
+            p50 = statistics.median(self._latencies)
+            if p50 < FAST_UPSERT_SECONDS:
+                self.size = min(self.size * 2, self.maximum)
+            elif p50 > SLOW_UPSERT_SECONDS:
+                self.size = max(self.size // 2, self.minimum)
+            else:
+                return
+            # Judge the new size on its own latencies
+            self._latencies.clear()
+
+
+class BackgroundBatchUploader:
+    """Indexes document batches on a background thread so producers never block on writes."""
+    
+    def __init__(
+        self,
+        turbopuffer_client: TurbopufferClient,
+        max_pending: int = MAX_PENDING_BATCHES,
+        on_checkpoint: Optional[Callable[[Any], None]] = None,
+        batch_sizer: Optional[AdaptiveBatchSize] = None
+    ):
+        self.turbopuffer_client = turbopuffer_client
+        self.on_checkpoint = on_checkpoint
+        self.batch_sizer = batch_sizer
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._thread = threading.Thread(target=self._run, name="turbopuffer-uploader", daemon=True)
+        self._error: Optional[BaseException] = None
+    
+    def __enter__(self) -> "BackgroundBatchUploader":
+        self._thread.start()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._queue.put(None)
+        self._thread.join()
+        if exc_type is None and self._error is not None:
+            raise self._error
+    
+    def submit(
+        self,
+        batch_documents: DocumentColumns,
+        checkpoint: Optional[Any] = None
+    ) -> None:
+        """Queue a batch for indexing, blocking while the queue is full.
+        
+        The checkpoint is passed to on_checkpoint once the batch is indexed; an
+        empty batch is not written, but its checkpoint is still passed on in order.
+        """
+        if self._error is not None:
+            raise self._error
+        self._queue.put((batch_documents, checkpoint))
+    
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            # After a failure keep draining so the producer is never left blocked
+            if self._error is not None:
+                continue
+            batch_documents, checkpoint = item
+            try:
+                if batch_documents:
+                    started = time.perf_counter()
+                    self.turbopuffer_client.batch_index_documents(batch_documents)
+                    if self.batch_sizer:
+                        self.batch_sizer.record(time.perf_counter() - started)
+                if checkpoint and self.on_checkpoint:
+                    self.on_checkpoint(checkpoint)
+            except BaseException as e:
+                self._error = e
 
 
 class DocumentIndexer:
     """Indexes document metadata from GCS using existing project mapping."""
     
-    def __init__(self, config: IndexingConfig):
+    def __init__(
+        self,
+        config: IndexingConfig,
+        gcs_client: Optional[storage.Client] = None,
+        turbopuffer_client: Optional[TurbopufferClient] = None
+    ):
         self.config = config
-        self.gcs_mapper = ProjectGCSMapper(config.gcs)
-        self.turbopuffer_client = TurbopufferClient(config.turbopuffer)
-        self.gcs_client = storage.Client(project=config.gcs.project_id)
+        self.gcs_client = gcs_client or create_storage_client(config.gcs)
+        self.gcs_mapper = ProjectGCSMapper(config.gcs, client=self.gcs_client)
+        self.turbopuffer_client = turbopuffer_client or TurbopufferClient(config.turbopuffer)
         self.bucket = self.gcs_client.bucket(config.gcs.bucket_name)
+        
+        # URL prefixes are constant per bucket; build them once for the hot loops
+        self._gs_prefix = f"gs://{config.gcs.bucket_name}/"
+        self._public_prefix = f"https://storage.googleapis.com/{config.gcs.bucket_name}/"
+        self._known_prefix = "docs/Bennett Legal/"
     
     def index_existing_documents(
         self, 
         projects: List[ProjectRecord], 
         documents: List[DocumentRecord],
-        batch_size: int = 100
+        batch_size: int = DEFAULT_BATCH_SIZE
     ) -> Dict[str, Any]:
         """Index all existing documents from project mapping."""
         
@@ -38,37 +297,57 @@ class DocumentIndexer:
         
         indexed_count = 0
         skipped_count = 0
-        batch_documents = []
+        batch_columns = DocumentColumns()
+        
+        # Hoist lookups out of the per-document loop
+        get_path = project_path_map.get
+        get_project = project_lookup.get
+        gs_prefix = self._gs_prefix
+        public_prefix = self._public_prefix
+        append = batch_columns.append
         
         print("Indexing documents...")
-        for document in tqdm(documents, desc="Processing documents"):
-            if not document.project_id or document.project_id not in project_path_map:
-                skipped_count += 1
-                continue
+        with BackgroundBatchUploader(self.turbopuffer_client) as uploader:
+            for document in tqdm(documents, desc="Processing documents"):
+                project_id = document.project_id
+                gcs_path = get_path(project_id) if project_id else None
+                if gcs_path is None:
+                    skipped_count += 1
+                    continue
                 
-            if not document.filename or not document.filename.strip():
-                skipped_count += 1
-                continue
-            
-            project = project_lookup.get(document.project_id)
-            if not project:
-                skipped_count += 1
-                continue
-            
-            # Generate document metadata for indexing
-            doc_data = self._create_document_data(document, project, project_path_map)
-            if doc_data:
-                batch_documents.append(doc_data)
+                filename = document.filename
+                if not filename or not filename.strip():
+                    skipped_count += 1
+                    continue
+                
+                project = get_project(project_id)
+                if not project:
+                    skipped_count += 1
+                    continue
+                
+                # Generate document metadata for indexing
+                full_gcs_path = gcs_path + "/" + filename
+                append(
+                    f"doc_{document.id}",
+                    filename,
+                    full_gcs_path,
+                    project.project_name,
+                    project_id,
+                    document.id,
+                    gs_prefix + full_gcs_path,
+                    public_prefix + full_gcs_path
+                )
                 indexed_count += 1
                 
-                # Process batch when full
-                if len(batch_documents) >= batch_size:
-                    self.turbopuffer_client.batch_index_documents(batch_documents)
-                    batch_documents = []
-        
-        # Process remaining documents in final batch
-        if batch_documents:
-            self.turbopuffer_client.batch_index_documents(batch_documents)
+                # Hand off batch to the uploader when full
+                if len(batch_columns) >= batch_size:
+                    uploader.submit(batch_columns)
+                    batch_columns = DocumentColumns()
+                    append = batch_columns.append
+            
+            # Process remaining documents in final batch
+            if batch_columns:
+                uploader.submit(batch_columns)
         
         return {
             "indexed_documents": indexed_count,
@@ -90,54 +369,209 @@ class DocumentIndexer:
             return True
         return False
     
-    def scan_and_index_gcs_bucket(self, batch_size: int = 100) -> Dict[str, Any]:
-        """Scan GCS bucket directly and index all files found."""
+    def scan_and_index_gcs_bucket(
+        self, 
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        resume: bool = True,
+        cursor_path: Optional[str] = None,
+        incremental: bool = True,
+        state_path: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Scan GCS bucket directly and index all files found.
+        
+        Progress is checkpointed to cursor_path (by default a file scoped to this
+        bucket and prefix) after every indexed batch; with resume, shards
+        continue from their checkpoint instead of the start.
+        batch_size is the starting size and adapts to observed upsert latency.
+        The generation of every indexed blob is kept in state_path (also scoped
+        to the bucket and prefix by default); with incremental, blobs whose generation is unchanged are not re-indexed.
+        """
         
         print(f"Scanning GCS bucket: {self.config.gcs.bucket_name}")
         
+        bucket_name = self.config.gcs.bucket_name
+        cursor_path = cursor_path or scoped_state_path(DEFAULT_CURSOR_PATH, bucket_name)
+        cursor = ScanCursor(cursor_path, bucket_name)
+        start_offsets = cursor.load() if resume else {}
+        if start_offsets:
+            print(f"Resuming scan for {len(start_offsets)} shard(s) from {cursor_path}")
+        
+        state_path = state_path or scoped_state_path(DEFAULT_STATE_PATH, bucket_name)
+        state = BlobGenerationState(state_path, bucket_name)
+        
+        def on_batch_indexed(checkpoint: Tuple[Dict[str, str], List[Tuple[str, int]]]) -> None:
+            shard_checkpoint, blobs = checkpoint
+            state.record(blobs)
+            if shard_checkpoint:
+                cursor.update(shard_checkpoint)
+        
         indexed_count = 0
-        batch_documents = []
+        unchanged_count = 0
+        pending_blobs = []
+        shard_checkpoint = {}
         
-        # Scan all blobs in the docs/ directory
-        blobs = self.bucket.list_blobs(prefix="docs/")
+        # Scan all blobs in the docs/ directory, fetching only names and generations
+        blobs = self._iter_blob_names(queue_size=batch_size * 4, start_offsets=start_offsets)
         
-        for blob in tqdm(blobs, desc="Scanning GCS files"):
-            # Skip directories/folders
-            if blob.name.endswith('/'):
-                continue
-                
-            doc_data = self._create_document_data_from_blob(blob)
-            if doc_data:
-                batch_documents.append(doc_data)
-                indexed_count += 1
+        batch_sizer = AdaptiveBatchSize(batch_size)
+        
+        try:
+            with BackgroundBatchUploader(
+                self.turbopuffer_client,
+                on_checkpoint=on_batch_indexed,
+                batch_sizer=batch_sizer
+            ) as uploader:
+                for shard, blob_name, generation in tqdm(blobs, desc="Scanning GCS files"):
+                    # Skip directories/folders
+                    if blob_name.endswith('/'):
+                        continue
+                    
+                    if shard is not None:
+                        shard_checkpoint[shard] = blob_name
+                    
+                    # Skip blobs already indexed at their current generation
+                    if incremental and state.get(blob_name) == generation:
+                        unchanged_count += 1
+                        continue
+                    
+                    pending_blobs.append((blob_name, generation))
+                    
+                    # Hand off batch to the uploader when full
+                    if len(pending_blobs) >= batch_sizer.size:
+                        indexed_count += self._submit_blob_batch(uploader, pending_blobs, shard_checkpoint)
+                        pending_blobs = []
+                        shard_checkpoint = {}
                 
-                # Process batch when full
-                if len(batch_documents) >= batch_size:
-                    self.turbopuffer_client.batch_index_documents(batch_documents)
-                    batch_documents = []
+                # Process remaining documents
+                if pending_blobs:
+                    indexed_count += self._submit_blob_batch(uploader, pending_blobs, shard_checkpoint)
+        finally:
+            state.close()
         
-        # Process remaining documents
-        if batch_documents:
-            self.turbopuffer_client.batch_index_documents(batch_documents)
+        # The whole bucket has been indexed; the next scan starts fresh
+        cursor.clear()
         
         return {
             "indexed_files": indexed_count,
+            "unchanged_files": unchanged_count,
             "source": "gcs_bucket_scan"
         }
     
-    def _create_document_data(
-        self, 
-        document: DocumentRecord, 
-        project: ProjectRecord,
-        project_path_map: Dict[int, str]
-    ) -> Optional[Dict[str, Any]]:
-        """Create document data for indexing from database records."""
+    def _submit_blob_batch(
+        self,
+        uploader: BackgroundBatchUploader,
+        blobs: List[Tuple[str, int]],
+        shard_checkpoint: Dict[str, str]
+    ) -> int:
+        """Build a batch from (name, generation) pairs and queue it, returning the number submitted.
         
-        if document.project_id not in project_path_map:
-            return None
-            
-        gcs_path = project_path_map[document.project_id]
-        return self._create_document_data_with_path(document, project, gcs_path)
+        Every listed blob is recorded once the batch is indexed, including
+        those too shallow to index, so later scans skip them as well.
+        """
+        
+        batch_columns = self._build_blob_batch([name for name, _ in blobs])
+        # Submitted even when empty so the blobs are recorded and the shards advance
+        uploader.submit(batch_columns, (shard_checkpoint, blobs))
+        return len(batch_columns)
+    
+    def _iter_blob_names(
+        self,
+        queue_size: int,
+        start_offsets: Optional[Dict[str, str]] = None
+    ) -> Iterator[Tuple[Optional[str], str, int]]:
+        """Yield (shard, name, generation) for all blobs under docs/, listing shards on a thread pool.
+        
+        Blobs found outside any shard while splitting the tree have shard None.
+        Shards with a start offset are listed from that name onwards.
+        """
+        
+        start_offsets = start_offsets or {}
+        loose_blobs, shards = self._split_scan_prefixes()
+        for blob_name, generation in loose_blobs:
+            yield None, blob_name, generation
+        
+        name_queue = queue.Queue(maxsize=queue_size)
+        stop = threading.Event()
+        
+        def put(item: Any) -> None:
+            # Give up once the consumer has gone away so workers never block forever
+            while not stop.is_set():
+                try:
+                    name_queue.put(item, timeout=0.5)
+                    return
+                except queue.Full:
+                    continue
+        
+        def list_shard(prefix: str) -> None:
+            try:
+                blobs = self.gcs_client.list_blobs(
+                    self.bucket,
+                    prefix=prefix,
+                    start_offset=start_offsets.get(prefix),
+                    fields=LIST_FIELDS,
+                    page_size=LIST_PAGE_SIZE
+                )
+                for blob in blobs:
+                    if stop.is_set():
+                        return
+                    put((prefix, blob.name, blob.generation))
+            finally:
+                put(_SHARD_DONE)
+        
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+            futures = [executor.submit(list_shard, prefix) for prefix in shards]
+            remaining = len(futures)
+            try:
+                while remaining:
+                    item = name_queue.get()
+                    if item is _SHARD_DONE:
+                        remaining -= 1
+                    else:
+                        yield item
+            finally:
+                stop.set()
+        
+        # Surface any listing errors raised inside the workers
+        for future in futures:
+            future.result()
+    
+    def _split_scan_prefixes(self) -> Tuple[List[Tuple[str, int]], List[str]]:
+        """Split docs/ into loose top-level (name, generation) pairs and second-level shard prefixes."""
+        
+        loose_blobs, top_prefixes = self._list_directory(SCAN_ROOT)
+        
+        shards = []
+        for prefix in top_prefixes:
+            sub_blobs, sub_prefixes = self._list_directory(prefix)
+            loose_blobs.extend(sub_blobs)
+            shards.extend(sub_prefixes)
+        
+        return loose_blobs, shards
+    
+    def _list_directory(self, prefix: str) -> Tuple[List[Tuple[str, int]], List[str]]:
+        """List the (name, generation) pairs and sub-prefixes directly under a prefix."""
+        
+        iterator = self.gcs_client.list_blobs(
+            self.bucket,
+            prefix=prefix,
+            delimiter="/",
+            fields="items(name,generation),prefixes,nextPageToken",
+            page_size=LIST_PAGE_SIZE
+        )
+        blobs = [(blob.name, blob.generation) for blob in iterator]
+        return blobs, sorted(iterator.prefixes)
+    
+    def _build_blob_batch(self, blob_names: List[str]) -> DocumentColumns:
+        """Hash and build index columns for a batch of blob names."""
+        
+        doc_ids = stable_blob_ids(blob_names)
+        
+        batch_columns = DocumentColumns()
+        create = self._create_document_data_from_blob
+        for blob_name, doc_id in zip(blob_names, doc_ids):
+            create(batch_columns, blob_name, doc_id)
+        
+        return batch_columns
     
     def _create_document_data_with_path(
         self, 
@@ -150,9 +584,9 @@ class DocumentIndexer:
         if not document.filename or not document.filename.strip():
             return None
         
-        full_gcs_path = f"{gcs_path}/{document.filename}"
-        gcs_url = f"gs://{self.config.gcs.bucket_name}/{full_gcs_path}"
-        public_url = f"https://storage.googleapis.com/{self.config.gcs.bucket_name}/{full_gcs_path}"
+        full_gcs_path = gcs_path + "/" + document.filename
+        gcs_url = self._gs_prefix + full_gcs_path
+        public_url = self._public_prefix + full_gcs_path
         
         return {
             'id': f"doc_{document.id}",
@@ -165,41 +599,53 @@ class DocumentIndexer:
             'public_url': public_url
         }
     
-    def _create_document_data_from_blob(self, blob: storage.Blob) -> Optional[Dict[str, Any]]:
-        """Create document data for indexing from GCS blob."""
+    def _create_document_data_from_blob(
+        self, 
+        columns: DocumentColumns,
+        blob_name: str,
+        doc_id: str
+    ) -> bool:
+        """Append document data for indexing from a GCS blob name."""
         
-        # Extract path components
-        path_parts = blob.name.split('/')
-        if len(path_parts) < 3:  # Need at least docs/Bennett Legal/project/file
-            return None
-            
-        filename = path_parts[-1]
+        filename = blob_name.rpartition('/')[2]
         if not filename:
-            return None
-            
-        # Try to extract project name from path
-        project_name = "Unknown"
-        if len(path_parts) >= 4 and path_parts[1] == "Bennett Legal":
-            project_name = path_parts[2]
+            return False
         
-        gcs_url = f"gs://{self.config.gcs.bucket_name}/{blob.name}"
-        public_url = f"https://storage.googleapis.com/{self.config.gcs.bucket_name}/{blob.name}"
+        # Try to extract project name from path without splitting it
+        project_name = "Unknown"
+        known_prefix = self._known_prefix
+        if blob_name.startswith(known_prefix):
+            slash = blob_name.find('/', len(known_prefix))
+            if slash != -1:
+                project_name = blob_name[len(known_prefix):slash]
+        elif blob_name.count('/') < 2:  # Need at least docs/Bennett Legal/project/file
+            return False
         
-        return {
-            'id': f"gcs_{hash(blob.name) % (10**10)}",  # Generate stable ID from path
-            'filename': filename,
-            'gcs_path': blob.name,
-            'project_name': project_name,
-            'project_id': 0,  # Unknown project ID from GCS scan
-            'document_id': 0,  # Unknown document ID from GCS scan
-            'gcs_url': gcs_url,
-            'public_url': public_url
-        }
+        columns.append(
+            doc_id,
+            filename,
+            blob_name,
+            project_name,
+            0,  # Unknown project ID from GCS scan
+            0,  # Unknown document ID from GCS scan
+            self._gs_prefix + blob_name,
+            self._public_prefix + blob_name
+        )
+        return True
     
     def remove_document_from_index(self, document_id: int) -> bool:
         """Remove a document from the index."""
+        return self.remove_documents_from_index([document_id])[document_id]
+    
+    def remove_documents_from_index(self, document_ids: List[int]) -> Dict[int, bool]:
+        """Remove documents from the index in one request, returning success per document ID.
+        
+        Transient failures are retried by the Turbopuffer client; only API
+        errors that persist are reported as failures, anything else is raised.
+        """
         try:
-            self.turbopuffer_client.delete_document(f"doc_{document_id}")
-            return True
-        except Exception:
-            return False
\ No newline at end of file
+            self.turbopuffer_client.delete_documents([f"doc_{i}" for i in document_ids])
+        except turbopuffer.APIError as e:
+            print(f"Failed to remove {len(document_ids)} document(s) from index: {e}")
+            return {document_id: False for document_id in document_ids}
+        return {document_id: True for document_id in document_ids}
\ No newline at end of file
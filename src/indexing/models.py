@@ -1,7 +1,7 @@
 """API models for document indexing service."""
 
 from typing import List, Dict, Any, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SearchRequest(BaseModel):
@@ -14,7 +14,13 @@ class SearchRequest(BaseModel):
 
 
 class DocumentResult(BaseModel):
-    """Document search result."""
+    """Document search result.
+    
+    Built with model_construct from already-shaped Turbopuffer rows, so
+    validation is skipped on the search hot path.
+    """
+    model_config = ConfigDict(from_attributes=True, validate_assignment=False)
+    
     id: str = Field(description="Document ID")
     filename: str = Field(description="Document filename")
     gcs_path: str = Field(description="Full GCS path")
@@ -40,7 +46,9 @@ class IndexStats(BaseModel):
 
 class IndexRequest(BaseModel):
     """Request model for indexing documents."""
-    batch_size: int = Field(100, ge=1, le=1000, description="Batch size for indexing")
+    batch_size: int = Field(1000, ge=1, le=10000, description="Initial batch size for indexing")
+    resume: bool = Field(True, description="Resume from the cursor left by an interrupted scan")
+    incremental: bool = Field(True, description="Skip blobs already indexed at their current generation")
 
 
 class IndexResponse(BaseModel):
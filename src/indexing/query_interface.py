@@ -1,16 +1,32 @@
 """Query interface for searching indexed documents."""
 
-from typing import List, Dict, Any, Optional
-from .turbopuffer_client import TurbopufferClient
+import asyncio
+import io
+import time
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+from .turbopuffer_client import SearchHit, TurbopufferClient
 from ..migration.models.config import IndexingConfig
 
 
+# Reachability is polled by health checks and served from memory between refreshes
+PING_TTL_SECONDS = 10.0
+
+# Search criteria from most to least selective: ID equality, then the token
+# filters (filenames are far more specific than project names), then BM25
+_SEARCH_PRECEDENCE = ('project_id', 'filename', 'project_name', 'query')
+
+# A free-text query that looks like a project ID, a path or a filename is first
+# tried as an indexed equality lookup before falling back to BM25
+_FILENAME_SUFFIXES = ('.pdf', '.doc', '.docx', '.tif', '.tiff', '.jpg', '.jpeg')
+
+
 class DocumentQueryInterface:
     """High-level interface for searching documents."""
     
-    def __init__(self, config: IndexingConfig):
+    def __init__(self, config: IndexingConfig, client: Optional[TurbopufferClient] = None):
         self.config = config
-        self.client = TurbopufferClient(config.turbopuffer)
+        self.client = client or TurbopufferClient(config.turbopuffer)
+        self._ping_cache: Optional[Tuple[float, bool]] = None
     
     def search_documents(
         self,
@@ -19,68 +35,145 @@ class DocumentQueryInterface:
         project_id: Optional[int] = None,
         filename: str = "",
         limit: int = 10
-    ) -> List[Dict[str, Any]]:
+    ) -> List[SearchHit]:
         """Search documents with multiple filter options."""
-        
-        # If specific filters are provided, use them
-        if project_id is not None:
-            return self.client.search_by_project_id(project_id, limit)
-        elif project_name:
-            return self.client.search_by_project(project_name, limit)
-        elif filename:
-            return self.client.search_by_filename(filename, limit)
-        elif query:
-            return self.client.full_text_search(query, limit)
-        else:
-            # Return recent documents if no filters
-            return self.client.namespace.query(
-                top_k=limit,
-                include_attributes=['filename', 'gcs_path', 'project_name', 'project_id', 'gcs_url']
-            )
+        criteria = self._search_criteria(query, project_name, project_id, filename)
+        if 'query' in criteria:
+            hits = self._exact_search(criteria['query'], limit)
+            if hits:
+                return hits
+        return self.client.find(limit=limit, **criteria)
     
-    def get_project_documents(self, project_id: int) -> List[Dict[str, Any]]:
+    async def async_search_documents(
+        self,
+        query: str = "",
+        project_name: str = "",
+        project_id: Optional[int] = None,
+        filename: str = "",
+        limit: int = 10
+    ) -> List[SearchHit]:
+        """Search documents like search_documents without blocking the event loop."""
+        criteria = self._search_criteria(query, project_name, project_id, filename)
+        if 'query' in criteria:
+            hits = await self._async_exact_search(criteria['query'], limit)
+            if hits:
+                return hits
+        return await self.client.async_find(limit=limit, **criteria)
+    
+    async def multi_async_search(self, searches: List[Dict[str, Any]]) -> List[List[SearchHit]]:
+        """Run many async_search_documents calls concurrently, returning results in order."""
+        return list(await asyncio.gather(
+            *(self.async_search_documents(**search) for search in searches)
+        ))
+    
+    def _exact_search(self, query: str, limit: int) -> List[SearchHit]:
+        """Look up a query that is a project ID or an exact filename or path."""
+        query = query.strip()
+        if query.isascii() and query.isdecimal():
+            return self.client.search_by_project_id(int(query), limit)
+        if '/' in query or query.lower().endswith(_FILENAME_SUFFIXES):
+            return self.client.search_by_filename_exact(query, limit)
+        return []
+    
+    async def _async_exact_search(self, query: str, limit: int) -> List[SearchHit]:
+        """Look up an exact project ID, filename or path query asynchronously."""
+        query = query.strip()
+        if query.isascii() and query.isdecimal():
+            return await self.client.async_search_by_project_id(int(query), limit)
+        if '/' in query or query.lower().endswith(_FILENAME_SUFFIXES):
+            return await self.client.async_search_by_filename_exact(query, limit)
+        return []
+    
+    def _search_criteria(
+        self,
+        query: str,
+        project_name: str,
+        project_id: Optional[int],
+        filename: str
+    ) -> Dict[str, Any]:
+        """Pick the criterion for a search; the most selective filter given wins."""
+        criteria = self._advanced_criteria({
+            'project_id': project_id,
+            'project_name': project_name,
+            'filename': filename,
+            'query': query
+        })
+        # No criteria lists recent documents
+        key = next(iter(criteria), None)
+        return {key: criteria[key]} if key else {}
+    
+    def get_project_documents(self, project_id: int) -> List[SearchHit]:
         """Get all documents for a specific project."""
-        return self.client.search_by_project_id(project_id, limit=1000)
+        return self.client.get_project_documents(project_id)
+    
+    def iter_project_documents(self, project_id: int) -> Iterator[SearchHit]:
+        """Yield all documents for a specific project without building a list."""
+        return self.client.iter_search_by_project_id(project_id, limit=1000)
     
-    def get_document_by_filename(self, filename: str) -> List[Dict[str, Any]]:
+    def get_document_by_filename(self, filename: str) -> List[SearchHit]:
         """Find documents by exact or partial filename match."""
         return self.client.search_by_filename(filename)
     
-    def advanced_search(self, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Perform advanced search with multiple criteria."""
-        # This would allow combining multiple filters
-        # For now, implement basic logic
-        
-        limit = filters.get('limit', 10)
-        
-        if 'project_id' in filters:
-            return self.client.search_by_project_id(filters['project_id'], limit)
-        elif 'project_name' in filters:
-            return self.client.search_by_project(filters['project_name'], limit)
-        elif 'filename' in filters:
-            return self.client.search_by_filename(filters['filename'], limit)
-        elif 'query' in filters:
-            return self.client.full_text_search(filters['query'], limit)
-        
-        return []
+    def advanced_search(self, filters: Dict[str, Any]) -> List[SearchHit]:
+        """Perform advanced search combining all given criteria in one request."""
+        criteria = self._advanced_criteria(filters)
+        if not criteria:
+            return []
+        return self.client.find(limit=filters.get('limit', 10), **criteria)
     
-    def get_index_statistics(self) -> Dict[str, Any]:
+    def multi_search(self, filter_sets: List[Dict[str, Any]]) -> List[List[SearchHit]]:
+        """Run several advanced searches in one request, returning results in order."""
+        queries = [self._build_query(filters) for filters in filter_sets]
+        # Criteria-less searches match nothing and are not sent
+        sent = [params for params in queries if params is not None]
+        results = iter(self.client.multi_search(sent))
+        return [next(results) if params is not None else [] for params in queries]
+    
+    def _advanced_criteria(self, filters: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract the search criteria set in a filter dict, most selective first."""
+        return {
+            key: filters[key]
+            for key in _SEARCH_PRECEDENCE
+            if filters.get(key) not in (None, '')
+        }
+    
+    def _build_query(self, filters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Build query parameters from an advanced search filter dict."""
+        return self.client.build_search_query(
+            limit=filters.get('limit', 10),
+            **self._advanced_criteria(filters)
+        )
+    
+    def get_index_statistics(self, force_refresh: bool = False) -> Dict[str, Any]:
         """Get statistics about the document index."""
-        return self.client.get_index_stats()
+        return self.client.get_index_stats(force_refresh=force_refresh)
+    
+    def is_reachable(self) -> bool:
+        """Check Turbopuffer connectivity, cached for PING_TTL_SECONDS."""
+        now = time.monotonic()
+        if self._ping_cache and now - self._ping_cache[0] < PING_TTL_SECONDS:
+            return self._ping_cache[1]
+        
+        reachable = self.client.ping()
+        self._ping_cache = (now, reachable)
+        return reachable
     
-    def format_search_results(self, results: List[Dict[str, Any]]) -> str:
+    def format_search_results(self, results: Iterable[SearchHit]) -> str:
         """Format search results for display."""
-        if not results:
-            return "No documents found."
+        buf = io.StringIO()
+        count = 0
         
-        formatted = []
-        formatted.append(f"Found {len(results)} document(s):\n")
+        # One template per hit; the header needs the count, so it is prepended at the end
+        for count, result in enumerate(results, 1):
+            buf.write(
+                f"{count}. {result.filename or 'Unknown'}\n"
+                f"   Project: {result.project_name or 'Unknown'}\n"
+                f"   Path: {result.gcs_path or 'Unknown'}\n"
+                f"   URL: {result.gcs_url or 'Unknown'}\n\n"
+            )
         
-        for i, result in enumerate(results, 1):
-            formatted.append(f"{i}. {result.get('filename', 'Unknown')}")
-            formatted.append(f"   Project: {result.get('project_name', 'Unknown')}")
-            formatted.append(f"   Path: {result.get('gcs_path', 'Unknown')}")
-            formatted.append(f"   URL: {result.get('gcs_url', 'Unknown')}")
-            formatted.append("")
+        if not count:
+            return "No documents found."
         
-        return "\n".join(formatted)
\ No newline at end of file
+        # Drop the final blank line to match the single trailing newline of earlier output
+        return f"Found {count} document(s):\n\n{buf.getvalue()[:-1]}"
\ No newline at end of file
@@ -1,21 +1,334 @@
 """Turbopuffer client for document indexing."""
 
+import asyncio
+import fnmatch
+import functools
+import inspect
+import json
 import os
-from typing import List, Dict, Optional, Any
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Any, Callable, Iterable, Iterator, Tuple, Union
 import turbopuffer
 from ..migration.models.config import TurbopufferConfig
 
 
+# Attributes returned for search hits
+SEARCH_ATTRIBUTES = ['filename', 'gcs_path', 'project_name', 'project_id', 'gcs_url']
+
+# Placeholder embedding for metadata-only documents; shared by every row, never mutated
+VECTOR_DIMENSIONS = 768
+ZERO_VECTOR = [0.0] * VECTOR_DIMENSIONS
+
+# Identical searches are answered from memory for a short while
+SEARCH_CACHE_SIZE = 512
+SEARCH_CACHE_TTL_SECONDS = 60.0
+
+# A project's complete listing, once fetched, answers narrower searches within
+# that project from memory; only listings shorter than the limit are complete
+PROJECT_COVERAGE_LIMIT = 1000
+PROJECT_COVERAGE_SIZE = 64
+
+# Index statistics barely change and are polled by dashboards and health checks
+STATS_TTL_SECONDS = 30.0
+
+# Filenames and project names are also indexed as lowercase tokens so searches
+# can use an indexed Contains lookup instead of an unindexed '*x*' glob scan
+_TOKEN_SPLIT_RE = re.compile(r'[\s./_\-]+')
+
+# Glob metacharacters in user input are matched literally by bracketing them
+_GLOB_SPECIAL_RE = re.compile(r'([*?\[])')
+
+# Number attributes in the schema; callers may pass them as str or Decimal, which
+# would be rejected or encoded through a slow fallback, so rows are normalized to int
+_NUMERIC_ATTRIBUTES = ('project_id', 'document_id')
+
+# Large batches are written in bounded chunks; the async path overlaps a few at a time
+WRITE_CHUNK_ROWS = 1000
+WRITE_CONCURRENCY = 4
+
+_MISS = object()
+
+
+@functools.lru_cache(maxsize=8)
+def _get_tpuf(api_key: str, region: str, max_retries: int) -> turbopuffer.Turbopuffer:
+    """Return a process-wide SDK client per credentials so its connection pool is reused."""
+    # The SDK retries connection errors, timeouts, 429s and 5xx with exponential backoff
+    return turbopuffer.Turbopuffer(
+        api_key=api_key,
+        region=region,
+        max_retries=max_retries
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _get_namespace(api_key: str, region: str, max_retries: int, name: str) -> Any:
+    """Return a shared namespace handle on the shared SDK client."""
+    return _get_tpuf(api_key, region, max_retries).namespace(name)
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into unique lowercase tokens on whitespace, dots, slashes, underscores and dashes."""
+    return list(dict.fromkeys(token for token in _TOKEN_SPLIT_RE.split(text.lower()) if token))
+
+
+def _row(document: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a document into a write row with its name tokens.
+    
+    The caller's document is not mutated; dict.copy is a single C-level copy.
+    Numeric IDs must be integral; a value int() would truncate raises ValueError.
+    """
+    row = document.copy()
+    row['filename_tokens'] = tokenize(document.get('filename') or '')
+    row['project_name_tokens'] = tokenize(document.get('project_name') or '')
+    for key in _NUMERIC_ATTRIBUTES:
+        value = row.get(key)
+        if value is not None and type(value) is not int:
+            integral = int(value)
+            if not isinstance(value, str) and integral != value:
+                raise ValueError(f"{key} must be an integer, got {value!r}")
+            row[key] = integral
+    return row
+
+
+def _attach_vectors(payload: Dict[str, Any]) -> None:
+    """Add the shared placeholder vector to every document in a write payload."""
+    if 'upsert_columns' in payload:
+        columns = payload['upsert_columns']
+        columns['vector'] = [ZERO_VECTOR] * len(columns['id'])
+    else:
+        for row in payload['upsert_rows']:
+            row['vector'] = ZERO_VECTOR
+
+
+def _glob_escape(text: str) -> str:
+    """Escape glob metacharacters so text matches literally."""
+    return _GLOB_SPECIAL_RE.sub(r'[\1]', text)
+
+
+@functools.lru_cache(maxsize=1024)
+def _text_clauses(attribute: str, value: str, substring: bool) -> Tuple[Tuple[str, str, Any], ...]:
+    """Build filter clauses matching value against a tokenized text attribute.
+    
+    A value containing '%' is used as a wildcard pattern. Otherwise each token
+    must be present, unless substring matching is requested or the value has
+    no tokens, in which case it is matched anywhere. Wildcard and substring
+    matches are case-insensitive (IGlob), like the token lookups.
+    """
+    if '%' in value:
+        return ((attribute, "IGlob", '*'.join(_glob_escape(part) for part in value.split('%'))),)
+    tokens = () if substring else tokenize(value)
+    if not tokens:
+        return ((attribute, "IGlob", f"*{_glob_escape(value)}*"),)
+    return tuple((f"{attribute}_tokens", "Contains", token) for token in tokens)
+
+
+@dataclass(slots=True, frozen=True)
+class SearchHit:
+    """A document returned by a search."""
+    id: str
+    filename: str = ''
+    gcs_path: str = ''
+    project_name: str = ''
+    project_id: int = 0
+    gcs_url: str = ''
+    public_url: str = ''
+
+
+def _hit_matches(hit: SearchHit, clauses: Iterable[Tuple[str, str, Any]]) -> bool:
+    """Evaluate _text_clauses filters against a hit in-process, as the server would."""
+    for attribute, operator, value in clauses:
+        if operator == "Contains":
+            if value not in tokenize(getattr(hit, attribute.removesuffix('_tokens'))):
+                return False
+        elif not fnmatch.fnmatchcase(getattr(hit, attribute).lower(), value.lower()):
+            return False
+    return True
+
+
+def _hits(response: Any) -> Iterator[SearchHit]:
+    """Lazily convert the rows of a query response to SearchHits, filling missing attributes."""
+    for row in response.rows or ():
+        yield SearchHit(
+            str(row.id),
+            getattr(row, 'filename', None) or '',
+            getattr(row, 'gcs_path', None) or '',
+            getattr(row, 'project_name', None) or '',
+            getattr(row, 'project_id', None) or 0,
+            getattr(row, 'gcs_url', None) or '',
+            getattr(row, 'public_url', None) or ''
+        )
+
+
+def ttl_lru(maxsize: int = SEARCH_CACHE_SIZE, ttl: float = SEARCH_CACHE_TTL_SECONDS) -> Callable:
+    """Cache a TurbopufferClient search method in the client's bounded LRU for ttl seconds.
+    
+    Keys are the method name (without any async_ prefix, so sync and async
+    variants share entries) plus its arguments; dict arguments are keyed by
+    their JSON form.
+    """
+    
+    def decorator(fn: Callable) -> Callable:
+        name = fn.__name__.removeprefix('async_')
+        
+        def make_key(args: Tuple, kwargs: Dict[str, Any]) -> Tuple:
+            return (
+                name,
+                *(json.dumps(arg, sort_keys=True) if isinstance(arg, dict) else arg for arg in args),
+                *sorted(kwargs.items())
+            )
+        
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(self, *args, **kwargs):
+                key = make_key(args, kwargs)
+                cached = self._cache_get(key)
+                if cached is not _MISS:
+                    return cached
+                value = await fn(self, *args, **kwargs)
+                self._cache_put(key, value, maxsize, ttl)
+                return list(value)
+            return async_wrapper
+        
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            key = make_key(args, kwargs)
+            cached = self._cache_get(key)
+            if cached is not _MISS:
+                return cached
+            value = fn(self, *args, **kwargs)
+            self._cache_put(key, value, maxsize, ttl)
+            return list(value)
+        return wrapper
+    
+    return decorator
+
+
+class DocumentColumns:
+    """Column-oriented accumulator for a batch of documents to index."""
+    
+    __slots__ = (
+        'ids', 'filenames', 'gcs_paths', 'project_names',
+        'project_ids', 'document_ids', 'gcs_urls', 'public_urls'
+    )
+    
+    def __init__(self):
+        self.ids: List[str] = []
+        self.filenames: List[str] = []
+        self.gcs_paths: List[str] = []
+        self.project_names: List[str] = []
+        self.project_ids: List[int] = []
+        self.document_ids: List[int] = []
+        self.gcs_urls: List[str] = []
+        self.public_urls: List[str] = []
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def append(
+        self,
+        id: str,
+        filename: str,
+        gcs_path: str,
+        project_name: str,
+        project_id: int,
+        document_id: int,
+        gcs_url: str,
+        public_url: str
+    ) -> None:
+        """Append one document's attributes to the columns."""
+        self.ids.append(id)
+        self.filenames.append(filename)
+        self.gcs_paths.append(gcs_path)
+        self.project_names.append(project_name)
+        self.project_ids.append(project_id)
+        self.document_ids.append(document_id)
+        self.gcs_urls.append(gcs_url)
+        self.public_urls.append(public_url)
+    
+    def to_upsert_columns(self) -> Dict[str, List[Any]]:
+        """Return the columns keyed by Turbopuffer attribute name."""
+        return {
+            'id': self.ids,
+            'filename': self.filenames,
+            'gcs_path': self.gcs_paths,
+            'project_name': self.project_names,
+            'project_id': self.project_ids,
+            'document_id': self.document_ids,
+            'gcs_url': self.gcs_urls,
+            'public_url': self.public_urls
+        }
+
+
 class TurbopufferClient:
     """Client for interacting with Turbopuffer search engine."""
     
+    # Built once and passed by reference to every write. It stays a plain dict
+    # because the SDK's JSON encoder rejects MappingProxyType; treat it as read-only.
+    DOCUMENT_SCHEMA = {
+        'filename': {'type': 'string', 'full_text_search': True},
+        'gcs_path': {'type': 'string', 'full_text_search': True}, 
+        'project_name': {'type': 'string', 'full_text_search': True},
+        'project_id': {'type': 'number'},
+        'document_id': {'type': 'number'},
+        'gcs_url': {'type': 'string'},
+        'public_url': {'type': 'string'},
+        'filename_tokens': {'type': '[]string'},
+        'project_name_tokens': {'type': '[]string'}
+    }
+    
     def __init__(self, config: TurbopufferConfig):
         self.config = config
-        self.client = turbopuffer.Turbopuffer(
-            api_key=config.api_key,
-            region=config.region
-        )
-        self.namespace = self.client.namespace("document-index")
+        # Every instance with the same credentials shares one SDK client and namespace
+        self.client = _get_tpuf(config.api_key, config.region, config.max_retries)
+        self.namespace = _get_namespace(config.api_key, config.region, config.max_retries, "document-index")
+        # Project ID lookups run in tight enrichment loops; their constant arguments are bound once
+        self._query_with_attributes = functools.partial(self.namespace.query, include_attributes=SEARCH_ATTRIBUTES)
+        # Metadata-only writes skip the placeholder vector until the server rejects one
+        self._send_vectors = not config.metadata_only
+        # Built on first async search so sync-only callers never open it
+        self._async_client: Optional[turbopuffer.AsyncTurbopuffer] = None
+        self._async_namespace = None
+        # Search results keyed by ttl_lru; writes may come from an uploader thread
+        self._search_cache: "OrderedDict[Tuple, Tuple[float, List[SearchHit]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._stats_cache: Tuple[float, Optional[Dict[str, Any]]] = (0.0, None)
+        # Complete project listings by project ID, cleared with the search cache
+        self._coverage: "OrderedDict[int, Tuple[float, List[SearchHit]]]" = OrderedDict()
+    
+    def _cache_get(self, key: Tuple) -> Any:
+        """Return a copy of a live cached result, or _MISS."""
+        with self._cache_lock:
+            entry = self._search_cache.get(key)
+            if entry is None:
+                return _MISS
+            expiry, value = entry
+            if time.monotonic() >= expiry:
+                del self._search_cache[key]
+                return _MISS
+            self._search_cache.move_to_end(key)
+            return list(value)
+    
+    def _cache_put(self, key: Tuple, value: List[SearchHit], maxsize: int, ttl: float) -> None:
+        """Store a result, evicting the least recently used entries beyond maxsize."""
+        with self._cache_lock:
+            self._search_cache[key] = (time.monotonic() + ttl, value)
+            self._search_cache.move_to_end(key)
+            while len(self._search_cache) > maxsize:
+                self._search_cache.popitem(last=False)
+    
+    def invalidate_cache(self, prefix: Optional[str] = None) -> None:
+        """Drop cached search results, or only those of methods whose name starts with prefix."""
+        with self._cache_lock:
+            if prefix is None:
+                self._search_cache.clear()
+                self._coverage.clear()
+                return
+            for key in [key for key in self._search_cache if key[0].startswith(prefix)]:
+                del self._search_cache[key]
     
     def create_index(self) -> None:
         """Create the document index namespace if it doesn't exist."""
@@ -24,107 +337,338 @@ class TurbopufferClient:
     
     def index_document(self, document_data: Dict[str, Any]) -> None:
         """Index a single document."""
-        # Create a dummy vector since we're only doing metadata search for now
-        dummy_vector = [0.0] * 768  # Standard embedding dimension
-        
-        row = {
-            'id': document_data['id'],
-            'vector': dummy_vector,
-            **document_data
-        }
-        
-        schema = {
-            'filename': {'type': 'string', 'full_text_search': True},
-            'gcs_path': {'type': 'string', 'full_text_search': True}, 
-            'project_name': {'type': 'string', 'full_text_search': True},
-            'project_id': {'type': 'number'},
-            'document_id': {'type': 'number'},
-            'gcs_url': {'type': 'string'},
-            'public_url': {'type': 'string'}
-        }
-        
-        self.namespace.write(
-            upsert_rows=[row],
-            schema=schema
-        )
+        self._write_documents(self._write_payloads([document_data]))
+    
+    def batch_index_documents(self, documents: Union[List[Dict[str, Any]], DocumentColumns]) -> None:
+        """Index multiple documents, writing at most WRITE_CHUNK_ROWS per request."""
+        if not documents:
+            return
+        self._write_documents(self._write_payloads(documents))
     
-    def batch_index_documents(self, documents: List[Dict[str, Any]]) -> None:
-        """Index multiple documents in a single batch."""
+    async def batch_index_documents_async(
+        self,
+        documents: Union[List[Dict[str, Any]], DocumentColumns],
+        concurrency: int = WRITE_CONCURRENCY
+    ) -> None:
+        """Index multiple documents with up to concurrency chunk writes in flight."""
         if not documents:
             return
-            
-        dummy_vector = [0.0] * 768
         
-        rows = []
-        for doc in documents:
-            row = {
-                'id': doc['id'],
-                'vector': dummy_vector,
-                **doc
-            }
-            rows.append(row)
+        namespace = self._get_async_namespace()
+        semaphore = asyncio.Semaphore(concurrency)
         
-        schema = {
-            'filename': {'type': 'string', 'full_text_search': True},
-            'gcs_path': {'type': 'string', 'full_text_search': True}, 
-            'project_name': {'type': 'string', 'full_text_search': True},
-            'project_id': {'type': 'number'},
-            'document_id': {'type': 'number'},
-            'gcs_url': {'type': 'string'},
-            'public_url': {'type': 'string'}
-        }
+        async def write(payload: Dict[str, Any]) -> None:
+            async with semaphore:
+                if not self._send_vectors:
+                    try:
+                        await namespace.write(schema=self.DOCUMENT_SCHEMA, **payload)
+                        return
+                    except (turbopuffer.BadRequestError, turbopuffer.UnprocessableEntityError) as e:
+                        self._reject_metadata_only(e)
+                _attach_vectors(payload)
+                await namespace.write(schema=self.DOCUMENT_SCHEMA, **payload)
         
-        self.namespace.write(
-            upsert_rows=rows,
-            schema=schema
-        )
+        try:
+            await asyncio.gather(*(write(payload) for payload in self._write_payloads(documents)))
+        finally:
+            self.invalidate_cache()
+    
+    def _write_payloads(
+        self,
+        documents: Union[List[Dict[str, Any]], DocumentColumns]
+    ) -> List[Dict[str, Any]]:
+        """Split documents into write payloads of at most WRITE_CHUNK_ROWS, adding name tokens."""
+        payloads = []
+        if isinstance(documents, DocumentColumns):
+            columns = documents.to_upsert_columns()
+            for start in range(0, len(documents), WRITE_CHUNK_ROWS):
+                end = start + WRITE_CHUNK_ROWS
+                chunk = {key: values[start:end] for key, values in columns.items()}
+                chunk['filename_tokens'] = [tokenize(name) for name in chunk['filename']]
+                chunk['project_name_tokens'] = [tokenize(name) for name in chunk['project_name']]
+                payloads.append({'upsert_columns': chunk})
+        else:
+            for start in range(0, len(documents), WRITE_CHUNK_ROWS):
+                chunk = documents[start:start + WRITE_CHUNK_ROWS]
+                payloads.append({'upsert_rows': [_row(doc) for doc in chunk]})
+        return payloads
+    
+    def _write_documents(self, payloads: List[Dict[str, Any]]) -> None:
+        """Write payloads in order, falling back to placeholder vectors if metadata-only is rejected."""
+        try:
+            for payload in payloads:
+                if not self._send_vectors:
+                    try:
+                        self.namespace.write(schema=self.DOCUMENT_SCHEMA, **payload)
+                        continue
+                    except (turbopuffer.BadRequestError, turbopuffer.UnprocessableEntityError) as e:
+                        self._reject_metadata_only(e)
+                _attach_vectors(payload)
+                self.namespace.write(schema=self.DOCUMENT_SCHEMA, **payload)
+        finally:
+            # Drop stale cached searches even when a later chunk fails
+            self.invalidate_cache()
+    
+    def _reject_metadata_only(self, error: Exception) -> None:
+        """Switch to sending placeholder vectors after the server rejects a metadata-only write."""
+        if not self._send_vectors:
+            print(f"Metadata-only write rejected, sending placeholder vectors: {error}")
+            self._send_vectors = True
     
-    def search_by_filename(self, filename: str, limit: int = 10) -> List[Dict[str, Any]]:
+    def search_by_filename(self, filename: str, limit: int = 10) -> List[SearchHit]:
         """Search documents by filename."""
-        results = self.namespace.query(
-            top_k=limit,
-            filters=("filename", "Like", f"%{filename}%"),
-            include_attributes=['filename', 'gcs_path', 'project_name', 'project_id', 'gcs_url']
-        )
-        return [dict(result) for result in results]
+        return self.find(filename=filename, limit=limit)
     
-    def search_by_project(self, project_name: str, limit: int = 10) -> List[Dict[str, Any]]:
+    def search_by_project(self, project_name: str, limit: int = 10) -> List[SearchHit]:
         """Search documents by project name."""
-        results = self.namespace.query(
-            top_k=limit,
-            filters=("project_name", "Like", f"%{project_name}%"),
-            include_attributes=['filename', 'gcs_path', 'project_name', 'project_id', 'gcs_url']
-        )
-        return [dict(result) for result in results]
+        return self.find(project_name=project_name, limit=limit)
     
-    def search_by_project_id(self, project_id: int, limit: int = 10) -> List[Dict[str, Any]]:
+    @ttl_lru()
+    def search_by_project_id(self, project_id: int, limit: int = 10) -> List[SearchHit]:
         """Search documents by project ID."""
-        results = self.namespace.query(
-            top_k=limit,
-            filters=("project_id", "Eq", project_id),
-            include_attributes=['filename', 'gcs_path', 'project_name', 'project_id', 'gcs_url']
-        )
-        return [dict(result) for result in results]
+        return list(_hits(self._query_with_attributes(top_k=limit, filters=("project_id", "Eq", project_id))))
+    
+    def get_project_documents(self, project_id: int) -> List[SearchHit]:
+        """List up to PROJECT_COVERAGE_LIMIT documents of a project, remembering complete listings."""
+        hits = self.search_by_project_id(project_id, limit=PROJECT_COVERAGE_LIMIT)
+        if len(hits) < PROJECT_COVERAGE_LIMIT:
+            with self._cache_lock:
+                self._coverage[project_id] = (time.monotonic() + SEARCH_CACHE_TTL_SECONDS, hits)
+                self._coverage.move_to_end(project_id)
+                while len(self._coverage) > PROJECT_COVERAGE_SIZE:
+                    self._coverage.popitem(last=False)
+        return hits
+    
+    def search_within_project(
+        self,
+        project_id: int,
+        predicate: Callable[[SearchHit], bool]
+    ) -> Optional[List[SearchHit]]:
+        """Filter a project's cached complete listing in-process, or return None if there is none."""
+        with self._cache_lock:
+            entry = self._coverage.get(project_id)
+            if entry is None:
+                return None
+            expiry, hits = entry
+            if time.monotonic() >= expiry:
+                del self._coverage[project_id]
+                return None
+        return [hit for hit in hits if predicate(hit)]
+    
+    def _find_covered(self, limit: int, criteria: Dict[str, Any]) -> Optional[List[SearchHit]]:
+        """Answer a project-scoped find from the project's cached listing, or None.
+        
+        Ranked full-text queries always go to the server.
+        """
+        project_id = criteria.get('project_id')
+        if project_id is None or criteria.get('query'):
+            return None
+        for substring in (False, True):
+            clauses = [
+                clause
+                for attribute in ('filename', 'project_name') if criteria.get(attribute)
+                for clause in _text_clauses(attribute, criteria[attribute], substring)
+            ]
+            hits = self.search_within_project(project_id, lambda hit: _hit_matches(hit, clauses))
+            if hits is None:
+                return None
+            if hits:
+                return hits[:limit]
+        return []
+    
+    def search_by_filename_exact(self, filename: str, limit: int = 10) -> List[SearchHit]:
+        """Find documents whose filename, or GCS path if it contains '/', equals filename."""
+        return self.search(self._exact_filename_query(filename, limit))
     
-    def full_text_search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+    @ttl_lru()
+    def full_text_search(self, query: str, limit: int = 10) -> List[SearchHit]:
         """Perform full-text search across filename, path, and project name."""
         results = self.namespace.query(
             top_k=limit,
             rank_by=('filename', 'BM25', query),
-            include_attributes=['filename', 'gcs_path', 'project_name', 'project_id', 'gcs_url']
+            include_attributes=SEARCH_ATTRIBUTES
         )
-        return [dict(result) for result in results]
+        return list(_hits(results))
+    
+    def build_search_query(
+        self,
+        project_id: Optional[int] = None,
+        project_name: str = "",
+        filename: str = "",
+        query: str = "",
+        limit: int = 10,
+        substring: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """Build query parameters that combine every given criterion.
+        
+        Filters are ANDed together and a full-text query ranks the matches,
+        so any combination is answered by one request. Project names and
+        filenames match by token unless substring is set. Returns None when
+        no criteria are given.
+        """
+        # Most selective clauses first
+        clauses = []
+        if project_id is not None:
+            clauses.append(("project_id", "Eq", project_id))
+        if filename:
+            clauses.extend(_text_clauses("filename", filename, substring))
+        if project_name:
+            clauses.extend(_text_clauses("project_name", project_name, substring))
+        
+        if not clauses and not query:
+            return None
+        
+        params: Dict[str, Any] = {'top_k': limit, 'include_attributes': SEARCH_ATTRIBUTES}
+        if clauses:
+            params['filters'] = clauses[0] if len(clauses) == 1 else ("And", clauses)
+        if query:
+            params['rank_by'] = ('filename', 'BM25', query)
+        return params
+    
+    def find(self, limit: int = 10, **criteria: Any) -> List[SearchHit]:
+        """Search by build_search_query criteria, or list documents when none are given.
+        
+        Token matches are tried first; if they find nothing the search is
+        repeated as a substring match, which also covers documents indexed
+        before tokens were stored. Project-scoped searches are answered from
+        the project's listing when get_project_documents has cached one.
+        """
+        covered = self._find_covered(limit, criteria)
+        if covered is not None:
+            return covered
+        params = self.build_search_query(limit=limit, **criteria)
+        if params is None:
+            return self.search({'top_k': limit, 'include_attributes': SEARCH_ATTRIBUTES})
+        rows = self.search(params)
+        fallback = self.build_search_query(limit=limit, substring=True, **criteria)
+        if not rows and fallback != params:
+            rows = self.search(fallback)
+        return rows
+    
+    async def async_find(self, limit: int = 10, **criteria: Any) -> List[SearchHit]:
+        """Search like find without blocking the event loop."""
+        covered = self._find_covered(limit, criteria)
+        if covered is not None:
+            return covered
+        params = self.build_search_query(limit=limit, **criteria)
+        if params is None:
+            return await self.async_search({'top_k': limit, 'include_attributes': SEARCH_ATTRIBUTES})
+        rows = await self.async_search(params)
+        fallback = self.build_search_query(limit=limit, substring=True, **criteria)
+        if not rows and fallback != params:
+            rows = await self.async_search(fallback)
+        return rows
+    
+    @ttl_lru()
+    def search(self, params: Dict[str, Any]) -> List[SearchHit]:
+        """Run a query built by build_search_query."""
+        return list(_hits(self.namespace.query(**params)))
+    
+    def iter_search(self, params: Dict[str, Any]) -> Iterator[SearchHit]:
+        """Run a query and yield hits lazily, bypassing the cache, for large result sets."""
+        return _hits(self.namespace.query(**params))
+    
+    def iter_search_by_project_id(self, project_id: int, limit: int = 1000) -> Iterator[SearchHit]:
+        """Yield a project's documents lazily."""
+        return self.iter_search(self.build_search_query(project_id=project_id, limit=limit))
+    
+    def multi_search(self, queries: List[Dict[str, Any]]) -> List[List[SearchHit]]:
+        """Run several queries in a single request, returning each query's rows in order."""
+        if not queries:
+            return []
+        response = self.namespace.multi_query(queries=queries)
+        return [list(_hits(result)) for result in response.results]
+    
+    @ttl_lru()
+    async def async_search(self, params: Dict[str, Any]) -> List[SearchHit]:
+        """Run a query built by build_search_query without blocking the event loop."""
+        return list(_hits(await self._get_async_namespace().query(**params)))
+    
+    async def async_search_by_filename(self, filename: str, limit: int = 10) -> List[SearchHit]:
+        """Search documents by filename asynchronously."""
+        return await self.async_find(filename=filename, limit=limit)
+    
+    async def async_search_by_project(self, project_name: str, limit: int = 10) -> List[SearchHit]:
+        """Search documents by project name asynchronously."""
+        return await self.async_find(project_name=project_name, limit=limit)
+    
+    async def async_search_by_project_id(self, project_id: int, limit: int = 10) -> List[SearchHit]:
+        """Search documents by project ID asynchronously."""
+        return await self.async_search(self.build_search_query(project_id=project_id, limit=limit))
+    
+    async def async_search_by_filename_exact(self, filename: str, limit: int = 10) -> List[SearchHit]:
+        """Find documents by exact filename or GCS path asynchronously."""
+        return await self.async_search(self._exact_filename_query(filename, limit))
+    
+    def _exact_filename_query(self, filename: str, limit: int) -> Dict[str, Any]:
+        """Build an indexed equality lookup on filename, or on gcs_path for paths."""
+        attribute = 'gcs_path' if '/' in filename else 'filename'
+        return {
+            'top_k': limit,
+            'filters': (attribute, "Eq", filename),
+            'include_attributes': SEARCH_ATTRIBUTES
+        }
+    
+    async def async_full_text_search(self, query: str, limit: int = 10) -> List[SearchHit]:
+        """Perform full-text search asynchronously."""
+        return await self.async_search(self.build_search_query(query=query, limit=limit))
+    
+    def _get_async_namespace(self) -> Any:
+        """Return the async namespace, opening the async client on first use."""
+        if self._async_namespace is None:
+            self._async_client = turbopuffer.AsyncTurbopuffer(
+                api_key=self.config.api_key,
+                region=self.config.region,
+                max_retries=self.config.max_retries
+            )
+            self._async_namespace = self._async_client.namespace(self.namespace.id)
+        return self._async_namespace
+    
+    async def aclose(self) -> None:
+        """Close the async HTTP client if one was opened."""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+            self._async_namespace = None
     
     def delete_document(self, document_id: str) -> None:
         """Delete a document from the index."""
-        self.namespace.delete([document_id])
+        self.delete_documents((document_id,))
     
-    def get_index_stats(self) -> Dict[str, Any]:
-        """Get statistics about the index."""
+    def delete_documents(self, document_ids: Iterable[str]) -> None:
+        """Delete documents from the index, de-duplicated and WRITE_CHUNK_ROWS IDs per write."""
+        unique_ids = list(dict.fromkeys(document_ids))
+        if not unique_ids:
+            return
+        try:
+            for start in range(0, len(unique_ids), WRITE_CHUNK_ROWS):
+                self.namespace.write(deletes=unique_ids[start:start + WRITE_CHUNK_ROWS])
+        finally:
+            self.invalidate_cache()
+    
+    def ping(self) -> bool:
+        """Check the Turbopuffer API is reachable, failing fast without retries."""
+        try:
+            self.client.with_options(max_retries=0, timeout=5.0).namespace(self.namespace.id).exists()
+            return True
+        except turbopuffer.APIError:
+            return False
+    
+    def get_index_stats(self, force_refresh: bool = False) -> Dict[str, Any]:
+        """Get statistics about the index, cached for STATS_TTL_SECONDS unless force_refresh."""
+        now = time.monotonic()
+        cached_at, stats = self._stats_cache
+        if stats is not None and not force_refresh and now - cached_at < STATS_TTL_SECONDS:
+            return dict(stats)
+        
         try:
             # Get a sample to understand index size
             sample_results = self.namespace.query(top_k=1)
             # For now, just return basic info
-            return {"status": "active", "sample_count": len(sample_results)}
+            stats = {"status": "active", "sample_count": len(sample_results.rows or [])}
         except Exception as e:
-            return {"status": "error", "error": str(e)}
\ No newline at end of file
+            # Errors are not cached so the next call retries immediately
+            return {"status": "error", "error": str(e)}
+        
+        self._stats_cache = (now, stats)
+        return dict(stats)
\ No newline at end of file
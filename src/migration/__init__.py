@@ -5,4 +5,18 @@ A comprehensive migration system for transferring data from Filevine MSSQL datab
 to Supabase PostgreSQL with documents stored in Google Cloud Storage.
 """
 
-__version__ = "0.1.0"
\ No newline at end of file
+# Fallback when the package is run from a source checkout without being installed
+_DEFAULT_VERSION = "0.1.0"
+
+
+def __getattr__(name):
+    """Resolve __version__ from the installed distribution on first access."""
+    if name == "__version__":
+        from importlib.metadata import PackageNotFoundError, version
+        try:
+            value = version("migration")
+        except PackageNotFoundError:
+            value = _DEFAULT_VERSION
+        globals()["__version__"] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,21 +2,148 @@
 
 import asyncio
 import argparse
+import csv
+import functools
+import itertools
+import json
+import os
+import queue
 import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
 
-from .core.gcs_mapper import ProjectGCSMapper
+import orjson
+import pyodbc
+
+from .core.gcs_mapper import ProjectGCSMapper, sanitize_project_name
 from .core.supabase_migrator import SupabaseMigrator
 from .core.document_updater import DocumentURLUpdater
 from .utils.config_loader import load_config_from_env, create_sample_env_file, validate_config
-from .models.migration import ProjectRecord, DocumentRecord
+from .models.config import MigrationConfig
+from .models.migration import MigrationStats, ProjectRecord, DocumentRecord
+
+
+# Rows fetched per ODBC round trip when reading projects and documents
+MSSQL_FETCH_ROWS = 10_000
+
+# [Doc] columns and the DocumentRecord fields they fill
+DOCUMENT_COLUMNS = {
+    "ID": "id",
+    "ProjectID": "project_id",
+    "Filename": "filename",
+    "DocKey": "doc_key",
+    "Size": "size",
+    "UploaderID": "uploader_id",
+    "UploadDate": "upload_date",
+}
+
+# Tables migrated concurrently, each worker thread with its own Supabase client
+DEFAULT_MIGRATION_WORKERS = min(8, os.cpu_count() or 4)
+
+# Project mapping only reads project IDs and filenames; the analysis also sums sizes
+MAPPING_DOCUMENT_COLUMNS = ("ID", "ProjectID", "Filename")
+ANALYSIS_DOCUMENT_COLUMNS = (*MAPPING_DOCUMENT_COLUMNS, "Size")
+
+
+_project_id_of = attrgetter("project_id")
+_filename_of = attrgetter("filename")
+
+# Folder name variants the mapper tries, listed for unmapped projects
+_VARIANT_TEMPLATES = ("{name} (1)", "Solar - {name}", "Solar - PNC {name}")
+
+# Columns of the unmapped-projects CSV export
+_UNMAPPED_HEADER = (
+    'project_id', 'project_name', 'sanitized_name', 'document_count',
+    'total_size_bytes', 'sample_filenames',
+    'expected_gcs_path', 'sanitized_gcs_path', 'possible_variants', 'unmapped_reason'
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _name_variants(project_name: str) -> Tuple[str, str]:
+    """Return a project name's sanitized form and its '; '-joined folder variants."""
+    sanitized_name = sanitize_project_name(project_name)
+    variants = [
+        template.format(name=name)
+        for template in _VARIANT_TEMPLATES
+        for name in (project_name, sanitized_name)
+    ]
+    variants.append("zzz_mailroom_no_project_assigned (fallback)")
+    return sanitized_name, '; '.join(variants)
+
+
+def _build_unmapped_row(
+    project: ProjectRecord,
+    doc_count: int,
+    sample_docs: Sequence[DocumentRecord],
+    reason: str
+) -> Tuple[Any, ...]:
+    """Describe an unmapped project and the GCS folders it could have matched, in _UNMAPPED_HEADER order."""
+    sanitized_name, variants = _name_variants(project.project_name)
+    
+    return (
+        project.id,
+        project.project_name,
+        sanitized_name,
+        doc_count,
+        sum(doc.size for doc in sample_docs if doc.size),
+        '; '.join(doc.filename for doc in sample_docs if doc.filename),
+        f"docs/Bennett Legal/{project.project_name}",
+        f"docs/Bennett Legal/{sanitized_name}",
+        variants,
+        reason
+    )
+
+
+def _migrate_table_shard(config: MigrationConfig, table_names: List[str]) -> SupabaseMigrator:
+    """Migrate a shard of tables on this thread with its own client and event loop."""
+    migrator = SupabaseMigrator(config)
+    asyncio.run(migrator.migrate_all_tables(table_names, export_failures=False))
+    return migrator
+
+
+def _project_records(cursor: Any) -> List[ProjectRecord]:
+    """Read the cursor's current (ID, ProjectName) result set into project records."""
+    # Rows come from typed columns, so records are built without re-validating each one
+    return [
+        ProjectRecord.model_construct(id=id, project_name=project_name)
+        for rows in iter(lambda: cursor.fetchmany(MSSQL_FETCH_ROWS), [])
+        for id, project_name in rows
+    ]
+
+
+def _document_records(rows: Sequence, columns: Sequence[str]) -> List[DocumentRecord]:
+    """Build document records from [Doc] rows of the given columns.
+    
+    Rows come from typed columns, so records are built without re-validating
+    each one; blank filenames are normalized to None as the validator would,
+    and fields of columns that were not selected are None.
+    """
+    fields = [DOCUMENT_COLUMNS[column] for column in columns]
+    unselected = {field: None for field in DOCUMENT_COLUMNS.values() if field not in fields}
+    construct = DocumentRecord.model_construct
+    records = [construct(**dict(zip(fields, row)), **unselected) for row in rows]
+    
+    # Blank filenames are rare, so they are fixed up after the fact rather than checked per row
+    if "filename" in fields:
+        for record in records:
+            filename = record.filename
+            if filename is not None and (not filename or filename.isspace()):
+                record.filename = None
+    return records
 
 
 class MigrationCLI:
     """Main CLI interface for migration operations."""
     
     def __init__(self, config_file: Optional[str] = None):
+        # Idle MSSQL connections, reused so only the first fetch per worker pays the login
+        self._idle_mssql: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        
         try:
             self.config = load_config_from_env(config_file)
             
@@ -32,35 +159,37 @@ class MigrationCLI:
             print(f"Failed to load configuration: {e}")
             sys.exit(1)
     
-    async def run_full_migration(self) -> None:
+    async def run_full_migration(self, workers: int = DEFAULT_MIGRATION_WORKERS) -> None:
         """Run the complete migration process."""
         
         print("=== Starting Full Migration Process ===")
         print(f"Dry run mode: {self.config.dry_run}")
         
         try:
-            # Phase 1: Build project-to-GCS mapping
+            # Phases 1 and 2 are independent: the project-to-GCS mapping is built
+            # in the background while table data is migrated
             print("\n1. Building project-to-GCS path mapping...")
             gcs_mapper = ProjectGCSMapper(self.config.gcs)
+            mapping_task = asyncio.create_task(self.build_project_mapping(gcs_mapper))
             
-            # Get projects and documents from MSSQL
-            migrator = SupabaseMigrator(self.config)
-            projects = await self.get_projects_from_mssql()
-            documents = await self.get_documents_from_mssql()
-            
-            project_gcs_map = gcs_mapper.build_project_mapping(projects, documents)
+            try:
+                print("\n2. Migrating table data to Supabase...")
+                migrator = SupabaseMigrator(self.config)
+                table_names = await migrator.get_table_list()
+                print(f"Found {len(table_names)} tables to migrate")
+                
+                migration_stats = await self.migrate_tables(migrator, table_names, workers)
+                project_gcs_map = await mapping_task
+            finally:
+                # Don't leave the mapping running unobserved if table migration failed
+                if not mapping_task.done():
+                    mapping_task.cancel()
+                    await asyncio.gather(mapping_task, return_exceptions=True)
             mapping_stats = gcs_mapper.get_mapping_stats()
             
             print(f"Projects mapped to GCS paths: {mapping_stats['total_projects_mapped']}")
             print(f"Unique GCS paths: {mapping_stats['unique_paths']}")
             
-            # Phase 2: Migrate table data
-            print("\n2. Migrating table data to Supabase...")
-            table_names = await migrator.get_table_list()
-            print(f"Found {len(table_names)} tables to migrate")
-            
-            migration_stats = await migrator.migrate_all_tables(table_names)
-            
             # Phase 3: Update document URLs
             print("\n3. Updating document URLs with GCS paths...")
             url_updater = DocumentURLUpdater(self.config, project_gcs_map)
@@ -84,36 +213,43 @@ class MigrationCLI:
         try:
             gcs_mapper = ProjectGCSMapper(self.config.gcs)
             
-            # Get projects and documents from MSSQL  
-            projects = await self.get_projects_from_mssql()
-            documents = await self.get_documents_from_mssql()
-            
-            print(f"Found {len(projects)} projects and {len(documents)} documents")
+            # Get projects from MSSQL while documents stream in below
+            projects_task = asyncio.create_task(self.get_projects_from_mssql())
             
-            # Group documents by project for stats
-            from collections import defaultdict
-            docs_by_project = defaultdict(list)
+            # Group documents by project as pages arrive; only documents with
+            # filenames are kept, the rest are just counted. Counter.update
+            # tallies a whole page in C rather than one document at a time.
+            doc_counts_by_project: Counter = Counter()
             docs_with_filenames_by_project = defaultdict(list)
-            
-            for doc in documents:
-                if doc.project_id:
-                    docs_by_project[doc.project_id].append(doc)
-                    if doc.filename and doc.filename.strip():
+            document_count = 0
+            
+            async for page in self.iter_document_pages_from_mssql(ANALYSIS_DOCUMENT_COLUMNS):
+                document_count += len(page)
+                doc_counts_by_project.update(map(_project_id_of, page))
+                # Blank filenames were normalized to None when the record was built
+                for doc in filter(_filename_of, page):
+                    if doc.project_id:
                         docs_with_filenames_by_project[doc.project_id].append(doc)
             
-            # Calculate project categories
-            projects_with_docs_and_filenames = set(docs_with_filenames_by_project.keys())
-            projects_with_docs_no_filenames = set()
-            projects_with_no_docs = set()
-            
-            for project in projects:
-                project_id = project.id
-                if project_id not in docs_by_project:
-                    projects_with_no_docs.add(project_id)
-                elif project_id not in docs_with_filenames_by_project:
-                    projects_with_docs_no_filenames.add(project_id)
-            
-            project_gcs_map = gcs_mapper.build_project_mapping(projects, documents)
+            # Documents without a project are counted above but not grouped
+            doc_counts_by_project.pop(None, None)
+            doc_counts_by_project.pop(0, None)
+            
+            projects = await projects_task
+            print(f"Found {len(projects)} projects and {document_count} documents")
+            
+            # Calculate project categories with set operations on the ID keys;
+            # documents whose project_id matches no project are left out
+            projects_by_id = {project.id: project for project in projects}
+            project_ids = projects_by_id.keys()
+            projects_with_docs = doc_counts_by_project.keys() & project_ids
+            projects_with_docs_and_filenames = docs_with_filenames_by_project.keys() & project_ids
+            projects_with_docs_no_filenames = projects_with_docs - projects_with_docs_and_filenames
+            projects_with_no_docs = project_ids - projects_with_docs
+            
+            project_gcs_map = gcs_mapper.build_project_mapping(
+                projects, itertools.chain.from_iterable(docs_with_filenames_by_project.values())
+            )
             mapping_stats = gcs_mapper.get_mapping_stats()
             
             print(f"Projects with documents & filenames: {len(projects_with_docs_and_filenames)}")
@@ -129,110 +265,40 @@ class MigrationCLI:
             if truly_unmapped_ids:
                 print(f"Truly unmapped projects (have docs+filenames but no GCS folder): {len(truly_unmapped_ids)}")
                 
-                # Collect unmapped project details
-                unmapped_projects = []
-                for project in projects:
-                    if project.id in truly_unmapped_ids:
-                        project_docs = docs_with_filenames_by_project.get(project.id, [])
-                        doc_count = len(project_docs)
-                        
-                        # Get sample document filenames (first 3)
-                        sample_files = []
-                        total_size = 0
-                        for doc in project_docs[:3]:
-                            if doc.filename:
-                                sample_files.append(doc.filename)
-                            if doc.size:
-                                total_size += doc.size
-                        
-                        # Generate sanitized name for variants
-                        import re
-                        sanitized_name = re.sub(r'"+', '_', project.project_name)
-                        sanitized_name = sanitized_name.replace('/', '_')
-                        variants = [
-                            f"{project.project_name} (1)",
-                            f"{sanitized_name} (1)", 
-                            f"Solar - {project.project_name}",
-                            f"Solar - {sanitized_name}",
-                            f"Solar - PNC {project.project_name}",
-                            f"Solar - PNC {sanitized_name}",
-                            "zzz_mailroom_no_project_assigned (fallback)"
-                        ]
-                        
-                        unmapped_projects.append({
-                            'project_id': project.id,
-                            'project_name': project.project_name,
-                            'sanitized_name': sanitized_name,
-                            'document_count': doc_count,
-                            'total_size_bytes': total_size,
-                            'sample_filenames': '; '.join(sample_files),
-                            'expected_gcs_path': f"docs/Bennett Legal/{project.project_name}",
-                            'sanitized_gcs_path': f"docs/Bennett Legal/{sanitized_name}",
-                            'possible_variants': '; '.join(variants),
-                            'unmapped_reason': 'has_docs_with_filenames_but_no_gcs_folder'
-                        })
-                        
-                        if not export_csv:
-                            print(f"  - {project.id}: {project.project_name}")
-                
-                # Also collect projects with docs but no filenames for CSV export
-                if export_csv:
-                    for project in projects:
-                        if project.id in projects_with_docs_no_filenames:
-                            project_docs = docs_by_project.get(project.id, [])
-                            doc_count = len(project_docs)
-                            
-                            import re
-                            sanitized_name = re.sub(r'"+', '_', project.project_name)
-                            sanitized_name = sanitized_name.replace('/', '_')
-                            variants = [
-                                f"{project.project_name} (1)",
-                                f"{sanitized_name} (1)", 
-                                f"Solar - {project.project_name}",
-                                f"Solar - {sanitized_name}",
-                                f"Solar - PNC {project.project_name}",
-                                f"Solar - PNC {sanitized_name}",
-                                "zzz_mailroom_no_project_assigned (fallback)"
-                            ]
-                            
-                            unmapped_projects.append({
-                                'project_id': project.id,
-                                'project_name': project.project_name,
-                                'sanitized_name': sanitized_name,
-                                'document_count': doc_count,
-                                'total_size_bytes': 0,
-                                'sample_filenames': '',
-                                'expected_gcs_path': f"docs/Bennett Legal/{project.project_name}",
-                                'sanitized_gcs_path': f"docs/Bennett Legal/{sanitized_name}",
-                                'possible_variants': '; '.join(variants),
-                                'unmapped_reason': 'has_docs_but_no_filenames'
-                            })
+                # Look up the unmapped projects by ID instead of rescanning every project
+                unmapped = [projects_by_id[project_id] for project_id in sorted(truly_unmapped_ids)]
                 
                 # Export to CSV if requested
                 if export_csv:
-                    import csv
-                    from datetime import datetime
+                    def iter_unmapped_rows():
+                        """Yield unmapped project details one row at a time, sampling the first 3 documents."""
+                        for project in unmapped:
+                            project_docs = docs_with_filenames_by_project[project.id]
+                            yield _build_unmapped_row(
+                                project, len(project_docs), project_docs[:3],
+                                'has_docs_with_filenames_but_no_gcs_folder'
+                            )
+                        
+                        # Also include projects with docs but no filenames
+                        for project_id in sorted(projects_with_docs_no_filenames):
+                            yield _build_unmapped_row(
+                                projects_by_id[project_id], doc_counts_by_project[project_id], (),
+                                'has_docs_but_no_filenames'
+                            )
                     
                     csv_filename = f"unmapped_projects_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
                     
-                    with open(csv_filename, 'w', newline='', encoding='utf-8') as csvfile:
-                        fieldnames = [
-                            'project_id', 'project_name', 'sanitized_name', 'document_count', 
-                            'total_size_bytes', 'sample_filenames', 
-                            'expected_gcs_path', 'sanitized_gcs_path', 'possible_variants', 'unmapped_reason'
-                        ]
-                        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                        writer.writeheader()
-                        writer.writerows(unmapped_projects)
+                    with open(csv_filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+                        writer = csv.writer(csvfile)
+                        writer.writerow(_UNMAPPED_HEADER)
+                        writer.writerows(iter_unmapped_rows())
                     
-                    print(f"Exported {len(unmapped_projects)} projects with mapping issues to: {csv_filename}")
+                    exported = len(unmapped) + len(projects_with_docs_no_filenames)
+                    print(f"Exported {exported} projects with mapping issues to: {csv_filename}")
                 else:
                     # Show first 15 for console output
-                    shown = 0
-                    for project in projects:
-                        if project.id in truly_unmapped_ids and shown < 15:
-                            print(f"  - {project.id}: {project.project_name}")
-                            shown += 1
+                    for project in unmapped[:15]:
+                        print(f"  - {project.id}: {project.project_name}")
                     if len(truly_unmapped_ids) > 15:
                         print(f"  ... and {len(truly_unmapped_ids) - 15} more (use --export-csv to see all)")
             else:
@@ -242,7 +308,11 @@ class MigrationCLI:
             print(f"Mapping analysis failed: {e}")
             sys.exit(1)
     
-    async def run_data_migration_only(self, table_names: Optional[List[str]] = None) -> None:
+    async def run_data_migration_only(
+        self,
+        table_names: Optional[List[str]] = None,
+        workers: int = DEFAULT_MIGRATION_WORKERS
+    ) -> None:
         """Run only the data migration phase."""
         
         print("=== Data Migration Only ===")
@@ -256,7 +326,7 @@ class MigrationCLI:
             else:
                 print(f"Migrating specified tables: {', '.join(table_names)}")
             
-            stats = await migrator.migrate_all_tables(table_names)
+            stats = await self.migrate_tables(migrator, table_names, workers)
             
             print(f"Migration completed: {stats.migrated_docs} records, {stats.errors} errors")
             
@@ -264,6 +334,37 @@ class MigrationCLI:
             print(f"Data migration failed: {e}")
             sys.exit(1)
     
+    async def migrate_tables(
+        self,
+        migrator: SupabaseMigrator,
+        table_names: List[str],
+        workers: int = DEFAULT_MIGRATION_WORKERS
+    ) -> MigrationStats:
+        """Migrate tables split round-robin across worker threads.
+        
+        Tables migrate independently but block on ODBC and HTTP calls, so each
+        shard runs on its own thread with its own migrator rather than as a
+        task on this loop. Shard results are merged into migrator, which
+        exports all failed batches to a single CSV.
+        """
+        workers = max(1, min(workers, len(table_names)))
+        if workers == 1:
+            return await migrator.migrate_all_tables(table_names)
+        
+        print(f"Migrating {len(table_names)} tables with {workers} workers")
+        shards = [table_names[i::workers] for i in range(workers)]
+        for shard_migrator in await asyncio.gather(*(
+            asyncio.to_thread(_migrate_table_shard, self.config, shard) for shard in shards
+        )):
+            migrator.merge(shard_migrator)
+        
+        if migrator.failed_batches:
+            failure_file = migrator.export_failures_to_csv()
+            if failure_file:
+                print(f"Failed batches exported to: {failure_file}")
+        
+        return migrator.get_migration_stats()
+    
     async def run_url_updates_only(self) -> None:
         """Run only the document URL update phase."""
         
@@ -272,9 +373,7 @@ class MigrationCLI:
         try:
             # Need project mapping first
             gcs_mapper = ProjectGCSMapper(self.config.gcs)
-            projects = await self.get_projects_from_mssql()
-            documents = await self.get_documents_from_mssql()
-            project_gcs_map = gcs_mapper.build_project_mapping(projects, documents)
+            project_gcs_map = await self.build_project_mapping(gcs_mapper)
             
             # Update URLs
             url_updater = DocumentURLUpdater(self.config, project_gcs_map)
@@ -313,12 +412,12 @@ class MigrationCLI:
             migrator = SupabaseMigrator(self.config)
             
             if csv_file:
-                # Load failures from CSV file
+                # Retry failures as they are read from the CSV file
                 print(f"Loading failures from: {csv_file}")
-                await self.load_failures_from_csv(migrator, csv_file)
-            
-            # Retry all failed batches
-            retry_count = await migrator.retry_failed_batches()
+                retry_count = await migrator.retry_failed_batches(self.iter_failures_from_csv(csv_file))
+            else:
+                # Retry all failed batches
+                retry_count = await migrator.retry_failed_batches()
             
             # Export any remaining failures
             if migrator.failed_batches:
@@ -334,9 +433,14 @@ class MigrationCLI:
     
     async def load_failures_from_csv(self, migrator: SupabaseMigrator, csv_file: str) -> None:
         """Load failed batches from CSV file into migrator."""
-        import csv
-        import json
+        migrator.failed_batches.extend(self.iter_failures_from_csv(csv_file))
+    
+    def iter_failures_from_csv(self, csv_file: str) -> Iterator[Dict[str, Any]]:
+        """Yield failed batches from a failure CSV one row at a time.
         
+        Each row's batch JSON is decoded only when it is reached, so a consumer
+        that retries as it goes holds one batch at a time.
+        """
         try:
             # Increase CSV field size limit to handle large batch data
             csv.field_size_limit(10 * 1024 * 1024)  # 10MB limit
@@ -345,25 +449,25 @@ class MigrationCLI:
                 reader = csv.DictReader(f)
                 loaded_count = 0
                 
-                for row in reader:
+                for row_number, row in enumerate(reader, 1):
                     try:
-                        batch_data = json.loads(row['full_batch_json'])
                         failure_record = {
                             'table_name': row['table_name'],
                             'error_message': row['error_message'],
                             'batch_size': int(row['batch_size']),
                             'failed_at': row['failed_at'],
-                            'batch_data': batch_data
+                            # Batch JSON can approach the field limit; orjson parses it natively
+                            'batch_data': orjson.loads(row['full_batch_json'])
                         }
-                        migrator.failed_batches.append(failure_record)
-                        loaded_count += 1
-                        
                     except json.JSONDecodeError as je:
-                        print(f"Failed to parse JSON for row {loaded_count + 1}: {je}")
+                        print(f"Failed to parse JSON for row {row_number}: {je}")
                         continue
                     except Exception as re:
-                        print(f"Failed to process row {loaded_count + 1}: {re}")
+                        print(f"Failed to process row {row_number}: {re}")
                         continue
+                    
+                    loaded_count += 1
+                    yield failure_record
             
             print(f"Loaded {loaded_count} failed batches from CSV")
             
@@ -371,52 +475,146 @@ class MigrationCLI:
             print(f"Failed to load CSV file: {e}")
             raise
     
+    async def build_project_mapping(self, gcs_mapper: ProjectGCSMapper) -> Dict[int, str]:
+        """Fetch projects and documents and map projects to GCS paths off the event loop."""
+        projects, documents = await self.get_projects_and_documents(MAPPING_DOCUMENT_COLUMNS)
+        # The mapper probes GCS with blocking calls
+        return await asyncio.to_thread(gcs_mapper.build_project_mapping, projects, documents)
+    
+    def _acquire_mssql(self) -> Any:
+        """Take an idle MSSQL connection, or open one if none is idle."""
+        try:
+            return self._idle_mssql.get_nowait()
+        except queue.Empty:
+            return pyodbc.connect(self.config.mssql.connection_string(), autocommit=True)
+    
+    def _release_mssql(self, conn: Any, reusable: bool = True) -> None:
+        """Return a connection for reuse, or close it if it may be in a bad state."""
+        if reusable:
+            self._idle_mssql.put(conn)
+        else:
+            conn.close()
+    
     async def get_projects_from_mssql(self) -> List[ProjectRecord]:
-        """Get project records from MSSQL database."""
-        import pyodbc
-        
-        conn = pyodbc.connect(self.config.mssql.connection_string())
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT ID, ProjectName FROM [Project]")
-        projects = []
-        
-        for row in cursor.fetchall():
-            projects.append(ProjectRecord(id=row[0], project_name=row[1]))
-        
-        cursor.close()
-        conn.close()
+        """Get project records from MSSQL database without blocking the event loop."""
+        return await asyncio.to_thread(self._fetch_projects)
+    
+    async def get_documents_from_mssql(
+        self,
+        columns: Sequence[str] = tuple(DOCUMENT_COLUMNS),
+        after_id: Optional[int] = None
+    ) -> List[DocumentRecord]:
+        """Get document records from MSSQL database without blocking the event loop."""
+        documents: List[DocumentRecord] = []
+        async for page in self.iter_document_pages_from_mssql(columns, after_id):
+            documents.extend(page)
+        return documents
+    
+    async def get_projects_and_documents(
+        self,
+        columns: Sequence[str] = tuple(DOCUMENT_COLUMNS)
+    ) -> tuple[List[ProjectRecord], List[DocumentRecord]]:
+        """Get project and document records in a single MSSQL batch without blocking the event loop."""
+        return await asyncio.to_thread(self._fetch_projects_and_documents, columns)
+    
+    async def iter_documents_from_mssql(
+        self,
+        columns: Sequence[str] = tuple(DOCUMENT_COLUMNS),
+        after_id: Optional[int] = None,
+        page_size: int = MSSQL_FETCH_ROWS
+    ) -> AsyncIterator[DocumentRecord]:
+        """Yield document records in ID order."""
+        async for page in self.iter_document_pages_from_mssql(columns, after_id, page_size):
+            for document in page:
+                yield document
+    
+    async def iter_document_pages_from_mssql(
+        self,
+        columns: Sequence[str] = tuple(DOCUMENT_COLUMNS),
+        after_id: Optional[int] = None,
+        page_size: int = MSSQL_FETCH_ROWS
+    ) -> AsyncIterator[List[DocumentRecord]]:
+        """Yield lists of document records in ID order, one keyset page at a time.
+        
+        Only the given columns are selected. Each page is a bounded query for
+        the rows after the previous page's last ID, so a scan can be resumed
+        with after_id. All ODBC calls run on one worker thread; a pooled
+        connection is only ever used by one thread at a time.
+        """
+        # ID leads every row so the next page can start after it
+        columns = ("ID", *(column for column in columns if column != "ID"))
+        select = f"SELECT TOP (?) {', '.join(columns)} FROM [Doc]"
+        
+        def fetch_page(cursor: Any, after_id: Optional[int]) -> List[Any]:
+            if after_id is None:
+                return cursor.execute(f"{select} ORDER BY ID", page_size).fetchall()
+            return cursor.execute(f"{select} WHERE ID > ? ORDER BY ID", page_size, after_id).fetchall()
+        
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            conn = await loop.run_in_executor(executor, self._acquire_mssql)
+            cursor = conn.cursor()
+            reusable = False
+            try:
+                while rows := await loop.run_in_executor(executor, fetch_page, cursor, after_id):
+                    yield _document_records(rows, columns)
+                    if len(rows) < page_size:
+                        break
+                    after_id = rows[-1][0]
+                reusable = True
+            finally:
+                await loop.run_in_executor(executor, cursor.close)
+                self._release_mssql(conn, reusable)
+    
+    def _fetch_projects(self) -> List[ProjectRecord]:
+        """Read project records on a pooled MSSQL connection."""
+        conn = self._acquire_mssql()
+        reusable = False
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT ID, ProjectName FROM [Project]")
+            projects = _project_records(cursor)
+            cursor.close()
+            reusable = True
+        finally:
+            self._release_mssql(conn, reusable)
         
         return projects
     
-    async def get_documents_from_mssql(self) -> List[DocumentRecord]:
-        """Get document records from MSSQL database."""
-        import pyodbc
-        
-        conn = pyodbc.connect(self.config.mssql.connection_string())
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT ID, ProjectID, Filename, DocKey, Size, UploaderID, UploadDate
-            FROM [Doc]
-        """)
-        
-        documents = []
-        for row in cursor.fetchall():
-            documents.append(DocumentRecord(
-                id=row[0],
-                project_id=row[1],
-                filename=row[2],
-                doc_key=row[3],
-                size=row[4],
-                uploader_id=row[5],
-                upload_date=row[6]
-            ))
-        
-        cursor.close()
-        conn.close()
-        
-        return documents
+    def _fetch_projects_and_documents(
+        self,
+        columns: Sequence[str]
+    ) -> tuple[List[ProjectRecord], List[DocumentRecord]]:
+        """Read projects and documents with one batch of two statements.
+        
+        Both result sets come back from a single execute on a pooled
+        connection, so loading everything costs one round trip to start
+        instead of one per query.
+        """
+        conn = self._acquire_mssql()
+        reusable = False
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT ID, ProjectName FROM [Project]; "
+                f"SELECT {', '.join(columns)} FROM [Doc] ORDER BY ID;"
+            )
+            projects = _project_records(cursor)
+            
+            if not cursor.nextset():
+                raise RuntimeError("MSSQL batch returned no document result set")
+            documents = [
+                document
+                for rows in iter(lambda: cursor.fetchmany(MSSQL_FETCH_ROWS), [])
+                for document in _document_records(rows, columns)
+            ]
+            
+            cursor.close()
+            reusable = True
+        finally:
+            self._release_mssql(conn, reusable)
+        
+        return projects, documents
 
 
 def main():
@@ -432,7 +630,13 @@ def main():
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
     
     # Full migration command
-    subparsers.add_parser("migrate", help="Run complete migration process")
+    migrate_parser = subparsers.add_parser("migrate", help="Run complete migration process")
+    migrate_parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=DEFAULT_MIGRATION_WORKERS,
+        help=f"Tables to migrate concurrently (default: {DEFAULT_MIGRATION_WORKERS})"
+    )
     
     # Mapping analysis command
     analyze_parser = subparsers.add_parser("analyze", help="Analyze project-to-GCS path mapping")
@@ -449,6 +653,12 @@ def main():
         nargs="+", 
         help="Specific tables to migrate (default: all tables)"
     )
+    data_parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=DEFAULT_MIGRATION_WORKERS,
+        help=f"Tables to migrate concurrently (default: {DEFAULT_MIGRATION_WORKERS})"
+    )
     
     # URL updates only
     subparsers.add_parser("urls", help="Update document URLs only")
@@ -517,11 +727,11 @@ def main():
     
     # Run appropriate command
     if args.command == "migrate":
-        asyncio.run(cli.run_full_migration())
+        asyncio.run(cli.run_full_migration(args.workers))
     elif args.command == "analyze":
         asyncio.run(cli.run_mapping_analysis(export_csv=args.export_csv))
     elif args.command == "data":
-        asyncio.run(cli.run_data_migration_only(args.tables))
+        asyncio.run(cli.run_data_migration_only(args.tables, args.workers))
     elif args.command == "urls":
         asyncio.run(cli.run_url_updates_only())
     elif args.command == "create-tables":
@@ -530,7 +740,6 @@ def main():
         asyncio.run(cli.run_retry_failures(args.csv_file))
     elif args.command == "schema-migrate":
         from .core.schema_migrator import SchemaMigrator
-        from .utils.config_loader import load_config_from_env
         
         config = load_config_from_env()
         dry_run = getattr(args, 'dry_run', False)
@@ -561,11 +770,12 @@ def main():
             
             # Print dry run summary if in dry run mode
             migrator.print_dry_run_summary()
+            
+            await migrator.close()
         
         asyncio.run(run_schema_migration())
     elif args.command == "migrate-documents":
         from .core.schema_migrator import SchemaMigrator
-        from .utils.config_loader import load_config_from_env
         
         config = load_config_from_env()
         dry_run = getattr(args, 'dry_run', False)
@@ -633,11 +843,12 @@ def main():
             
             # Print dry run summary if in dry run mode
             migrator.print_dry_run_summary()
+            
+            await migrator.close()
         
         asyncio.run(run_document_migration())
     elif args.command == "migrate-extras":
         from .core.schema_migrator import SchemaMigrator
-        from .utils.config_loader import load_config_from_env
         
         config = load_config_from_env()
         dry_run = getattr(args, 'dry_run', False)
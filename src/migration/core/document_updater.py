@@ -1,8 +1,10 @@
 """Document URL generation and database updating functionality."""
 
 import asyncio
-from typing import Dict, List, Optional
-from datetime import datetime
+import functools
+import operator
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from datetime import datetime, timezone
 from google.cloud import storage
 from supabase import Client
 from tqdm import tqdm
@@ -10,6 +12,58 @@ from asyncio_throttle import Throttler
 
 from ..models.config import MigrationConfig
 from ..models.migration import MigrationStats, MigrationLogEntry
+from ..utils.database_pool import DatabasePool
+from .gcs_mapper import create_storage_client
+
+
+# Documents written to Supabase per upsert request
+URL_UPDATE_BATCH_SIZE = 500
+
+# Doc rows read per request; PostgREST caps responses at 1000 rows by default
+DOC_PAGE_SIZE = 1000
+
+# PostgREST filter for documents a previous run has not yet updated
+PENDING_DOCS_FILTER = "is_migrated.is.null,is_migrated.eq.false"
+
+# Used with a direct database connection; migration_date is set by the server
+UPDATE_DOC_URLS_SQL = (
+    "UPDATE doc SET gcs_url = $1, gcs_public_url = $2, gcs_path = $3, "
+    "is_migrated = true, migration_date = now() WHERE id = $4"
+)
+
+MIGRATION_PROGRESS_SQL = (
+    "SELECT count(*) AS total_docs, count(*) FILTER (WHERE is_migrated) AS migrated_docs FROM doc"
+)
+
+
+# Spellings of the doc columns the updater reads, in order of preference
+_ID_COLUMNS = ('id', 'ID')
+_FILENAME_COLUMNS = ('filename', 'Filename')
+_PROJECT_ID_COLUMNS = ('projectid', 'ProjectID', 'project_id')
+
+
+def _probe_document_fields(doc_record: Dict) -> Tuple[Any, Any, Any]:
+    """Read (id, filename, project_id), falling back across column spellings per row."""
+    return tuple(
+        next((doc_record[column] for column in columns if doc_record.get(column)), None)
+        for columns in (_ID_COLUMNS, _FILENAME_COLUMNS, _PROJECT_ID_COLUMNS)
+    )
+
+
+def _document_fields(doc_record: Dict) -> Callable[[Dict], Tuple[Any, Any, Any]]:
+    """Return a getter for (id, filename, project_id) matching the record's column names.
+    
+    Every row of a page has the same columns, so the spelling is resolved
+    once from a sample row. Pages that have none or several spellings of a
+    column keep probing each row.
+    """
+    columns = []
+    for candidates in (_ID_COLUMNS, _FILENAME_COLUMNS, _PROJECT_ID_COLUMNS):
+        present = [column for column in candidates if column in doc_record]
+        if len(present) != 1:
+            return _probe_document_fields
+        columns.append(present[0])
+    return operator.itemgetter(*columns)
 
 
 class DocumentURLUpdater:
@@ -20,12 +74,36 @@ class DocumentURLUpdater:
         self.supabase: Client = Client(config.supabase.url, config.supabase.service_role_key)
         self.project_gcs_map = project_gcs_map  # ProjectId -> GCS path mapping
         self.bucket_name = config.gcs.bucket_name
+        # ProjectId -> (gcs_path, gcs_url, gcs_public_url) prefixes; rows only append the filename
+        self._url_prefixes: Dict[int, Tuple[str, str, str]] = {
+            project_id: (
+                f"{path}/",
+                f"gs://{self.bucket_name}/{path}/",
+                f"https://storage.googleapis.com/{self.bucket_name}/{path}/"
+            )
+            for project_id, path in project_gcs_map.items()
+        }
         self.gcs_project = config.gcs.project_id
         self.throttler = Throttler(rate_limit=config.max_concurrent, period=1.0)
         self.stats = MigrationStats()
+        # Caps document writes in flight across all pages and batches
+        self.write_slots = asyncio.Semaphore(config.max_concurrent)
+        # Bulk writes bypass PostgREST when a Postgres DSN is configured
+        self.db_pool = (
+            DatabasePool(config.supabase.db_url, max_size=config.max_concurrent)
+            if config.supabase.db_url else None
+        )
+        # migration_log rows waiting to be inserted together
+        self._log_buffer: List[Dict[str, Any]] = []
+        self._log_lock = asyncio.Lock()
     
-    async def update_all_document_urls(self) -> MigrationStats:
-        """Update all document records with GCS URLs (no file transfers needed)."""
+    async def update_all_document_urls(self, include_migrated: bool = False) -> MigrationStats:
+        """Update all document records with GCS URLs (no file transfers needed).
+        
+        Documents already marked as migrated are skipped by the database
+        unless include_migrated is set, so a resumed run only reads what is
+        left.
+        """
         
         print("Starting document URL updates")
         
@@ -34,22 +112,30 @@ class DocumentURLUpdater:
             return self.stats
         
         try:
-            # Get all doc records from Supabase (without join)
-            doc_records = self.supabase.table("doc").select("*").execute()
+            # Count doc records up front; the rows themselves are read page by page
+            doc_count = self.supabase.table("doc").select("id", count="exact", head=True)
+            if not include_migrated:
+                doc_count = doc_count.or_(PENDING_DOCS_FILTER)
+            doc_count = doc_count.execute()
             
-            if not doc_records.data:
+            if not doc_count.count:
                 print("No documents found to update")
                 return self.stats
             
-            self.stats.total_docs = len(doc_records.data)
+            self.stats.total_docs = doc_count.count
             print(f"Found {self.stats.total_docs} documents to process")
             
-            # Process documents with progress bar
+            # Process pages concurrently with progress bar; only a bounded number
+            # of pages is held while their batches wait for a write slot
             with tqdm(total=self.stats.total_docs, desc="Updating document URLs") as pbar:
-                for doc in doc_records.data:
-                    async with self.throttler:
-                        await self.update_single_document_url(doc)
-                    pbar.update(1)
+                pending = set()
+                async for page in self.iter_doc_pages(pending_only=not include_migrated):
+                    if len(pending) >= self.config.max_concurrent:
+                        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        for task in done:
+                            task.result()
+                    pending.add(asyncio.create_task(self.update_documents(page, pbar)))
+                await asyncio.gather(*pending)
             
             print("Document URL updates completed")
             print(f"Total documents: {self.stats.total_docs}")
@@ -61,106 +147,222 @@ class DocumentURLUpdater:
             print(error_msg)
             self.stats.errors += 1
             await self.log_update_error(None, error_msg)
+        finally:
+            await self.close()
         
         return self.stats
     
+    async def iter_doc_pages(
+        self,
+        page_size: int = DOC_PAGE_SIZE,
+        pending_only: bool = False,
+        project_id: Optional[int] = None
+    ) -> AsyncIterator[List[Dict]]:
+        """Yield doc records in ID order, one keyset page at a time.
+        
+        The next page is fetched in the background while the caller works on
+        the current one, so reads overlap with updates. Whole rows are read
+        because they are upserted back in full. Paging by ID rather than
+        offset stays correct with pending_only while earlier pages are being
+        marked as migrated.
+        """
+        
+        def fetch_page(after_id: Any) -> List[Dict]:
+            query = self.supabase.table("doc").select("*").order("id").limit(page_size)
+            if pending_only:
+                query = query.or_(PENDING_DOCS_FILTER)
+            if project_id is not None:
+                query = query.eq("project_id", project_id)
+            if after_id is not None:
+                query = query.gt("id", after_id)
+            return query.execute().data or []
+        
+        next_page = asyncio.create_task(asyncio.to_thread(fetch_page, None))
+        try:
+            while page := await next_page:
+                if len(page) < page_size:
+                    yield page
+                    break
+                next_page = asyncio.create_task(asyncio.to_thread(fetch_page, page[-1]['id']))
+                yield page
+        finally:
+            next_page.cancel()
+    
+    async def close(self) -> None:
+        """Write buffered error logs and release pooled database connections."""
+        await self.flush_logs()
+        if self.db_pool is not None:
+            await self.db_pool.close()
+    
     async def update_single_document_url(self, doc_record: Dict) -> None:
         """Generate GCS URL for existing file and update database."""
+        await self.update_documents([doc_record])
+        await self.flush_logs()
+    
+    async def update_documents(self, doc_records: Sequence[Dict], pbar: Optional[tqdm] = None) -> int:
+        """Generate GCS URLs for documents and write them with one upsert per batch.
         
-        # Handle both possible column name formats (id vs ID)
-        doc_id = doc_record.get('id') or doc_record.get('ID')
-        filename = doc_record.get('filename') or doc_record.get('Filename')
-        project_id = doc_record.get('projectid') or doc_record.get('ProjectID') or doc_record.get('project_id')
+        Batches are written concurrently, at most write_slots at a time across
+        the updater. Documents that cannot be mapped or written are logged
+        together once every batch has been sent. Returns the number of
+        documents updated.
+        """
+        if not doc_records:
+            return 0
         
+        errors: List[Tuple[Any, str]] = []
+        document_fields = _document_fields(doc_records[0])
+        
+        async def update_batch(batch: Sequence[Dict]) -> int:
+            migration_date = datetime.now(timezone.utc).isoformat()
+            rows = []
+            doc_ids = []
+            for doc_record in batch:
+                doc_id, filename, project_id = document_fields(doc_record)
+                row = self._build_update_row(doc_record, doc_id, filename, project_id, migration_date)
+                if isinstance(row, tuple):
+                    errors.append(row)
+                else:
+                    rows.append(row)
+                    doc_ids.append(doc_id)
+            
+            updated = 0
+            if rows:
+                async with self.write_slots, self.throttler:
+                    updated = await self._write_rows(rows, doc_ids, errors)
+            if pbar is not None:
+                pbar.update(len(batch))
+            return updated
+        
+        updated = sum(await asyncio.gather(*(
+            update_batch(doc_records[start:start + URL_UPDATE_BATCH_SIZE])
+            for start in range(0, len(doc_records), URL_UPDATE_BATCH_SIZE)
+        )))
+        
+        self.stats.migrated_docs += updated
+        self.stats.errors += len(errors)
+        await self.log_update_errors(errors)
+        return updated
+    
+    def _build_update_row(
+        self,
+        doc_record: Dict,
+        doc_id: Any,
+        filename: Optional[str],
+        project_id: Any,
+        migration_date: str
+    ) -> Union[Dict, Tuple[Any, str]]:
+        """Return the document row with its GCS URLs set, or a (doc_id, error) pair."""
         if not filename or not project_id:
-            await self.log_update_error(
-                doc_id, 
-                f"Missing filename ({filename}) or project_id ({project_id})"
-            )
-            self.stats.errors += 1
-            return
+            return doc_id, f"Missing filename ({filename}) or project_id ({project_id})"
         
         # Get GCS path from ProjectId mapping
-        if project_id not in self.project_gcs_map:
-            await self.log_update_error(
-                doc_id, 
-                f"No GCS path mapping for project_id {project_id}"
-            )
-            self.stats.errors += 1
-            return
+        prefixes = self._url_prefixes.get(project_id)
+        if prefixes is None:
+            return doc_id, f"No GCS path mapping for project_id {project_id}"
             
         # Generate GCS URL - files already exist in bucket
-        gcs_path = f"{self.project_gcs_map[project_id]}/{filename}"
-        gcs_url = f"gs://{self.bucket_name}/{gcs_path}"
-        public_url = f"https://storage.googleapis.com/{self.bucket_name}/{gcs_path}"
+        path_prefix, url_prefix, public_url_prefix = prefixes
         
+        # The whole row is upserted so inserts of the conflicting row never
+        # trip NOT NULL constraints on columns that are not being changed
+        return {
+            **doc_record,
+            'gcs_url': url_prefix + filename,
+            'gcs_public_url': public_url_prefix + filename,
+            'gcs_path': path_prefix + filename,
+            'is_migrated': True,
+            'migration_date': migration_date
+        }
+    
+    async def _write_rows(self, rows: List[Dict], doc_ids: List[Any], errors: List[Tuple[Any, str]]) -> int:
+        """Write updated document rows by ID, recording failures in errors.
+        
+        Failures are reported once per batch through tqdm.write so they do not
+        break up the progress bar; per-document details go to migration_log.
+        """
         try:
-            # Update database record with GCS URLs
-            update_result = self.supabase.table("doc").update({
-                'gcs_url': gcs_url,
-                'gcs_public_url': public_url,
-                'gcs_path': gcs_path,
-                'is_migrated': True,
-                'migration_date': datetime.now().isoformat()
-            }).eq('id', doc_id).execute()
+            if self.db_pool is not None:
+                await self.db_pool.executemany(UPDATE_DOC_URLS_SQL, [
+                    (row['gcs_url'], row['gcs_public_url'], row['gcs_path'], doc_id)
+                    for row, doc_id in zip(rows, doc_ids)
+                ])
+                return len(rows)
             
-            if update_result.data:
-                self.stats.migrated_docs += 1
-            else:
-                error_msg = f"Failed to update database for document {doc_id}"
-                print(error_msg)
-                await self.log_update_error(doc_id, error_msg)
-                self.stats.errors += 1
-                
+            # The PostgREST client is synchronous; run it off the loop so writes overlap.
+            # Only the affected row count comes back, not the upserted rows.
+            update_result = await asyncio.to_thread(
+                self.supabase.table("doc").upsert(
+                    rows, on_conflict='id', returning="minimal", count="exact"
+                ).execute
+            )
         except Exception as e:
-            error_msg = f"Error updating document {doc_id}: {e}"
-            print(error_msg)
-            await self.log_update_error(doc_id, error_msg)
-            self.stats.errors += 1
+            tqdm.write(f"Error updating {len(rows)} documents: {e}")
+            errors.extend((doc_id, f"Error updating document {doc_id}: {e}") for doc_id in doc_ids)
+            return 0
+        
+        if update_result.count == 0:
+            tqdm.write(f"Failed to update database for {len(rows)} documents")
+            errors.extend((doc_id, f"Failed to update database for document {doc_id}") for doc_id in doc_ids)
+            return 0
+        
+        # Errors raise, so a response without a count still means every row was written
+        return len(rows) if update_result.count is None else update_result.count
     
     async def update_documents_for_project(self, project_id: int) -> int:
         """Update document URLs for a specific project."""
         
         try:
-            doc_records = self.supabase.table("doc").select("*").eq(
-                'project_id', project_id
-            ).execute()
+            # Same paged, batched pipeline as update_all_document_urls
+            doc_count = 0
+            async for page in self.iter_doc_pages(project_id=project_id):
+                doc_count += len(page)
+                await self.update_documents(page)
             
-            if not doc_records.data:
+            if not doc_count:
                 print(f"No documents found for project {project_id}")
-                return 0
-            
-            updated_count = 0
-            for doc in doc_records.data:
-                await self.update_single_document_url(doc)
-                updated_count += 1
-            
-            return updated_count
+            return doc_count
             
         except Exception as e:
             error_msg = f"Error updating documents for project {project_id}: {e}"
             print(error_msg)
             await self.log_update_error(None, error_msg)
             return 0
+        finally:
+            await self.flush_logs()
+    
+    @functools.cached_property
+    def gcs_bucket(self) -> storage.Bucket:
+        """Bucket on a GCS client created on first use and shared by every check."""
+        return create_storage_client(self.config.gcs).bucket(self.bucket_name)
     
     async def verify_gcs_file_exists(self, gcs_path: str) -> bool:
         """Optional: Verify file exists in GCS bucket before updating URL."""
         try:
-            client = storage.Client(project=self.gcs_project)
-            bucket = client.bucket(self.bucket_name)
-            blob = bucket.blob(gcs_path)
-            return blob.exists()
+            blob = self.gcs_bucket.blob(gcs_path)
+            return await asyncio.to_thread(blob.exists)
         except Exception:
             return False
     
     async def get_migration_progress(self) -> Dict:
-        """Get migration progress from database."""
+        """Get migration progress from database.
+        
+        Documents are counted by the database; no doc rows are transferred.
+        """
         try:
-            result = self.supabase.table("doc").select(
-                "id, is_migrated, gcs_url"
-            ).execute()
+            if self.db_pool is not None:
+                counts = await self.db_pool.fetchrow(MIGRATION_PROGRESS_SQL)
+                total_docs, migrated_docs = counts['total_docs'], counts['migrated_docs']
+            else:
+                # Head-only requests return just the exact count header
+                total_docs = self.supabase.table("doc").select(
+                    "id", count="exact", head=True
+                ).execute().count or 0
+                migrated_docs = self.supabase.table("doc").select(
+                    "id", count="exact", head=True
+                ).eq("is_migrated", True).execute().count or 0
             
-            if not result.data:
+            if not total_docs:
                 return {
                     "total_docs": 0,
                     "migrated_docs": 0,
@@ -168,8 +370,6 @@ class DocumentURLUpdater:
                     "completion_percentage": 0.0
                 }
             
-            total_docs = len(result.data)
-            migrated_docs = sum(1 for doc in result.data if doc.get('is_migrated'))
             pending_docs = total_docs - migrated_docs
             
             return {
@@ -185,20 +385,46 @@ class DocumentURLUpdater:
     
     async def log_update_error(self, doc_id: Optional[str], error_message: str) -> None:
         """Log URL update errors."""
+        await self.log_update_errors([(doc_id, error_message)])
+    
+    async def log_update_errors(self, errors: Sequence[Tuple[Any, str]]) -> None:
+        """Buffer URL update errors, inserting them once a full batch is waiting.
+        
+        Call flush_logs (or close) to write a partial batch.
+        """
+        if not errors:
+            return
+        
         if self.config.dry_run:
-            print(f"DRY RUN: Would log error for doc {doc_id}: {error_message}")
+            for doc_id, error_message in errors:
+                print(f"DRY RUN: Would log error for doc {doc_id}: {error_message}")
             return
-            
-        try:
-            self.supabase.table("migration_log").insert({
+        
+        created_at = datetime.now(timezone.utc).isoformat()
+        self._log_buffer.extend(
+            {
                 'doc_id': doc_id,
                 'log_type': 'url_update_error',
                 'message': error_message,
-                'created_at': datetime.now().isoformat()
-            }).execute()
-            
-        except Exception as e:
-            print(f"Failed to log update error: {e}")
+                'created_at': created_at
+            }
+            for doc_id, error_message in errors
+        )
+        if len(self._log_buffer) >= URL_UPDATE_BATCH_SIZE:
+            await self.flush_logs(full_batches_only=True)
+    
+    async def flush_logs(self, full_batches_only: bool = False) -> None:
+        """Insert buffered migration_log rows, one request per batch."""
+        async with self._log_lock:
+            while self._log_buffer and (
+                not full_batches_only or len(self._log_buffer) >= URL_UPDATE_BATCH_SIZE
+            ):
+                batch = self._log_buffer[:URL_UPDATE_BATCH_SIZE]
+                del self._log_buffer[:URL_UPDATE_BATCH_SIZE]
+                try:
+                    await asyncio.to_thread(self.supabase.table("migration_log").insert(batch, returning="minimal").execute)
+                except Exception as e:
+                    tqdm.write(f"Failed to log {len(batch)} update errors: {e}")
     
     def get_stats(self) -> MigrationStats:
         """Get current update statistics."""
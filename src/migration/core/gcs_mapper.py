@@ -1,34 +1,67 @@
 """Project-to-GCS path mapping functionality."""
 
+import re
+import threading
+from bisect import bisect_left
 from collections import defaultdict
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set
+import google.auth
+from google.auth.transport.requests import AuthorizedSession
 from google.cloud import storage
+from requests.adapters import HTTPAdapter
 from ..models.config import GCSConfig
 from ..models.migration import ProjectRecord, DocumentRecord
 
 
+# Connection pool size for shared GCS clients (requests defaults to 10)
+GCS_POOL_SIZE = 32
+
+# Folder holding one subfolder per project
+PROJECTS_PREFIX = "docs/Bennett Legal/"
+
+# Fallback folder for documents that were never assigned a project
+MAILROOM_PREFIX = f"{PROJECTS_PREFIX}zzz_mailroom_no_project_assigned/"
+
+# Runs of quotes become a single underscore in GCS folder names
+_QUOTES_RE = re.compile(r'"+')
+
+
+def sanitize_project_name(project_name: str) -> str:
+    """Sanitize project name for GCS path by replacing invalid characters with underscores."""
+    # Forward slashes (used as date separators) are replaced one for one
+    return _QUOTES_RE.sub('_', project_name).replace('/', '_')
+
+
+def create_storage_client(config: GCSConfig, pool_size: int = GCS_POOL_SIZE) -> storage.Client:
+    """Create a GCS client whose HTTP session can hold pool_size concurrent connections."""
+    credentials, _ = google.auth.default(scopes=storage.Client.SCOPE)
+    session = AuthorizedSession(credentials)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    return storage.Client(project=config.project_id, credentials=credentials, _http=session)
+
+
 class ProjectGCSMapper:
     """Maps ProjectId to GCS paths with variant handling."""
     
-    def __init__(self, config: GCSConfig):
+    def __init__(self, config: GCSConfig, client: Optional[storage.Client] = None):
         self.config = config
-        self.client = storage.Client(project=config.project_id)
+        self.client = client or storage.Client(project=config.project_id)
         self.bucket = self.client.bucket(config.bucket_name)
         self.project_path_map: Dict[int, str] = {}
+        # Names under MAILROOM_PREFIX, listed the first time a project falls back to it
+        self._mailroom_names: Optional[Set[str]] = None
+        self._mailroom_lock = threading.Lock()
     
     def sanitize_project_name(self, project_name: str) -> str:
         """Sanitize project name for GCS path by replacing invalid characters with underscores."""
-        import re
-        # Replace one or more consecutive quotes with a single underscore
-        sanitized = re.sub(r'"+', '_', project_name)
-        # Replace forward slashes (used as date separators) with underscores
-        sanitized = sanitized.replace('/', '_')
-        return sanitized
+        return sanitize_project_name(project_name)
         
     def build_project_mapping(
         self, 
         projects: List[ProjectRecord], 
-        doc_records: List[DocumentRecord]
+        doc_records: Iterable[DocumentRecord]
     ) -> Dict[int, str]:
         """Create ProjectId -> GCS path mapping with variant handling."""
         
@@ -37,100 +70,121 @@ class ProjectGCSMapper:
         docs_with_filenames_by_project = defaultdict(list)
         
         for doc in doc_records:
-            if doc.project_id:
-                docs_by_project[doc.project_id].append(doc)
-                if doc.filename and doc.filename.strip():
-                    docs_with_filenames_by_project[doc.project_id].append(doc)
+            project_id = doc.project_id
+            if project_id:
+                docs_by_project[project_id].append(doc)
+                # DocumentRecord normalizes blank filenames to None
+                if doc.filename:
+                    docs_with_filenames_by_project[project_id].append(doc)
         
-        for project in projects:
-            project_id = project.id
-            project_name = project.project_name
-            sanitized_name = self.sanitize_project_name(project_name)
-            
-            # Only try to map projects that have documents with filenames
-            docs_with_files = docs_with_filenames_by_project.get(project_id, [])
-            if not docs_with_files:
-                continue  # Skip projects with no documents or no filenames
-            
-            # Generate all possible paths to check (avoid duplicate network requests)
-            paths_to_check = [
-                # Original name patterns
-                f"docs/Bennett Legal/{project_name}",
-                # Sanitized name patterns (quotes -> underscores)
-                f"docs/Bennett Legal/{sanitized_name}",
-                # Numbered variants for original name
-                *[f"docs/Bennett Legal/{project_name} ({i})" for i in range(1, 10)],
-                # Numbered variants for sanitized name  
-                *[f"docs/Bennett Legal/{sanitized_name} ({i})" for i in range(1, 10)],
-                # Solar patterns
-                f"docs/Bennett Legal/Solar - {project_name}",
-                f"docs/Bennett Legal/Solar - {sanitized_name}",
-                # Solar - PNC patterns
-                f"docs/Bennett Legal/Solar - PNC {project_name}",
-                f"docs/Bennett Legal/Solar - PNC {sanitized_name}",
-                # Ultimate fallback: mailroom directory
-                "docs/Bennett Legal/zzz_mailroom_no_project_assigned",
-            ]
-            
-            # Remove duplicates while preserving order (original name gets priority)
-            seen = set()
-            unique_paths = []
-            for path in paths_to_check:
-                if path not in seen:
-                    seen.add(path)
-                    unique_paths.append(path)
-            
-            # Check paths in order of preference (excluding mailroom for now)
-            best_match_path = None
-            mailroom_path = "docs/Bennett Legal/zzz_mailroom_no_project_assigned"
-            
-            for path in unique_paths:
-                if path == mailroom_path:
-                    continue  # Skip mailroom in first pass
-                if self.gcs_path_exists(path):
-                    best_match_path = path
-                    break  # Take the first match (highest priority)
-            
-            # If no match found, check if documents exist in mailroom as ultimate fallback
-            if not best_match_path:
-                if self.check_documents_in_mailroom(docs_with_files):
-                    best_match_path = mailroom_path
-            
-            if best_match_path:
-                self.project_path_map[project_id] = best_match_path
+        # One delimited listing answers the existence checks for every project
+        top_level_entries = self.list_top_level_entries() if docs_with_filenames_by_project else None
+        
+        # Only try to map projects that have documents with filenames
+        mappable = [project for project in projects if project.id in docs_with_filenames_by_project]
+        
+        def resolve(project: ProjectRecord) -> Optional[str]:
+            return self._resolve_project_path(
+                project.project_name, docs_with_filenames_by_project[project.id], top_level_entries
+            )
+        
+        # Remaining probes are blocking I/O, so projects resolve concurrently;
+        # map keeps the results in project order
+        with ThreadPoolExecutor(max_workers=GCS_POOL_SIZE) as executor:
+            for project, best_match_path in zip(mappable, executor.map(resolve, mappable)):
+                if best_match_path:
+                    self.project_path_map[project.id] = best_match_path
         
         return self.project_path_map
     
+    def _resolve_project_path(
+        self,
+        project_name: str,
+        docs_with_files: List[DocumentRecord],
+        top_level_entries: Optional[List[str]]
+    ) -> Optional[str]:
+        """Find the GCS folder for a project, falling back to the mailroom."""
+        sanitized_name = self.sanitize_project_name(project_name)
+        
+        # Sanitized variants are only distinct when sanitizing changed the name
+        base_names = (project_name,) if sanitized_name == project_name else (project_name, sanitized_name)
+        
+        # Paths in order of preference; the original name gets priority in each pattern
+        paths_to_check = [
+            *(f"{PROJECTS_PREFIX}{name}" for name in base_names),
+            *(f"{PROJECTS_PREFIX}{name} ({i})" for name in base_names for i in range(1, 10)),
+            *(f"{PROJECTS_PREFIX}Solar - {name}" for name in base_names),
+            *(f"{PROJECTS_PREFIX}Solar - PNC {name}" for name in base_names),
+        ]
+        
+        # Take the first match (highest priority)
+        for path in paths_to_check:
+            if self._path_exists(path, top_level_entries):
+                return path
+        
+        # If no match found, check if documents exist in mailroom as ultimate fallback
+        if self.check_documents_in_mailroom(docs_with_files):
+            return MAILROOM_PREFIX.rstrip('/')
+        return None
+    
+    def list_top_level_entries(self) -> Optional[List[str]]:
+        """List the folder and blob names directly under PROJECTS_PREFIX, sorted.
+        
+        Returns None if the listing fails, in which case paths are probed one
+        at a time instead.
+        """
+        try:
+            blobs = self.bucket.list_blobs(prefix=PROJECTS_PREFIX, delimiter="/")
+            # Folder prefixes are only known once every page has been read
+            entries = [blob.name for blob in blobs]
+            entries.extend(blobs.prefixes)
+            return sorted(entries)
+        except Exception:
+            return None
+    
+    def _path_exists(self, path: str, top_level_entries: Optional[List[str]]) -> bool:
+        """Check if any blob name starts with path, using the listing when it covers path."""
+        # Names containing '/' reach below the listed level and need their own probe
+        if top_level_entries is None or '/' in path[len(PROJECTS_PREFIX):]:
+            return self.gcs_path_exists(path)
+        
+        # A blob name starts with path exactly when its top-level entry does
+        i = bisect_left(top_level_entries, path)
+        return i < len(top_level_entries) and top_level_entries[i].startswith(path)
+    
     def gcs_path_exists(self, path: str) -> bool:
         """Check if GCS path exists by listing blobs with prefix."""
         try:
-            blobs = self.bucket.list_blobs(prefix=path, max_results=1)
-            return any(True for _ in blobs)
+            # Only the name of at most one blob is needed to know the prefix is in use
+            blobs = self.bucket.list_blobs(prefix=path, max_results=1, fields="items(name),nextPageToken")
+            return next(iter(blobs), None) is not None
         except Exception:
             return False
     
     def check_documents_in_mailroom(self, docs_with_files: List) -> bool:
         """Check if any of the project's documents exist in the mailroom directory."""
-        mailroom_prefix = "docs/Bennett Legal/zzz_mailroom_no_project_assigned/"
-        
         try:
-            # Get a sample of filenames to check (first 3 to avoid too many requests)
+            # Get a sample of filenames to check (first 3, as before the mailroom was listed)
             sample_files = [doc.filename for doc in docs_with_files[:3] if doc.filename]
             
             if not sample_files:
                 return False
             
-            # Check if any of the sample files exist in mailroom
-            for filename in sample_files:
-                blob_path = f"{mailroom_prefix}{filename}"
-                blob = self.bucket.blob(blob_path)
-                if blob.exists():
-                    return True  # Found at least one file in mailroom
+            # Projects resolve on several threads; only one of them lists the mailroom
+            with self._mailroom_lock:
+                if self._mailroom_names is None:
+                    self._mailroom_names = self.list_mailroom_names()
             
-            return False
+            # Check if any of the sample files exist in mailroom
+            return any(filename in self._mailroom_names for filename in sample_files)
         except Exception:
             return False
     
+    def list_mailroom_names(self) -> Set[str]:
+        """List blob names under MAILROOM_PREFIX, relative to it, in one paged sweep."""
+        blobs = self.bucket.list_blobs(prefix=MAILROOM_PREFIX, fields="items(name),nextPageToken")
+        return {blob.name[len(MAILROOM_PREFIX):] for blob in blobs}
+    
     def generate_document_url(self, project_id: int, filename: str) -> Optional[str]:
         """Generate GCS URL for a document."""
         if project_id not in self.project_path_map:
@@ -4,21 +4,121 @@ Schema and data migration from Filevine Supabase tables to target org schema.
 """
 
 import asyncio
+import functools
 import uuid
 import json
 import re
 import hashlib
 import os
 import mimetypes
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
+from datetime import datetime, timezone
+import orjson
 from supabase import Client, create_client
 from supabase.client import ClientOptions
+from google.api_core.exceptions import NotFound
 from google.cloud import storage
 
 from ..models.config import MigrationConfig
 from ..utils.config_loader import load_config_from_env
+from ..utils.database_pool import DatabasePool
+
+
+# PostgREST caps a single response at 1000 rows by default
+PAGE_SIZE = 1000
+
+# Rows between progress lines; per-row output dominated long runs on a TTY
+PROGRESS_INTERVAL = 10000
+
+# Concurrent bucket-to-bucket copies; matches a storage.Client's default HTTP connection pool
+GCS_COPY_WORKERS = 10
+
+# Documents copied before their storage_files rows are written, so an interrupted
+# run leaves at most one chunk of copied files without rows
+DOCUMENT_COPY_CHUNK = GCS_COPY_WORKERS * 10
+
+# With a database URL, batches of at least EXECUTEMANY_THRESHOLD rows skip PostgREST;
+# from COPY_THRESHOLD rows on they are loaded with COPY instead of a prepared INSERT
+EXECUTEMANY_THRESHOLD = 10
+COPY_THRESHOLD = 100
+
+CONTACT_COLUMNS = (
+    'id', 'first_name', 'middle_name', 'last_name', 'full_name', 'is_individual',
+    'addresses', 'emails', 'phones', 'contact_type_ids', 'tags_v2', 'created_at', 'updated_at'
+)
+CASE_COLUMNS = (
+    'id', 'case_number', 'full_name', 'case_type_id', 'claimant_id', 'status', 'created_at', 'updated_at'
+)
+# COPY bypasses PostgREST's JSON coercion, so these are serialized or parsed up front
+JSONB_COLUMNS = frozenset({'addresses', 'emails', 'phones', 'contact_type_ids', 'tags_v2'})
+TIMESTAMP_COLUMNS = frozenset({'created_at', 'updated_at'})
+# Most contacts have no addresses, emails, phones or tags
+EMPTY_JSON_ARRAY = '[]'
+
+# Source person columns copied into contact JSONB entries
+ADDRESS_FIELDS = ('address1', 'address2', 'city', 'state', 'zip', 'country')
+PHONE_FIELDS = (('primary', 'phone'), ('mobile', 'mobilephone'), ('business', 'businessphone'))
+
+# Type lookups and migration user checks in one round trip; {schema} is the target org
+MIGRATION_BOOTSTRAP_SQL = """
+SELECT (SELECT COALESCE(jsonb_object_agg(name, id), '{{}}') FROM "{schema}".case_types) AS case_types,
+       (SELECT COALESCE(jsonb_object_agg(name, id), '{{}}') FROM "{schema}".contact_types) AS contact_types,
+       EXISTS (SELECT 1 FROM private.users WHERE id = $1::uuid) AS user_exists,
+       EXISTS (SELECT 1 FROM private.organization_members WHERE user_id = $1::uuid) AS member_exists
+"""
+
+# Create every case from public.project in one statement and return the project -> case map.
+# $1/$2 map Filevine project types to case type names, $3/$4 map person IDs to contact IDs.
+INSERT_CASES_FROM_PROJECTS_SQL = """
+WITH source AS (
+    SELECT p.id::text AS project_id,
+           gen_random_uuid() AS case_id,
+           p.projectname,
+           (SELECT ct.id FROM "{schema}".case_types ct
+             WHERE ct.name = COALESCE(type_map.case_type, 'litigation') LIMIT 1) AS case_type_id,
+           claimant.contact_id AS claimant_id,
+           p.createdate
+      FROM public.project p
+      LEFT JOIN unnest($1::text[], $2::text[]) AS type_map (filevine_type, case_type)
+        ON type_map.filevine_type = p.customprojecttypename
+      LEFT JOIN unnest($3::text[], $4::uuid[]) AS claimant (person_id, contact_id)
+        ON claimant.person_id = p.clientid::text
+), inserted AS (
+    INSERT INTO "{schema}".cases (id, case_number, full_name, case_type_id, claimant_id, status, created_at, updated_at)
+    SELECT case_id, gen_random_uuid()::text, projectname, case_type_id, claimant_id, 'active', createdate::timestamptz, now()
+      FROM source
+    RETURNING id
+)
+SELECT source.project_id, source.case_id::text AS case_id
+  FROM source JOIN inserted ON inserted.id = source.case_id
+"""
+
+
+def normalize_name(name: Optional[str]) -> str:
+    """Collapse whitespace and case so name lookups ignore formatting differences."""
+    return ' '.join(name.split()).lower() if name else ""
+
+
+def _pg_value(column: str, value: Any) -> Any:
+    """Convert a PostgREST-style row value into what asyncpg expects for its column."""
+    if value is None:
+        return None
+    if column in JSONB_COLUMNS:
+        if isinstance(value, list) and not value:
+            return EMPTY_JSON_ARRAY
+        # asyncpg's jsonb codec takes text, not bytes
+        return orjson.dumps(value).decode()
+    if column in TIMESTAMP_COLUMNS and isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value
+
+
+def _insert_sql(schema: str, table: str, columns: Tuple[str, ...]) -> str:
+    """Build a parameterized INSERT of one row into a target table."""
+    placeholders = ', '.join(f'${position}' for position in range(1, len(columns) + 1))
+    return f'INSERT INTO "{schema}".{table} ({", ".join(columns)}) VALUES ({placeholders})'
 
 
 class SchemaMigrator:
@@ -44,14 +144,6 @@ class SchemaMigrator:
             config.supabase.service_role_key
         )
         
-        # Create separate client for private schema tables
-        private_client_options = ClientOptions(schema="private")
-        self.supabase_private = create_client(
-            config.supabase.url, 
-            config.supabase.service_role_key,
-            options=private_client_options
-        )
-        
         # Store schema for table references
         # Note: Supabase client doesn't directly support schema switching, 
         # so we'll need to use .from_() with schema qualified table names
@@ -70,11 +162,19 @@ class SchemaMigrator:
             'notes_created': 0
         }
         
-        # Load case type mappings from database
-        self.case_type_ids = self._load_case_type_ids()
+        # Direct Postgres connection for bulk loads and lookups, connected on first use
+        self.db_pool = (
+            DatabasePool(config.supabase.db_url, min_size=10, max_size=50)
+            if config.supabase.db_url else None
+        )
+        
+        # Case and contact type mappings, loaded from the database on first use
+        self.case_type_ids: Optional[Dict[str, str]] = None
+        self.contact_type_ids: Optional[Dict[str, str]] = None
         
-        # Load contact type mappings from database
-        self.contact_type_ids = self._load_contact_type_ids()
+        # Existing contacts indexed by normalized name, loaded by migrate_contacts
+        self._contact_by_fullname: Dict[str, str] = {}
+        self._contact_by_first_last: Dict[Tuple[str, str], str] = {}
         
         # Set up GCS clients for file copying
         self.source_gcs_project = "webapp-466015"
@@ -83,21 +183,6 @@ class SchemaMigrator:
         self.dest_bucket_name = config.gcs.bucket_name  # bennett_bucket1
         self.local_data_path = Path("../data")  # Local sync of filevine-backup
         
-        # GCS clients - need credentials path for proper setup
-        if config.gcs.credentials_path and os.path.exists(config.gcs.credentials_path):
-            self.dest_storage_client = storage.Client.from_service_account_json(
-                config.gcs.credentials_path, project=self.dest_gcs_project
-            )
-            # For source project, we'll use default credentials
-            self.source_storage_client = storage.Client(project=self.source_gcs_project)
-        else:
-            # Use default credentials for both
-            self.dest_storage_client = storage.Client(project=self.dest_gcs_project)
-            self.source_storage_client = storage.Client(project=self.source_gcs_project)
-        
-        self.dest_bucket = self.dest_storage_client.bucket(self.dest_bucket_name)
-        self.source_bucket = self.source_storage_client.bucket(self.source_bucket_name)
-        
         # Filevine to target case type mapping
         self.filevine_case_type_map = {
             'Personal Injury Litigation': 'litigation',
@@ -114,18 +199,36 @@ class SchemaMigrator:
             'billing': ['bill', 'invoice', 'statement', 'payment', 'receipt'],
             'documents': []  # default category
         }
-        
-        # GCS client for file operations (initialize with error handling)
-        try:
-            # Use project ID from config if available
-            if hasattr(config, 'gcs') and hasattr(config.gcs, 'project_id'):
-                self.gcs_client = storage.Client(project=config.gcs.project_id)
-            else:
-                # Fallback to default credentials
-                self.gcs_client = storage.Client()
-        except Exception as e:
-            print(f"Warning: GCS client initialization failed: {e}")
-            self.gcs_client = None
+        # (keyword, category) pairs in category priority order, excluding the default
+        self._category_keywords = tuple(
+            (pattern, category)
+            for category, patterns in self.document_categories.items() if category != 'documents'
+            for pattern in patterns
+        )
+    
+    # GCS clients are only needed for document copies, so they are created on first use
+    @functools.cached_property
+    def dest_storage_client(self) -> storage.Client:
+        """Client for the destination project, using the configured service account if present."""
+        credentials_path = self.config.gcs.credentials_path
+        if credentials_path and os.path.exists(credentials_path):
+            return storage.Client.from_service_account_json(credentials_path, project=self.dest_gcs_project)
+        return storage.Client(project=self.dest_gcs_project)
+    
+    @functools.cached_property
+    def source_storage_client(self) -> storage.Client:
+        """Client for the source project, always using default credentials."""
+        return storage.Client(project=self.source_gcs_project)
+    
+    @functools.cached_property
+    def dest_bucket(self) -> storage.Bucket:
+        """Bucket that migrated documents are copied into."""
+        return self.dest_storage_client.bucket(self.dest_bucket_name)
+    
+    @functools.cached_property
+    def source_bucket(self) -> storage.Bucket:
+        """Filevine backup bucket that documents are copied from."""
+        return self.source_storage_client.bucket(self.source_bucket_name)
     
     def get_table(self, table_name: str):
         """Get a Supabase table reference with the configured schema."""
@@ -135,27 +238,92 @@ class SchemaMigrator:
         """Get a source table reference from the public schema."""
         return self.supabase_public.table(table_name)
     
-    def _load_case_type_ids(self) -> Dict[str, str]:
+    async def _iter_source(self, table_name: str, page_size: int = PAGE_SIZE) -> AsyncIterator[List[Dict]]:
+        """Yield rows of a public source table in ID order, one keyset page at a time.
+        
+        The next page is fetched in the background while the caller processes
+        and inserts the current one.
+        """
+        
+        def fetch_page(after_id: Any) -> List[Dict]:
+            query = self.get_source_table(table_name).select("*").order("id").limit(page_size)
+            if after_id is not None:
+                query = query.gt("id", after_id)
+            return query.execute().data or []
+        
+        next_page = asyncio.create_task(asyncio.to_thread(fetch_page, None))
+        try:
+            while page := await next_page:
+                if len(page) < page_size:
+                    yield page
+                    break
+                next_page = asyncio.create_task(asyncio.to_thread(fetch_page, page[-1]['id']))
+                yield page
+        finally:
+            next_page.cancel()
+    
+    @functools.cached_property
+    def supabase_private(self) -> Client:
+        """Client for private schema tables, only needed without a database URL."""
+        return create_client(
+            self.config.supabase.url, 
+            self.config.supabase.service_role_key,
+            options=ClientOptions(schema="private")
+        )
+    
+    async def _bulk_copy(self, table: str, rows: List[Dict[str, Any]], columns: Tuple[str, ...]):
+        """Load rows into a target table with a single COPY."""
+        records = [tuple(_pg_value(column, row.get(column)) for column in columns) for row in rows]
+        await self.db_pool.copy_records_to_table(table, records, columns, schema=self.target_org)
+    
+    async def _bulk_insert(self, table: str, rows: List[Dict[str, Any]], columns: Tuple[str, ...]):
+        """Insert rows into a target table with one prepared INSERT executed per row."""
+        records = [tuple(_pg_value(column, row.get(column)) for column in columns) for row in rows]
+        await self.db_pool.executemany(_insert_sql(self.target_org, table, columns), records)
+    
+    async def _insert_rows(self, table: str, rows: List[Dict[str, Any]], columns: Tuple[str, ...]) -> int:
+        """Insert rows into a target table and return how many were written.
+        
+        With a database URL configured, large batches go through COPY and
+        medium ones through executemany; everything else is sent as one
+        PostgREST insert.
+        """
+        if self.db_pool is not None and len(rows) >= COPY_THRESHOLD:
+            await self._bulk_copy(table, rows, columns)
+            return len(rows)
+        if self.db_pool is not None and len(rows) >= EXECUTEMANY_THRESHOLD:
+            await self._bulk_insert(table, rows, columns)
+            return len(rows)
+        
+        result = self.get_table(table).insert(rows).execute()
+        return len(result.data)
+    
+    async def close(self):
+        """Close the direct database connection pool, if one was opened."""
+        if self.db_pool is not None:
+            await self.db_pool.close()
+    
+    async def _fetch_id_names(self, table_name: str) -> List[Any]:
+        """Fetch the id and name of every row in a target lookup table."""
+        if self.db_pool is not None:
+            return await self.db_pool.fetch(f'SELECT id::text AS id, name FROM "{self.target_org}".{table_name}')
+        return self.get_table(table_name).select('id, name').execute().data
+    
+    async def _load_case_type_ids(self) -> Dict[str, str]:
         """Load case type IDs from the target database."""
         try:
-            result = self.get_table('case_types').select('id, name').execute()
-            case_type_map = {}
-            for case_type in result.data:
-                case_type_map[case_type['name']] = case_type['id']
-            return case_type_map
+            case_types = await self._fetch_id_names('case_types')
+            return {case_type['name']: case_type['id'] for case_type in case_types}
         except Exception as e:
             print(f"Warning: Could not load case types from database: {e}")
             # Return empty dict as fallback
             return {}
     
-    def _load_contact_type_ids(self) -> Dict[str, str]:
+    async def _load_contact_type_ids(self) -> Dict[str, str]:
         """Load contact type IDs from the target database."""
         try:
-            result = self.get_table('contact_types').select('id, name').execute()
-            contact_type_map = {}
-            for contact_type in result.data:
-                contact_type_map[contact_type['name']] = contact_type['id']
-            return contact_type_map
+            contact_types = await self._fetch_id_names('contact_types')
+            return {contact_type['name']: contact_type['id'] for contact_type in contact_types}
         except Exception as e:
             print(f"Warning: Could not load contact types from database: {e}")
             # Return empty dict as fallback
@@ -169,6 +337,12 @@ class SchemaMigrator:
             'data': data or {}
         })
     
+    def _validate_dry_run_rows(self, rows: List[Dict[str, Any]], required_fields: Tuple[str, ...], operation: str, label: str):
+        """Record a dry run error for every row missing one of the required fields."""
+        for row in rows:
+            if not all(row.get(field) for field in required_fields):
+                self._add_dry_run_error(operation, f"Missing required fields in {label}: {row.get('id', 'unknown')}", row)
+    
     def _execute_org_sql(self, sql: str, params: list = None):
         """Execute raw SQL for org schema operations (bypasses public. prefix issue)."""
         try:
@@ -227,18 +401,33 @@ class SchemaMigrator:
             
             # Ensure the user exists in private.users and private.organization_members
             try:
-                # Check if user exists in private.users
-                existing_user = self.supabase_private.table("users").select("id").eq("id", self.migration_user_id).execute()
+                if self.db_pool is not None:
+                    # Check both tables and load the type mappings in one query
+                    row = await self.db_pool.fetchrow(
+                        MIGRATION_BOOTSTRAP_SQL.format(schema=self.target_org), self.migration_user_id
+                    )
+                    user_exists, member_exists = row['user_exists'], row['member_exists']
+                    if self.case_type_ids is None:
+                        self.case_type_ids = json.loads(row['case_types'])
+                    if self.contact_type_ids is None:
+                        self.contact_type_ids = json.loads(row['contact_types'])
+                else:
+                    # Check if user exists in private.users
+                    existing_user = self.supabase_private.table("users").select("id").eq("id", self.migration_user_id).execute()
+                    user_exists = bool(existing_user.data)
+                    member_exists = False
+                    if user_exists:
+                        # Also check organization_members
+                        existing_member = self.supabase_private.table("organization_members").select("user_id").eq("user_id", self.migration_user_id).execute()
+                        member_exists = bool(existing_member.data)
                 
-                if not existing_user.data:
+                if not user_exists:
                     print(f"⚠️  Migration user not found in private.users")
                     print(f"Please ensure user with ID {self.migration_user_id} exists in private.users")
                 else:
                     print(f"✓ Migration user found in private.users")
                     
-                    # Also check organization_members
-                    existing_member = self.supabase_private.table("organization_members").select("user_id").eq("user_id", self.migration_user_id).execute()
-                    if existing_member.data:
+                    if member_exists:
                         print(f"✓ Migration user found in organization_members") 
                     
             except Exception as e:
@@ -333,11 +522,15 @@ class SchemaMigrator:
         """Check for any contact types missing from pre-existing set."""
         print("=== Checking for Missing Contact Types ===")
         
+        if self.contact_type_ids is None:
+            self.contact_type_ids = await self._load_contact_type_ids()
+        
         # Get source data from Filevine tables
         source_data = self.get_source_table("persontype").select("*").execute()
         
         new_contact_types = []
         found_types = set()
+        now_iso = datetime.now(timezone.utc).isoformat()
         
         for record in source_data.data:
             type_name = (record.get('persontypename') or '').strip()
@@ -351,8 +544,8 @@ class SchemaMigrator:
                 contact_type = {
                     'id': str(uuid.uuid4()),
                     'name': type_name,
-                    'created_at': datetime.now().isoformat(),
-                    'updated_at': datetime.now().isoformat()
+                    'created_at': now_iso,
+                    'updated_at': now_iso
                 }
                 new_contact_types.append(contact_type)
                 print(f"Found new contact type: {type_name}")
@@ -375,23 +568,64 @@ class SchemaMigrator:
         print(f"Total contact types available: {len(self.contact_type_ids)}")
         return self.contact_type_ids
     
-    async def find_existing_contact(self, first_name: str, middle_name: str, last_name: str) -> Optional[str]:
-        """Find existing contact by name combinations to avoid duplicates."""
+    def _index_contact(self, contact_id: str, first_name: str, last_name: str, full_name: str):
+        """Add a contact to the duplicate-detection indexes; earlier contacts win."""
+        if full_name := normalize_name(full_name):
+            self._contact_by_fullname.setdefault(full_name, contact_id)
+        self._contact_by_first_last.setdefault(
+            (normalize_name(first_name), normalize_name(last_name)), contact_id
+        )
+    
+    async def _fetch_existing_contacts(self) -> List[Any]:
+        """Fetch the id and name columns of every target contact."""
+        if self.db_pool is not None:
+            return await self.db_pool.fetch(
+                f'SELECT id::text AS id, first_name, last_name, full_name FROM "{self.target_org}".contacts'
+            )
+        
+        contacts = []
+        offset = 0
+        while True:
+            result = (
+                self.get_table("contacts")
+                .select("id, first_name, last_name, full_name")
+                .order("id")
+                .range(offset, offset + PAGE_SIZE - 1)
+                .execute()
+            )
+            contacts.extend(result.data)
+            if len(result.data) < PAGE_SIZE:
+                return contacts
+            offset += PAGE_SIZE
+    
+    async def _load_existing_contacts(self):
+        """Fetch all target contacts once and index them by name."""
+        self._contact_by_fullname.clear()
+        self._contact_by_first_last.clear()
         
-        # Skip duplicate detection if table doesn't exist yet
         try:
-            # Quick check if contacts table exists
-            self.get_table("contacts").select("id").limit(1).execute()
+            contacts = await self._fetch_existing_contacts()
         except Exception as e:
             if "does not exist" in str(e):
                 # Table doesn't exist yet, so no duplicates possible
-                return None
-            # Other error, continue with duplicate detection
+                return
+            raise
+        
+        for contact in contacts:
+            self._index_contact(contact['id'], contact['first_name'], contact['last_name'], contact['full_name'])
+        
+        print(f"Loaded {len(self._contact_by_first_last)} existing contact names for duplicate detection")
+    
+    def find_existing_contact(self, first_name: str, middle_name: str, last_name: str) -> Optional[str]:
+        """Find existing contact by name combinations to avoid duplicates.
+        
+        Looks up the indexes built by _load_existing_contacts, so no request is made.
+        """
         
         # Clean up names
-        first = first_name.strip() if first_name else ""
-        middle = middle_name.strip() if middle_name else ""
-        last = last_name.strip() if last_name else ""
+        first = normalize_name(first_name)
+        middle = normalize_name(middle_name)
+        last = normalize_name(last_name)
         
         # Try various name combinations
         search_combinations = []
@@ -409,22 +643,12 @@ class SchemaMigrator:
         
         # Search for existing contacts
         for full_name_combo in search_combinations:
-            try:
-                result = self.get_table("contacts").select("id").eq("full_name", full_name_combo).limit(1).execute()
-                if result.data:
-                    return result.data[0]['id']
-            except Exception:
-                continue
+            contact_id = self._contact_by_fullname.get(full_name_combo)
+            if contact_id:
+                return contact_id
                 
         # Also try individual field matches
-        try:
-            result = self.get_table("contacts").select("id").eq("first_name", first).eq("last_name", last).limit(1).execute()
-            if result.data:
-                return result.data[0]['id']
-        except Exception:
-            pass
-            
-        return None
+        return self._contact_by_first_last.get((first, last))
     
     async def migrate_contacts(self):
         """Migrate person -> contacts with JSONB fields and deduplication."""
@@ -432,97 +656,68 @@ class SchemaMigrator:
         
         # First, get total count of contacts
         try:
-            total_response = self.get_source_table("person").select("id").execute()
-            total_contacts = len(total_response.data)
+            total_response = self.get_source_table("person").select("id", count="exact", head=True).execute()
+            total_contacts = total_response.count
             print(f"Total contacts to process: {total_contacts}")
         except Exception as e:
             print(f"Warning: Could not get total count: {e}")
             total_contacts = None
         
-        # Get source data in batches
-        batch_size = 1000
-        offset = 0
         contact_id_map = {}
         duplicates_found = 0
         new_contacts_created = 0
         processed_total = 0
         
-        # For now, just process all contacts in a single batch to avoid pagination issues
-        print(f"Fetching all contacts in single batch")
-        source_data = self.get_source_table("person").select("*").execute()
-        
-        if not source_data.data:
-            print("No contact data found")
-            return contact_id_map
-        
-        print(f"Got {len(source_data.data)} contacts to process")
-        
-        # Process as a single batch
-        batches_to_process = [(source_data.data, 0)]
+        # Index existing contacts once instead of querying per source row
+        await self._load_existing_contacts()
         
-        for batch_data, batch_offset in batches_to_process:
+        # Stream source persons and insert each page before moving on
+        async for batch_data in self._iter_source("person"):
                 
             contacts_to_insert = []
+            now_iso = datetime.now(timezone.utc).isoformat()
             
-            processed_count = 0
             for record in batch_data:
-                processed_count += 1
-                if processed_count % 50 == 0:
-                    print(f"  Processing contact {processed_count}/{len(batch_data)}")
+                processed_total += 1
+                if processed_total % PROGRESS_INTERVAL == 0:
+                    print(f"  Processing contact {processed_total}/{total_contacts or '?'}")
                 
                 # Parse name components with null safety
                 first_name = (record.get('firstname') or '').strip()
                 middle_name = (record.get('middlename') or '').strip()
                 last_name = (record.get('lastname') or '').strip()
-                full_name = f"{first_name} {middle_name} {last_name}".strip()
+                full_name = ' '.join(filter(None, (first_name, middle_name, last_name)))
                 
                 # Clean up full_name
-                full_name = ' '.join(full_name.split())  # Remove extra spaces
+                if '  ' in full_name:
+                    full_name = ' '.join(full_name.split())  # Remove extra spaces
                 if not full_name:
                     full_name = record.get('displayname', 'Unknown Contact')
                 
                 # Check for existing contact
-                existing_id = await self.find_existing_contact(first_name, middle_name, last_name)
+                existing_id = self.find_existing_contact(first_name, middle_name, last_name)
                 if existing_id:
                     contact_id_map[record['id']] = existing_id
                     duplicates_found += 1
-                    print(f"Found duplicate contact: {full_name} -> {existing_id}")
                     continue
                 
-                # Build JSONB fields
+                # Build JSONB fields, reading each source column once
                 addresses = []
                 emails = []
                 phones = []
                 
-                # Collect contact info from record
-                address_fields = ['address1', 'address2', 'city', 'state', 'zip', 'country']
-                if any(record.get(field) for field in address_fields):
-                    address = {
-                        'type': 'primary',
-                        'address1': record.get('address1', ''),
-                        'address2': record.get('address2', ''),
-                        'city': record.get('city', ''),
-                        'state': record.get('state', ''),
-                        'zip': record.get('zip', ''),
-                        'country': record.get('country', '')
-                    }
-                    addresses.append(address)
+                address_values = [record.get(field, '') for field in ADDRESS_FIELDS]
+                if any(address_values):
+                    addresses.append({'type': 'primary', **dict(zip(ADDRESS_FIELDS, address_values))})
                 
-                if record.get('email'):
-                    emails.append({
-                        'type': 'primary',
-                        'email': record.get('email'),
-                        'is_primary': True
-                    })
+                email = record.get('email')
+                if email:
+                    emails.append({'type': 'primary', 'email': email, 'is_primary': True})
                 
-                phone_fields = ['phone', 'mobilephone', 'businessphone']
-                for phone_type, field in zip(['primary', 'mobile', 'business'], phone_fields):
-                    if record.get(field):
-                        phones.append({
-                            'type': phone_type,
-                            'phone': record.get(field),
-                            'is_primary': phone_type == 'primary'
-                        })
+                for phone_type, field in PHONE_FIELDS:
+                    phone = record.get(field)
+                    if phone:
+                        phones.append({'type': phone_type, 'phone': phone, 'is_primary': phone_type == 'primary'})
                 
                 new_contact_id = str(uuid.uuid4())
                 contact = {
@@ -537,12 +732,14 @@ class SchemaMigrator:
                     'phones': phones,
                     'contact_type_ids': [],  # Will populate later based on relationships
                     'tags_v2': [],
-                    'created_at': datetime.now().isoformat(),
-                    'updated_at': datetime.now().isoformat()
+                    'created_at': now_iso,
+                    'updated_at': now_iso
                 }
                 
                 contacts_to_insert.append(contact)
                 contact_id_map[record['id']] = new_contact_id
+                # Later source rows with the same name map to this contact
+                self._index_contact(new_contact_id, contact['first_name'], contact['last_name'], full_name)
                 new_contacts_created += 1
             
             # Insert batch
@@ -551,19 +748,14 @@ class SchemaMigrator:
                     print(f"[DRY RUN] Would insert batch of {len(contacts_to_insert)} new contacts")
                     self.dry_run_stats['contacts_created'] += len(contacts_to_insert)
                     # Validate contact data structure
-                    for contact in contacts_to_insert:
-                        try:
-                            if not contact.get('id') or not contact.get('full_name'):
-                                raise ValueError(f"Missing required fields in contact: {contact.get('id', 'unknown')}")
-                        except Exception as e:
-                            self._add_dry_run_error("insert_contacts", str(e), contact)
+                    self._validate_dry_run_rows(contacts_to_insert, ('id', 'full_name'), "insert_contacts", "contact")
                 else:
                     try:
                         print(f"Attempting to insert {len(contacts_to_insert)} contacts...")
-                        if len(contacts_to_insert) > 0:
+                        if new_contacts_created == len(contacts_to_insert):  # first batch only
                             print(f"Sample contact data: {contacts_to_insert[0]}")
-                        result = self.get_table("contacts").insert(contacts_to_insert).execute()
-                        print(f"Inserted batch of {len(result.data)} new contacts")
+                        inserted = await self._insert_rows("contacts", contacts_to_insert, CONTACT_COLUMNS)
+                        print(f"Inserted batch of {inserted} new contacts")
                     except Exception as e:
                         print(f"Error inserting contacts batch: {e}")
                         print(f"Exception type: {type(e)}")
@@ -572,6 +764,10 @@ class SchemaMigrator:
                         if self.dry_run:
                             self._add_dry_run_error("insert_contacts", str(e), {"batch_size": len(contacts_to_insert)})
         
+        if not processed_total:
+            print("No contact data found")
+            return contact_id_map
+        
         if self.dry_run:
             self.dry_run_stats['contacts_duplicates'] = duplicates_found
             print(f"[DRY RUN] Contact migration summary:")
@@ -586,66 +782,86 @@ class SchemaMigrator:
         
         return contact_id_map
     
+    async def _insert_cases_from_projects(self, contact_id_map: Dict[str, str]) -> Dict[str, str]:
+        """Create all cases with a single INSERT ... SELECT and return the project -> case map."""
+        rows = await self.db_pool.fetch(
+            INSERT_CASES_FROM_PROJECTS_SQL.format(schema=self.target_org),
+            list(self.filevine_case_type_map.keys()),
+            list(self.filevine_case_type_map.values()),
+            [str(person_id) for person_id in contact_id_map.keys()],
+            list(contact_id_map.values())
+        )
+        return {row['project_id']: row['case_id'] for row in rows}
+    
     async def migrate_cases(self, contact_id_map: Dict[str, str]):
         """Migrate project -> cases with UUID case numbers."""
         print("=== Migrating Cases ===")
         
-        # Get source data
-        source_data = self.get_source_table("project").select("*").execute()
+        if self.db_pool is not None and not self.dry_run:
+            # Source and target share a database, so map and insert entirely server-side
+            try:
+                case_id_map = await self._insert_cases_from_projects(contact_id_map)
+            except Exception as e:
+                print(f"Error migrating cases: {e}")
+                print(f"Exception type: {type(e)}")
+                return {}
+            print(f"Case migration complete. Mapped {len(case_id_map)} cases.")
+            return case_id_map
+        
+        if self.case_type_ids is None:
+            self.case_type_ids = await self._load_case_type_ids()
         
-        cases_to_insert = []
         case_id_map = {}
+        now_iso = datetime.now(timezone.utc).isoformat()
         
-        for record in source_data.data:
-            case_id = str(uuid.uuid4())
-            case_number = str(uuid.uuid4())  # UUID-based case number
-            
-            # Map case type
-            filevine_type = record.get('customprojecttypename', '')
-            target_case_type = self.filevine_case_type_map.get(filevine_type, 'litigation')  # Default to litigation
-            case_type_id = self.case_type_ids.get(target_case_type)
-            
-            # Map claimant (client)
-            claimant_id = None
-            if record.get('clientid'):
-                claimant_id = contact_id_map.get(str(record['clientid']))
+        # Stream source projects and insert each page as it is mapped
+        async for source_page in self._iter_source("project"):
+            cases_to_insert = []
             
-            case = {
-                'id': case_id,
-                'case_number': case_number,
-                'full_name': record.get('projectname', 'Unknown Case'),
-                'case_type_id': case_type_id,
-                'claimant_id': claimant_id,
-                'status': 'active',  # Default status
-                'created_at': record.get('createdate', datetime.now().isoformat()),
-                'updated_at': datetime.now().isoformat()
-            }
-            
-            cases_to_insert.append(case)
-            case_id_map[record['id']] = case_id
+            for record in source_page:
+                case_id = str(uuid.uuid4())
+                case_number = str(uuid.uuid4())  # UUID-based case number
+                
+                # Map case type
+                filevine_type = record.get('customprojecttypename', '')
+                target_case_type = self.filevine_case_type_map.get(filevine_type, 'litigation')  # Default to litigation
+                case_type_id = self.case_type_ids.get(target_case_type)
+                
+                # Map claimant (client)
+                claimant_id = None
+                if record.get('clientid'):
+                    claimant_id = contact_id_map.get(str(record['clientid']))
+                
+                case = {
+                    'id': case_id,
+                    'case_number': case_number,
+                    'full_name': record.get('projectname', 'Unknown Case'),
+                    'case_type_id': case_type_id,
+                    'claimant_id': claimant_id,
+                    'status': 'active',  # Default status
+                    'created_at': record.get('createdate', now_iso),
+                    'updated_at': now_iso
+                }
+                
+                cases_to_insert.append(case)
+                case_id_map[record['id']] = case_id
+                
+                if len(case_id_map) % PROGRESS_INTERVAL == 0:
+                    print(f"Processed {len(case_id_map)} cases...")
             
-            if len(cases_to_insert) % 100 == 0:
-                print(f"Processed {len(cases_to_insert)} cases...")
-        
-        # Insert all cases
-        if cases_to_insert:
+            # Insert this page of cases
             if self.dry_run:
                 print(f"[DRY RUN] Would insert {len(cases_to_insert)} cases")
-                self.dry_run_stats['cases_created'] = len(cases_to_insert)
+                self.dry_run_stats['cases_created'] += len(cases_to_insert)
                 # Validate case data structure
-                for case in cases_to_insert:
-                    try:
-                        if not case.get('id') or not case.get('case_number'):
-                            raise ValueError(f"Missing required fields in case: {case.get('id', 'unknown')}")
-                    except Exception as e:
-                        self._add_dry_run_error("insert_cases", str(e), case)
+                self._validate_dry_run_rows(cases_to_insert, ('id', 'case_number'), "insert_cases", "case")
             else:
                 try:
                     print(f"Attempting to insert {len(cases_to_insert)} cases...")
-                    if len(cases_to_insert) > 0:
+                    if len(case_id_map) == len(cases_to_insert):  # first page only
                         print(f"Sample case data: {cases_to_insert[0]}")
-                    result = self.get_table("cases").insert(cases_to_insert).execute()
-                    print(f"Successfully migrated {len(result.data)} cases")
+                    inserted = await self._insert_rows("cases", cases_to_insert, CASE_COLUMNS)
+                    print(f"Successfully migrated {inserted} cases")
                 except Exception as e:
                     print(f"Error migrating cases: {e}")
                     print(f"Exception type: {type(e)}")
@@ -663,12 +879,9 @@ class SchemaMigrator:
         """Categorize document based on filename patterns."""
         filename_lower = filename.lower()
         
-        for category, patterns in self.document_categories.items():
-            if category == 'documents':  # Skip default category
-                continue
-            for pattern in patterns:
-                if pattern in filename_lower:
-                    return category
+        for pattern, category in self._category_keywords:
+            if pattern in filename_lower:
+                return category
         
         return 'documents'  # Default category
 
@@ -777,6 +990,9 @@ class SchemaMigrator:
         
         file_id_map = {}
         folders_created = set()
+        now_iso = datetime.now(timezone.utc).isoformat()
+        # (doc_id, filename, source blob, destination blob, file record) waiting to be copied
+        pending_files = []
         
         for doc in documents:
             doc_id = str(doc['id'])
@@ -865,8 +1081,8 @@ class SchemaMigrator:
                 'checksum': checksum,
                 'version': 1,
                 'uploaded_by': self.migration_org_user_id,
-                'created_at': doc.get('createdate', datetime.now().isoformat()),
-                'updated_at': datetime.now().isoformat(),
+                'created_at': doc.get('createdate', now_iso),
+                'updated_at': now_iso,
                 'is_encrypted': False,  # Files from migration are not encrypted initially
                 'encryption_key_version': None
             }
@@ -874,31 +1090,45 @@ class SchemaMigrator:
             if self.dry_run:
                 file_id_map[doc_id] = file_id
                 self.dry_run_stats['files_created'] += 1
-            else:
-                try:
-                    # First copy the file to the destination bucket
-                    copy_success = self.copy_file_to_destination_bucket(source_blob_name, gcs_blob_name)
-                    
-                    if copy_success:
-                        # Only create database record if file copy succeeded
-                        self.get_table("storage_files").insert(file_record).execute()
-                        file_id_map[doc_id] = file_id
-                        print(f"✓ Migrated document {filename}")
-                    else:
-                        print(f"⚠️ Skipped database record for {filename} (file copy failed)")
-                    
-                except Exception as e:
-                    print(f"Error creating file record for document {doc_id}: {e}")
-            
-            if len(file_id_map) % 100 == 0:
-                if self.dry_run:
+                if len(file_id_map) % 100 == 0:
                     print(f"[DRY RUN] Would process {len(file_id_map)} documents...")
-                else:
-                    print(f"Processed {len(file_id_map)} documents...")
+            else:
+                pending_files.append((doc_id, filename, source_blob_name, gcs_blob_name, file_record))
+                if len(pending_files) >= DOCUMENT_COPY_CHUNK:
+                    await self._copy_and_record_files(pending_files, file_id_map)
+                    pending_files = []
+        
+        if pending_files:
+            await self._copy_and_record_files(pending_files, file_id_map)
         
         print(f"Document migration complete. Migrated {len(file_id_map)} documents.")
         return file_id_map
 
+    async def _copy_and_record_files(
+        self,
+        pending_files: List[Tuple[str, str, str, str, Dict[str, Any]]],
+        file_id_map: Dict[str, str]
+    ) -> None:
+        """Copy a chunk of documents concurrently, then record only those that arrived."""
+        copied = await asyncio.to_thread(
+            self.copy_files_to_destination_bucket,
+            [(source_blob_name, gcs_blob_name) for _, _, source_blob_name, gcs_blob_name, _ in pending_files]
+        )
+        for (doc_id, filename, _, _, file_record), copy_success in zip(pending_files, copied):
+            if not copy_success:
+                print(f"⚠️ Skipped database record for {filename} (file copy failed)")
+                continue
+            try:
+                self.get_table("storage_files").insert(file_record).execute()
+                file_id_map[doc_id] = file_record['id']
+                print(f"✓ Migrated document {filename}")
+            except Exception as e:
+                print(f"Error creating file record for document {doc_id}: {e}")
+                continue
+            
+            if len(file_id_map) % 100 == 0:
+                print(f"Processed {len(file_id_map)} documents...")
+
     def get_mime_type(self, filename: str) -> str:
         """Get MIME type from filename extension."""
         mime_type, _ = mimetypes.guess_type(filename)
@@ -970,42 +1200,45 @@ class SchemaMigrator:
                 print(f"Error: dest_bucket is string, not bucket object: {self.dest_bucket}")
                 return False
             
-            # Check if source blob exists
+            # Copy blob server-side; large objects can take several rewrite calls
             source_blob = self.source_bucket.blob(source_blob_name)
-            if not source_blob.exists():
-                print(f"Warning: Source file not found in GCS: {source_blob_name}")
-                return False
-            
-            # Copy blob from source to destination
             dest_blob = self.dest_bucket.blob(dest_blob_name)
-            dest_blob.rewrite(source_blob)
+            token, _, _ = dest_blob.rewrite(source_blob)
+            while token is not None:
+                token, _, _ = dest_blob.rewrite(source_blob, token=token)
             print(f"✓ Copied {source_blob_name} -> {dest_blob_name}")
             return True
             
+        except NotFound:
+            print(f"Warning: Source file not found in GCS: {source_blob_name}")
+            return False
         except Exception as e:
             print(f"Error copying file {source_blob_name}: {e}")
             print(f"Debug - source_bucket type: {type(self.source_bucket)}")
             print(f"Debug - dest_bucket type: {type(self.dest_bucket)}")
             return False
 
+    def copy_files_to_destination_bucket(self, copies: List[Tuple[str, str]]) -> List[bool]:
+        """Copy (source, destination) blob pairs concurrently; results follow the input order."""
+        # Create the lazy clients here rather than racing to create them in the workers
+        self.source_bucket, self.dest_bucket
+        with ThreadPoolExecutor(max_workers=GCS_COPY_WORKERS) as executor:
+            return list(executor.map(lambda pair: self.copy_file_to_destination_bucket(*pair), copies))
+
     async def copy_gcs_file(self, source_blob_name: str, target_blob_name: str) -> bool:
         """Copy file from source bucket to target bucket."""
-        if not self.gcs_client:
-            print(f"Warning: GCS client not available, skipping file copy: {source_blob_name}")
-            return False
-            
         try:
-            source_bucket = self.gcs_client.bucket(self.source_bucket)
-            target_bucket = self.gcs_client.bucket(self.target_bucket)
+            source_bucket = self.dest_storage_client.bucket(self.source_bucket_name)
+            target_bucket = self.dest_storage_client.bucket(self.dest_bucket_name)
             
             source_blob = source_bucket.blob(source_blob_name)
             if not source_blob.exists():
-                print(f"Source file not found: gs://{self.source_bucket}/{source_blob_name}")
+                print(f"Source file not found: gs://{self.source_bucket_name}/{source_blob_name}")
                 return False
             
             # Copy blob to target bucket
             target_bucket.copy_blob(source_blob, target_bucket, target_blob_name)
-            print(f"Copied: gs://{self.source_bucket}/{source_blob_name} -> gs://{self.target_bucket}/{target_blob_name}")
+            print(f"Copied: gs://{self.source_bucket_name}/{source_blob_name} -> gs://{self.dest_bucket_name}/{target_blob_name}")
             return True
             
         except Exception as e:
@@ -1167,6 +1400,7 @@ CREATE INDEX IF NOT EXISTS idx_notes_date ON "{self.target_org}".notes (original
             
             migrated_count = 0
             fields_to_insert = []
+            now_iso = datetime.now(timezone.utc).isoformat()
             
             for field in custom_fields:
                 # Map the custom field data
@@ -1186,8 +1420,8 @@ CREATE INDEX IF NOT EXISTS idx_notes_date ON "{self.target_org}".notes (original
                     },
                     'source_table': 'customfield',
                     'source_id': str(field['id']),
-                    'created_at': datetime.now().isoformat(),
-                    'updated_at': datetime.now().isoformat()
+                    'created_at': now_iso,
+                    'updated_at': now_iso
                 }
                 
                 fields_to_insert.append(field_record)
@@ -1232,6 +1466,7 @@ CREATE INDEX IF NOT EXISTS idx_notes_date ON "{self.target_org}".notes (original
             
             migrated_count = 0
             notes_to_insert = []
+            now_iso = datetime.now(timezone.utc).isoformat()
             
             for note in notes:
                 # Map note data
@@ -1245,8 +1480,8 @@ CREATE INDEX IF NOT EXISTS idx_notes_date ON "{self.target_org}".notes (original
                     'source_table': 'note',
                     'source_id': str(note['id']),
                     'original_date': note.get('createdat'),
-                    'created_at': datetime.now().isoformat(),
-                    'updated_at': datetime.now().isoformat()
+                    'created_at': now_iso,
+                    'updated_at': now_iso
                 }
                 
                 # Map to case if project ID exists (projects become cases)
@@ -1306,6 +1541,8 @@ async def main():
     
     # Print dry run summary if in dry run mode
     migrator.print_dry_run_summary()
+    
+    await migrator.close()
 
 
 if __name__ == "__main__":
@@ -1,7 +1,7 @@
 """Supabase data migration functionality."""
 
 import asyncio
-from typing import List, Dict, Any, Optional
+from typing import Iterable, List, Dict, Any, Optional
 import pyodbc
 from supabase import create_client, Client
 from tqdm import tqdm
@@ -259,8 +259,12 @@ class SupabaseMigrator:
             
         return converted
     
-    async def migrate_all_tables(self, table_names: List[str]) -> MigrationStats:
-        """Migrate multiple tables in sequence."""
+    async def migrate_all_tables(self, table_names: List[str], export_failures: bool = True) -> MigrationStats:
+        """Migrate multiple tables in sequence.
+        
+        Pass export_failures=False when the failed batches will be merged into
+        another migrator and exported from there.
+        """
         
         print(f"Starting migration of {len(table_names)} tables")
         
@@ -272,13 +276,19 @@ class SupabaseMigrator:
         print(f"Total errors: {self.stats.errors}")
         
         # Export failures to CSV if any occurred
-        if self.failed_batches:
+        if export_failures and self.failed_batches:
             failure_file = self.export_failures_to_csv()
             if failure_file:
                 print(f"Failed batches exported to: {failure_file}")
         
         return self.stats
     
+    def merge(self, other: "SupabaseMigrator") -> None:
+        """Fold another migrator's statistics and failed batches into this one."""
+        for field in MigrationStats.model_fields:
+            setattr(self.stats, field, getattr(self.stats, field) + getattr(other.stats, field))
+        self.failed_batches.extend(other.failed_batches)
+    
     async def get_table_list(self) -> List[str]:
         """Get list of all tables from MSSQL database."""
         try:
@@ -674,16 +684,25 @@ CREATE POLICY "Users can access {table_name_lower}" ON "{table_name_lower}"
             print(f"Failed to export failures to CSV: {e}")
             return None
     
-    async def retry_failed_batches(self) -> int:
-        """Retry all failed batches, attempting individual record insertion."""
-        if not self.failed_batches:
-            print("No failed batches to retry")
-            return 0
+    async def retry_failed_batches(self, failures: Optional[Iterable[Dict[str, Any]]] = None) -> int:
+        """Retry failed batches, attempting individual record insertion.
+        
+        The recorded failed_batches are retried unless failures is given. That
+        may be a lazy iterable (e.g. read from a failure CSV); its batches are
+        retried as they arrive and only those with records still failing are
+        kept in failed_batches.
+        """
+        recorded = failures is None
+        if recorded:
+            if not self.failed_batches:
+                print("No failed batches to retry")
+                return 0
+            print(f"Retrying {len(self.failed_batches)} failed batches...")
+            failures = self.failed_batches[:]  # Copy list to modify during iteration
         
-        print(f"Retrying {len(self.failed_batches)} failed batches...")
         retry_count = 0
         
-        for failure in self.failed_batches[:]:  # Copy list to modify during iteration
+        for failure in failures:
             table_name = failure['table_name']
             batch_data = failure['batch_data']
             
@@ -702,10 +721,13 @@ CREATE POLICY "Users can access {table_name_lower}" ON "{table_name_lower}"
             if successful_records > 0:
                 print(f"Successfully inserted {successful_records}/{len(batch_data)} records for {table_name}")
                 retry_count += successful_records
-                
-                # Remove this failure from the list if all records succeeded
-                if successful_records == len(batch_data):
-                    self.failed_batches.remove(failure)
+            
+            # Only batches whose records all succeeded are resolved
+            resolved = successful_records == len(batch_data)
+            if recorded and resolved:
+                self.failed_batches.remove(failure)
+            elif not recorded and not resolved:
+                self.failed_batches.append(failure)
         
         print(f"Retry completed: {retry_count} additional records inserted")
         return retry_count
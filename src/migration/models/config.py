@@ -1,7 +1,7 @@
 """Configuration models for migration system."""
 
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DatabaseConfig(BaseModel):
@@ -43,10 +43,13 @@ class SupabaseConfig(BaseModel):
     url: str
     key: str
     service_role_key: str
+    db_url: Optional[str] = None  # Direct Postgres DSN for bulk writes; PostgREST is used without it
 
 
 class GCSConfig(BaseModel):
     """Google Cloud Storage configuration."""
+    model_config = ConfigDict(frozen=True)
+    
     project_id: str = "dataengineerng"
     bucket_name: str = "bennett_bucket1"
     credentials_path: Optional[str] = None
@@ -54,8 +57,18 @@ class GCSConfig(BaseModel):
 
 class TurbopufferConfig(BaseModel):
     """Turbopuffer configuration."""
+    model_config = ConfigDict(frozen=True)
+    
     api_key: str
     region: str = "gcp-us-central1"
+    max_retries: int = Field(
+        default=5,
+        description="Retries with exponential backoff on rate limits, timeouts and 5xx responses"
+    )
+    metadata_only: bool = Field(
+        default=False,
+        description="Index documents without the placeholder vector"
+    )
 
 
 class MigrationConfig(BaseModel):
@@ -70,5 +83,7 @@ class MigrationConfig(BaseModel):
 
 class IndexingConfig(BaseModel):
     """Document indexing configuration."""
+    model_config = ConfigDict(frozen=True)
+    
     gcs: GCSConfig
     turbopuffer: TurbopufferConfig
\ No newline at end of file
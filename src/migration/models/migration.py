@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from typing import Optional, Dict, Any
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 
 
 class ProjectRecord(BaseModel):
@@ -20,6 +20,12 @@ class DocumentRecord(BaseModel):
     size: Optional[int]
     uploader_id: Optional[int]
     upload_date: Optional[datetime]
+    
+    @field_validator('filename')
+    @classmethod
+    def blank_filename_is_none(cls, filename: Optional[str]) -> Optional[str]:
+        """Treat empty and whitespace-only filenames as missing."""
+        return filename if filename and not filename.isspace() else None
 
 
 class MigrationLogEntry(BaseModel):
@@ -0,0 +1,64 @@
+"""Pooled asyncpg connections for direct Supabase Postgres writes."""
+
+from typing import List, Optional, Sequence
+
+import asyncpg
+
+
+class DatabasePool:
+    """asyncpg connection pool created on first use.
+
+    Prepared statement caching is disabled so the pool also works through
+    Supavisor or PgBouncer in transaction mode.
+    """
+
+    def __init__(self, dsn: str, min_size: int = 1, max_size: int = 10):
+        self.dsn = dsn
+        self.min_size = min_size
+        self.max_size = max(min_size, max_size)
+        self._pool: Optional[asyncpg.Pool] = None
+
+    async def get_pool(self) -> asyncpg.Pool:
+        """Return the pool, connecting it on the running event loop if needed."""
+        if self._pool is None:
+            self._pool = await asyncpg.create_pool(
+                dsn=self.dsn,
+                min_size=self.min_size,
+                max_size=self.max_size,
+                max_inactive_connection_lifetime=300,
+                statement_cache_size=0
+            )
+        return self._pool
+
+    async def fetchrow(self, query: str, *args) -> Optional[asyncpg.Record]:
+        """Run a query on a pooled connection and return its first row."""
+        pool = await self.get_pool()
+        async with pool.acquire() as conn:
+            return await conn.fetchrow(query, *args)
+
+    async def fetch(self, query: str, *args) -> List[asyncpg.Record]:
+        """Run a query on a pooled connection and return all rows."""
+        pool = await self.get_pool()
+        async with pool.acquire() as conn:
+            return await conn.fetch(query, *args)
+
+    async def executemany(self, query: str, args: list) -> None:
+        """Run a statement once per argument tuple in a single transaction."""
+        pool = await self.get_pool()
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.executemany(query, args)
+
+    async def copy_records_to_table(
+        self, table: str, records: list, columns: Sequence[str], schema: Optional[str] = None
+    ) -> None:
+        """Bulk load records into a table with COPY on a pooled connection."""
+        pool = await self.get_pool()
+        async with pool.acquire() as conn:
+            await conn.copy_records_to_table(table, records=records, columns=columns, schema_name=schema)
+
+    async def close(self) -> None:
+        """Close all pooled connections; the next use opens a new pool."""
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            await pool.close()
@@ -0,0 +1,24 @@
+"""Test migration CLI helpers."""
+
+import pytest
+
+# pyodbc needs the system unixODBC library to import
+pytest.importorskip("pyodbc", exc_type=ImportError)
+
+from src.migration.cli import _document_records
+
+
+def test_document_records_normalize_blank_filenames_and_unselected_columns():
+    """Test blank filenames become None and columns that were not selected are None."""
+
+    records = _document_records(
+        [(1, 7, "a.pdf"), (2, 7, ""), (3, None, "   ")],
+        ["ID", "ProjectID", "Filename"]
+    )
+
+    assert [record.filename for record in records] == ["a.pdf", None, None]
+    assert [record.project_id for record in records] == [7, 7, None]
+    assert all(record.doc_key is None and record.upload_date is None for record in records)
+
+    records = _document_records([(4, "")], ["ID", "DocKey"])
+    assert records[0].filename is None and records[0].doc_key == ""
@@ -97,4 +97,27 @@ def test_create_sample_env_file():
         content = sample_file.read_text()
         assert "MSSQL_SERVER=" in content
         assert "SUPABASE_URL=" in content
-        assert "GCS_PROJECT_ID=" in content
\ No newline at end of file
+        assert "GCS_PROJECT_ID=" in content
+
+
+def test_load_indexing_config_cached_and_frozen(monkeypatch):
+    """Test indexing config is read once and cannot be mutated."""
+    
+    from pydantic import ValidationError
+    from src.migration.utils.config_loader import load_indexing_config
+    
+    monkeypatch.setenv("TURBOPUFFER_API_KEY", "test-key")
+    monkeypatch.setenv("GCS_BUCKET_NAME", "test-bucket")
+    load_indexing_config.cache_clear()
+    
+    try:
+        config = load_indexing_config()
+        
+        assert config.turbopuffer.api_key == "test-key"
+        assert config.gcs.bucket_name == "test-bucket"
+        assert load_indexing_config() is config
+        
+        with pytest.raises(ValidationError):
+            config.gcs.bucket_name = "other-bucket"
+    finally:
+        load_indexing_config.cache_clear()
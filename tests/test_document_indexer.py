@@ -0,0 +1,345 @@
+"""Test document indexer functionality."""
+
+import httpx
+import pytest
+import turbopuffer
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from src.indexing.document_indexer import (
+    AdaptiveBatchSize, BackgroundBatchUploader, BlobGenerationState, DocumentIndexer,
+    ScanCursor, scoped_state_path, stable_blob_ids
+)
+from src.indexing.turbopuffer_client import DocumentColumns
+from src.migration.models.config import GCSConfig, TurbopufferConfig, IndexingConfig
+from src.migration.models.migration import ProjectRecord, DocumentRecord
+
+
+@pytest.fixture
+def indexing_config():
+    """Create indexing config for testing."""
+    return IndexingConfig(
+        gcs=GCSConfig(project_id="test-project", bucket_name="test-bucket"),
+        turbopuffer=TurbopufferConfig(api_key="test-key")
+    )
+
+
+class FakeBlobIterator(list):
+    """List of blobs exposing the prefixes found by a delimited listing."""
+
+    def __init__(self, names, prefixes=(), generations=None):
+        generations = generations or {}
+        blobs = []
+        for name in names:
+            blob = Mock()
+            blob.name = name
+            blob.generation = generations.get(name, 1)
+            blobs.append(blob)
+        super().__init__(blobs)
+        self.prefixes = set(prefixes)
+
+
+def fake_list_blobs(names, generations=None):
+    """Build a list_blobs stand-in that honours prefix and delimiter."""
+
+    def list_blobs(bucket, prefix="", delimiter=None, start_offset=None, **kwargs):
+        matching = [
+            name for name in sorted(names)
+            if name.startswith(prefix) and (start_offset is None or name >= start_offset)
+        ]
+        if not delimiter:
+            return FakeBlobIterator(matching, generations=generations)
+        direct = [name for name in matching if delimiter not in name[len(prefix):]]
+        prefixes = {
+            prefix + name[len(prefix):].split(delimiter)[0] + delimiter
+            for name in matching if delimiter in name[len(prefix):]
+        }
+        return FakeBlobIterator(direct, prefixes, generations)
+
+    return list_blobs
+
+
+@pytest.fixture
+def indexer(indexing_config):
+    """Create a document indexer with GCS and Turbopuffer mocked out."""
+    with patch('src.indexing.document_indexer.create_storage_client'), \
+         patch('src.indexing.document_indexer.TurbopufferClient'):
+        yield DocumentIndexer(indexing_config)
+
+
+def test_stable_blob_ids_deterministic():
+    """Test blob IDs are stable and full 64-bit hex."""
+
+    names = ["docs/Bennett Legal/Project A/a.pdf", "docs/Bennett Legal/Project A/b.pdf"]
+
+    ids = stable_blob_ids(names)
+
+    assert ids == stable_blob_ids(names)
+    assert ids[0] != ids[1]
+    assert all(doc_id.startswith("gcs_") and len(doc_id) == 4 + 16 for doc_id in ids)
+
+
+def test_create_document_data_from_blob(indexer):
+    """Test document data creation from a GCS blob."""
+
+    columns = DocumentColumns()
+
+    added = indexer._create_document_data_from_blob(
+        columns, "docs/Bennett Legal/Project A/test.pdf", "gcs_0123456789abcdef"
+    )
+
+    assert added is True
+    doc_data = {key: values[0] for key, values in columns.to_upsert_columns().items()}
+    assert doc_data['id'] == "gcs_0123456789abcdef"
+    assert doc_data['filename'] == "test.pdf"
+    assert doc_data['project_name'] == "Project A"
+    assert doc_data['gcs_url'] == "gs://test-bucket/docs/Bennett Legal/Project A/test.pdf"
+    assert doc_data['public_url'] == (
+        "https://storage.googleapis.com/test-bucket/docs/Bennett Legal/Project A/test.pdf"
+    )
+
+
+def test_create_document_data_from_blob_too_shallow(indexer):
+    """Test blobs without a project folder are not indexed."""
+
+    columns = DocumentColumns()
+
+    assert indexer._create_document_data_from_blob(columns, "docs/file.pdf", "gcs_1") is False
+    assert len(columns) == 0
+
+
+def test_submit_blob_batch_checkpoints_batches_with_nothing_to_index(indexer):
+    """Test a batch of only shallow blobs is still recorded and advances its shard."""
+
+    checkpoints = []
+    with BackgroundBatchUploader(indexer.turbopuffer_client, on_checkpoint=checkpoints.append) as uploader:
+        submitted = indexer._submit_blob_batch(uploader, [("docs/file.pdf", 3)], {"docs/x/": "docs/x/a"})
+
+    assert submitted == 0
+    assert checkpoints == [({"docs/x/": "docs/x/a"}, [("docs/file.pdf", 3)])]
+    indexer.turbopuffer_client.batch_index_documents.assert_not_called()
+
+
+def test_scan_and_index_gcs_bucket_batches(indexer, tmp_path):
+    """Test bucket scan flushes full and partial batches."""
+
+    indexer.gcs_client.list_blobs.side_effect = fake_list_blobs([
+        "docs/Bennett Legal/P/a.pdf",
+        "docs/Bennett Legal/P/",
+        "docs/Bennett Legal/P/b.pdf",
+        "docs/Bennett Legal/P/c.pdf",
+    ])
+
+    cursor_path = tmp_path / "cursor"
+
+    results = indexer.scan_and_index_gcs_bucket(
+        batch_size=2, cursor_path=str(cursor_path), state_path=str(tmp_path / "state.db")
+    )
+
+    assert results["indexed_files"] == 3
+    assert indexer.turbopuffer_client.batch_index_documents.call_count == 2
+    assert not cursor_path.exists()
+
+
+def test_scan_and_index_gcs_bucket_resumes_from_cursor(indexer, tmp_path):
+    """Test a resumed scan lists shards from their saved cursor."""
+
+    indexer.gcs_client.list_blobs.side_effect = fake_list_blobs([
+        "docs/Bennett Legal/P/a.pdf",
+        "docs/Bennett Legal/P/b.pdf",
+        "docs/Bennett Legal/P/c.pdf",
+        "docs/Bennett Legal/Q/d.pdf",
+    ])
+    cursor_path = tmp_path / "cursor"
+    ScanCursor(str(cursor_path), "test-bucket").update({"docs/Bennett Legal/P/": "docs/Bennett Legal/P/b.pdf"})
+
+    results = indexer.scan_and_index_gcs_bucket(
+        batch_size=10, cursor_path=str(cursor_path), state_path=str(tmp_path / "state.db")
+    )
+
+    assert results["indexed_files"] == 3  # b.pdf (start offset is inclusive), c.pdf, d.pdf
+
+
+def test_scan_cursor_records_indexed_batches(tmp_path):
+    """Test checkpoints persist per bucket and are ignored for other buckets."""
+
+    cursor_path = str(tmp_path / "cursor")
+    cursor = ScanCursor(cursor_path, "test-bucket")
+    cursor.update({"docs/A/": "docs/A/1.pdf"})
+    cursor.update({"docs/A/": "docs/A/3.pdf", "docs/B/": "docs/B/2.pdf"})
+
+    assert ScanCursor(cursor_path, "test-bucket").load() == {
+        "docs/A/": "docs/A/3.pdf",
+        "docs/B/": "docs/B/2.pdf",
+    }
+    assert ScanCursor(cursor_path, "other-bucket").load() == {}
+
+
+def test_scan_cursor_paths_are_scoped_and_writes_isolated(tmp_path):
+    """Test default cursor paths differ per bucket and prefix and concurrent updates leave no tmp files."""
+
+    base = str(tmp_path / ".indexer_cursor")
+    assert scoped_state_path(base, "a") != scoped_state_path(base, "b")
+    assert scoped_state_path(base, "a", "docs/") != scoped_state_path(base, "a", "other/")
+
+    cursor_path = scoped_state_path(base, "test-bucket")
+    cursors = [ScanCursor(cursor_path, "test-bucket") for _ in range(4)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda i: cursors[i % 4].update({f"docs/{i}/": f"docs/{i}/a.pdf"}), range(40)))
+
+    assert ScanCursor(cursor_path, "test-bucket").load()
+    assert [p.name for p in tmp_path.iterdir()] == [Path(cursor_path).name]
+
+
+def test_scan_and_index_gcs_bucket_skips_unchanged_generations(indexer, tmp_path):
+    """Test a rescan only re-indexes new blobs and blobs with a new generation."""
+
+    names = ["docs/Bennett Legal/P/a.pdf", "docs/Bennett Legal/P/b.pdf"]
+    scan_args = {"cursor_path": str(tmp_path / "cursor"), "state_path": str(tmp_path / "state.db")}
+
+    indexer.gcs_client.list_blobs.side_effect = fake_list_blobs(names)
+    assert indexer.scan_and_index_gcs_bucket(**scan_args)["indexed_files"] == 2
+
+    indexer.gcs_client.list_blobs.side_effect = fake_list_blobs(
+        names + ["docs/Bennett Legal/P/c.pdf"],
+        generations={"docs/Bennett Legal/P/b.pdf": 2}
+    )
+    results = indexer.scan_and_index_gcs_bucket(**scan_args)
+
+    assert results["indexed_files"] == 2  # b.pdf was overwritten, c.pdf is new
+    assert results["unchanged_files"] == 1
+    columns = indexer.turbopuffer_client.batch_index_documents.call_args.args[0]
+    assert columns.gcs_paths == ["docs/Bennett Legal/P/b.pdf", "docs/Bennett Legal/P/c.pdf"]
+
+    results = indexer.scan_and_index_gcs_bucket(incremental=False, **scan_args)
+    assert results["indexed_files"] == 3
+
+
+def test_blob_generation_state_is_per_bucket(tmp_path):
+    """Test recorded generations are looked up per bucket."""
+
+    path = str(tmp_path / "state.db")
+    state = BlobGenerationState(path, "test-bucket")
+    state.record([("docs/A/1.pdf", 5)])
+    state.record([("docs/A/1.pdf", 6), ("docs/A/2.pdf", 1)])
+    state.close()
+
+    assert BlobGenerationState(path, "test-bucket").get("docs/A/1.pdf") == 6
+    assert BlobGenerationState(path, "other-bucket").get("docs/A/1.pdf") is None
+
+
+def test_blob_generation_state_writers_share_a_lock(tmp_path):
+    """Test states opened on the same file serialise their writes."""
+
+    path = scoped_state_path(str(tmp_path / ".indexer_state.db"), "test-bucket")
+    assert path.endswith(".db") and path != scoped_state_path(str(tmp_path / ".indexer_state.db"), "other")
+
+    states = [BlobGenerationState(path, "test-bucket") for _ in range(2)]
+    assert states[0]._lock is states[1]._lock
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(lambda i: states[i % 2].record([(f"docs/A/{i}.pdf", i)]), range(20)))
+
+    assert states[0].get("docs/A/19.pdf") == 19
+    for state in states:
+        state.close()
+
+
+def test_iter_blob_names_covers_all_shards(indexer):
+    """Test sharded listing yields every blob under docs/ exactly once."""
+
+    names = [
+        "docs/readme.txt",
+        "docs/Other/loose.pdf",
+        "docs/Other/Sub/x.pdf",
+        "docs/Bennett Legal/Project A/a.pdf",
+        "docs/Bennett Legal/Project A/nested/b.pdf",
+        "docs/Bennett Legal/Project B/c.pdf",
+    ]
+    indexer.gcs_client.list_blobs.side_effect = fake_list_blobs(names)
+
+    yielded = [name for _, name, _ in indexer._iter_blob_names(queue_size=2)]
+
+    assert sorted(yielded) == sorted(names)
+
+
+def test_background_uploader_surfaces_errors():
+    """Test a failed background upload is raised to the producer."""
+
+    client = Mock()
+    client.batch_index_documents.side_effect = RuntimeError("upload failed")
+
+    with pytest.raises(RuntimeError, match="upload failed"):
+        with BackgroundBatchUploader(client, max_pending=1) as uploader:
+            for _ in range(5):
+                uploader.submit([{"id": "doc_1"}])
+
+
+def test_index_existing_documents_skips_unmapped(indexer):
+    """Test only mapped documents with filenames and projects are indexed."""
+
+    projects = [ProjectRecord(id=1, project_name="Project A")]
+    documents = [
+        DocumentRecord(id=10, project_id=1, filename="a.pdf", doc_key=None,
+                       size=None, uploader_id=None, upload_date=None),
+        DocumentRecord(id=11, project_id=1, filename="  ", doc_key=None,
+                       size=None, uploader_id=None, upload_date=None),
+        DocumentRecord(id=12, project_id=2, filename="b.pdf", doc_key=None,
+                       size=None, uploader_id=None, upload_date=None),
+        DocumentRecord(id=13, project_id=None, filename="c.pdf", doc_key=None,
+                       size=None, uploader_id=None, upload_date=None),
+    ]
+    indexer.gcs_mapper = Mock()
+    indexer.gcs_mapper.build_project_mapping.return_value = {1: "docs/Bennett Legal/Project A"}
+
+    results = indexer.index_existing_documents(projects, documents)
+
+    assert results == {"indexed_documents": 1, "skipped_documents": 3, "total_projects_mapped": 1}
+    columns = indexer.turbopuffer_client.batch_index_documents.call_args.args[0]
+    assert columns.ids == ["doc_10"]
+    assert columns.gcs_paths == ["docs/Bennett Legal/Project A/a.pdf"]
+
+
+def test_adaptive_batch_size_follows_latency():
+    """Test batch size doubles on fast upserts and halves on slow ones."""
+
+    sizer = AdaptiveBatchSize(1000, maximum=4000, window=3)
+
+    for _ in range(3):
+        sizer.record(0.05)
+    assert sizer.size == 2000
+
+    for _ in range(6):
+        sizer.record(0.05)
+    assert sizer.size == 4000  # capped at maximum
+
+    for _ in range(3):
+        sizer.record(1.0)
+    assert sizer.size == 4000  # within target band
+
+    for _ in range(3):
+        sizer.record(3.0)
+    assert sizer.size == 2000
+
+
+def test_remove_documents_from_index_batches_ids(indexer):
+    """Test documents are deleted in one request and results reported per ID."""
+
+    results = indexer.remove_documents_from_index([1, 2, 3])
+
+    assert results == {1: True, 2: True, 3: True}
+    indexer.turbopuffer_client.delete_documents.assert_called_once_with(["doc_1", "doc_2", "doc_3"])
+
+
+def test_remove_documents_from_index_reports_api_errors(indexer):
+    """Test persistent API errors are reported as failures and other errors propagate."""
+
+    request = httpx.Request("POST", "https://example.invalid")
+    indexer.turbopuffer_client.delete_documents.side_effect = turbopuffer.APIConnectionError(request=request)
+
+    assert indexer.remove_documents_from_index([1, 2]) == {1: False, 2: False}
+    assert indexer.remove_document_from_index(3) is False
+
+    indexer.turbopuffer_client.delete_documents.side_effect = TypeError("bad ids")
+    with pytest.raises(TypeError):
+        indexer.remove_document_from_index(4)
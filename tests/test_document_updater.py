@@ -0,0 +1,79 @@
+"""Test document URL updater functionality."""
+
+import asyncio
+import pytest
+from unittest.mock import Mock, patch
+
+from src.migration.core.document_updater import (
+    DocumentURLUpdater, _document_fields, _probe_document_fields
+)
+from src.migration.models.config import GCSConfig, MigrationConfig, MSSQLConfig, SupabaseConfig
+
+
+@pytest.fixture
+def updater():
+    """Create an updater with Supabase mocked out and project 7 mapped."""
+    config = MigrationConfig(
+        mssql=MSSQLConfig(server="localhost", database="test", username="user", password="pass"),
+        supabase=SupabaseConfig(url="https://test.supabase.co", key="key", service_role_key="service"),
+        gcs=GCSConfig(project_id="test-project", bucket_name="test-bucket")
+    )
+    with patch('src.migration.core.document_updater.Client'):
+        yield DocumentURLUpdater(config, {7: "docs/Bennett Legal/P"})
+
+
+def test_update_documents_batches_and_collects_errors(updater):
+    """Test documents are written per batch and unmapped or unwritten ones are logged."""
+
+    docs = [{"id": i, "filename": f"{i}.pdf", "projectid": 7} for i in range(1, 6)]
+    docs[1]["filename"] = None
+    written = []
+
+    def upsert(rows, **kwargs):
+        written.append([row["id"] for row in rows])
+        # The database reports no rows affected for the batch holding document 5
+        count = 0 if rows[0]["id"] == 5 else len(rows)
+        return Mock(execute=Mock(return_value=Mock(count=count)))
+
+    updater.supabase.table.return_value.upsert.side_effect = upsert
+
+    with patch('src.migration.core.document_updater.URL_UPDATE_BATCH_SIZE', 2):
+        updated = asyncio.run(updater.update_documents(docs))
+
+    assert updated == 3
+    assert sorted(written) == [[1], [3, 4], [5]]
+    assert updater.stats.migrated_docs == 3
+    assert updater.stats.errors == 2
+    # Two errors fill a log batch, so they are inserted into migration_log together
+    logged = updater.supabase.table.return_value.insert.call_args.args[0]
+    assert sorted(row["doc_id"] for row in logged) == [2, 5]
+
+    row = updater._build_update_row(docs[0], 1, "1.pdf", 7, "now")
+    assert row["gcs_url"] == "gs://test-bucket/docs/Bennett Legal/P/1.pdf"
+    assert row["gcs_path"] == "docs/Bennett Legal/P/1.pdf"
+    assert updater._build_update_row(docs[0], 1, "1.pdf", 8, "now") == (
+        1, "No GCS path mapping for project_id 8"
+    )
+
+
+def test_update_documents_counts_batches_without_a_count_as_written(updater):
+    """Test a response without a row count is taken as every row written."""
+
+    updater.supabase.table.return_value.upsert.return_value.execute.return_value = Mock(count=None)
+
+    assert asyncio.run(updater.update_documents([{"id": 1, "filename": "a.pdf", "projectid": 7}])) == 1
+    assert updater.stats.errors == 0
+
+
+def test_document_fields_resolves_column_spellings():
+    """Test the column spelling is fixed once per page unless it is ambiguous."""
+
+    getter = _document_fields({"ID": 1, "Filename": "a.pdf", "ProjectID": 7})
+    assert getter({"ID": 2, "Filename": "b.pdf", "ProjectID": 8}) == (2, "b.pdf", 8)
+
+    ambiguous = {"id": None, "ID": 3, "filename": "c.pdf", "project_id": 9}
+    assert _document_fields(ambiguous) is _probe_document_fields
+    assert _probe_document_fields(ambiguous) == (3, "c.pdf", 9)
+
+    assert _document_fields({"id": 4, "filename": "d.pdf"}) is _probe_document_fields
+    assert _probe_document_fields({"id": 4, "filename": "d.pdf"}) == (4, "d.pdf", None)
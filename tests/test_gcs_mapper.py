@@ -56,7 +56,9 @@ def test_gcs_path_exists_true(mock_storage_client, gcs_config):
     result = mapper.gcs_path_exists("test/path")
     
     assert result is True
-    mock_bucket.list_blobs.assert_called_once_with(prefix="test/path", max_results=1)
+    mock_bucket.list_blobs.assert_called_once_with(
+        prefix="test/path", max_results=1, fields="items(name),nextPageToken"
+    )
 
 
 @patch('src.migration.core.gcs_mapper.storage.Client')
@@ -129,4 +131,110 @@ def test_get_mapping_stats(mock_storage_client, gcs_config):
     stats = mapper.get_mapping_stats()
     
     assert stats["total_projects_mapped"] == 3
-    assert stats["unique_paths"] == 2  # Only 2 unique paths
\ No newline at end of file
+    assert stats["unique_paths"] == 2  # Only 2 unique paths
+
+
+@patch('src.migration.core.gcs_mapper.storage.Client')
+def test_mapper_uses_injected_client(mock_storage_client, gcs_config):
+    """Test a shared storage client is reused instead of creating a new one."""
+    
+    shared_client = Mock()
+    
+    mapper = ProjectGCSMapper(gcs_config, client=shared_client)
+    
+    assert mapper.client is shared_client
+    shared_client.bucket.assert_called_once_with("test-bucket")
+    mock_storage_client.assert_not_called()
+
+
+@patch('src.migration.core.gcs_mapper.storage.Client')
+def test_build_project_mapping_skips_blank_filenames(mock_storage_client, gcs_config):
+    """Test projects whose documents only have blank filenames are not probed."""
+    
+    documents = [
+        DocumentRecord(id=1, project_id=1, filename="   ", doc_key=None,
+                       size=None, uploader_id=None, upload_date=None),
+        DocumentRecord(id=2, project_id=2, filename="doc.pdf", doc_key=None,
+                       size=None, uploader_id=None, upload_date=None),
+    ]
+    mapper = ProjectGCSMapper(gcs_config)
+    mapper.list_top_level_entries = Mock(return_value=["docs/Bennett Legal/Named/"])
+    
+    mapping = mapper.build_project_mapping(
+        [ProjectRecord(id=1, project_name="Blank"), ProjectRecord(id=2, project_name="Named")],
+        documents
+    )
+    
+    assert documents[0].filename is None
+    assert mapping == {2: "docs/Bennett Legal/Named"}
+
+
+class FakeListing(list):
+    """Blobs from a delimited listing, exposing the folder prefixes it found."""
+
+    def __init__(self, names, prefixes):
+        super().__init__(Mock(name=name) for name in names)
+        for blob, name in zip(self, names):
+            blob.name = name
+        self.prefixes = set(prefixes)
+
+
+@patch('src.migration.core.gcs_mapper.storage.Client')
+def test_build_project_mapping_lists_project_folders_once(mock_storage_client, gcs_config):
+    """Test project folders are resolved from one listing instead of a probe per candidate."""
+    
+    mapper = ProjectGCSMapper(gcs_config)
+    mapper.bucket.list_blobs.return_value = FakeListing(
+        ["docs/Bennett Legal/readme.txt"],
+        ["docs/Bennett Legal/Project A (2)/", "docs/Bennett Legal/Solar - Project B/"]
+    )
+    projects = [
+        ProjectRecord(id=1, project_name="Project A"),
+        ProjectRecord(id=2, project_name="Project B"),
+        ProjectRecord(id=3, project_name="12/01 Intake"),
+    ]
+    documents = [
+        DocumentRecord(id=i, project_id=i, filename="doc.pdf", doc_key=None,
+                       size=None, uploader_id=None, upload_date=None)
+        for i in (1, 2, 3)
+    ]
+    mapper.gcs_path_exists = Mock(return_value=False)
+    mapper.check_documents_in_mailroom = Mock(return_value=False)
+    
+    mapping = mapper.build_project_mapping(projects, documents)
+    
+    # As with a prefix probe, a candidate matches any listed name it prefixes
+    assert mapping == {
+        1: "docs/Bennett Legal/Project A",
+        2: "docs/Bennett Legal/Solar - Project B",
+    }
+    mapper.bucket.list_blobs.assert_called_once_with(prefix="docs/Bennett Legal/", delimiter="/")
+    # Only the unsanitized name with a '/' reaches below the listing and is probed
+    assert {call.args[0] for call in mapper.gcs_path_exists.call_args_list} == {
+        "docs/Bennett Legal/12/01 Intake",
+        *(f"docs/Bennett Legal/12/01 Intake ({i})" for i in range(1, 10)),
+        "docs/Bennett Legal/Solar - 12/01 Intake",
+        "docs/Bennett Legal/Solar - PNC 12/01 Intake",
+    }
+
+
+@patch('src.migration.core.gcs_mapper.storage.Client')
+def test_check_documents_in_mailroom_lists_once(mock_storage_client, gcs_config):
+    """Test mailroom checks share one listing instead of a HEAD request per file."""
+    
+    mapper = ProjectGCSMapper(gcs_config)
+    mapper.bucket.list_blobs.return_value = FakeListing(
+        ["docs/Bennett Legal/zzz_mailroom_no_project_assigned/found.pdf"], []
+    )
+    
+    def docs(*filenames):
+        return [
+            DocumentRecord(id=i, project_id=1, filename=filename, doc_key=None,
+                           size=None, uploader_id=None, upload_date=None)
+            for i, filename in enumerate(filenames)
+        ]
+    
+    assert mapper.check_documents_in_mailroom(docs("missing.pdf", "found.pdf")) is True
+    assert mapper.check_documents_in_mailroom(docs("missing.pdf")) is False
+    mapper.bucket.list_blobs.assert_called_once()
+    mapper.bucket.blob.assert_not_called()
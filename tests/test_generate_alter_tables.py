@@ -0,0 +1,53 @@
+"""Test ALTER TABLE generation from retry files."""
+
+import csv
+import os
+import tempfile
+
+from generate_alter_tables import extract_table_errors_from_retry_file, generate_alter_table_sql
+
+
+def test_extract_table_errors_from_retry_file():
+    """Test SQLSTATE extraction, defaults and 42P10 precedence."""
+    
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['batch_id', 'table_name', 'error_message'])
+        writer.writerow(['1', 'Project', "{'code': '42P10', 'message': 'no unique constraint'}"])
+        writer.writerow(['2', 'Doc ', "{'code': '42703', 'message': 'column id does not exist'}"])
+        writer.writerow(['3', 'Person', "42703 then 42P10"])
+        writer.writerow(['4', 'Note', "timeout"])
+        writer.writerow(['5', 'Skipped', "   "])
+        writer.writerow(['6', '', "42703"])
+        temp_file = f.name
+    
+    try:
+        table_errors = extract_table_errors_from_retry_file(temp_file)
+        
+        assert table_errors == {
+            'Project': '42P10',
+            'Doc': '42703',
+            'Person': '42P10',
+            'Note': '42P10',
+        }
+        
+    finally:
+        os.unlink(temp_file)
+
+
+def test_generate_alter_table_sql():
+    """Test SQL output per error code, sorted by table name."""
+    
+    sql = generate_alter_table_sql({'Doc': '42703', 'Project': '42P10'})
+    
+    assert sql == (
+        "-- ALTER TABLE statements to fix primary key issues\n"
+        "-- Run these in Supabase SQL Editor\n"
+        "\n"
+        "-- Table: Doc (Error: 42703)\n"
+        "ALTER TABLE \"Doc\" ADD COLUMN id uuid DEFAULT gen_random_uuid() PRIMARY KEY;\n"
+        "\n"
+        "-- Table: Project (Error: 42P10)\n"
+        "ALTER TABLE \"Project\" DROP CONSTRAINT IF EXISTS Project_id_unique;\n"
+        "ALTER TABLE \"Project\" ADD CONSTRAINT Project_id_unique UNIQUE (id);\n"
+    )
@@ -0,0 +1,154 @@
+"""Test document query interface."""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from src.indexing.query_interface import DocumentQueryInterface
+from src.indexing.turbopuffer_client import SearchHit
+from src.migration.models.config import GCSConfig, TurbopufferConfig, IndexingConfig
+
+
+@pytest.fixture
+def query_interface():
+    """Create a query interface with Turbopuffer mocked out."""
+    config = IndexingConfig(
+        gcs=GCSConfig(project_id="test-project", bucket_name="test-bucket"),
+        turbopuffer=TurbopufferConfig(api_key="test-key")
+    )
+    with patch('src.indexing.query_interface.TurbopufferClient'):
+        yield DocumentQueryInterface(config)
+
+
+def test_format_search_results(query_interface):
+    """Test hits are formatted with placeholders for missing attributes."""
+
+    hits = iter([
+        SearchHit("doc_1", filename="a.pdf", gcs_path="docs/P/a.pdf", project_name="P",
+                  gcs_url="gs://b/docs/P/a.pdf"),
+        SearchHit("doc_2"),
+    ])
+
+    formatted = query_interface.format_search_results(hits)
+
+    assert formatted.startswith("Found 2 document(s):\n\n1. a.pdf\n   Project: P\n")
+    assert "2. Unknown\n   Project: Unknown" in formatted
+    assert query_interface.format_search_results([]) == "No documents found."
+
+
+def test_get_index_statistics_delegates_to_client(query_interface):
+    """Test statistics come from the client's cache unless a refresh is forced."""
+
+    query_interface.client.get_index_stats.return_value = {"status": "active", "sample_count": 1}
+
+    assert query_interface.get_index_statistics()["status"] == "active"
+    query_interface.get_index_statistics(force_refresh=True)
+
+    assert [call.kwargs for call in query_interface.client.get_index_stats.call_args_list] == [
+        {"force_refresh": False}, {"force_refresh": True}
+    ]
+
+
+def test_is_reachable_cached(query_interface):
+    """Test connectivity checks are cached between health probes."""
+
+    query_interface.client.ping.return_value = True
+
+    with patch('src.indexing.query_interface.time.monotonic', side_effect=[0.0, 5.0, 20.0]):
+        assert query_interface.is_reachable() is True
+        assert query_interface.is_reachable() is True
+        assert query_interface.is_reachable() is True
+
+    assert query_interface.client.ping.call_count == 2
+
+
+def test_multi_search_skips_empty_filter_sets(query_interface):
+    """Test criteria-less searches are not sent and return no results."""
+
+    query_interface.client.build_search_query.side_effect = lambda **kwargs: (
+        kwargs if kwargs.get('filename') else None
+    )
+    query_interface.client.multi_search.return_value = [[{"id": "doc_1"}]]
+
+    results = query_interface.multi_search([{}, {"filename": "a.pdf"}])
+
+    assert results == [[], [{"id": "doc_1"}]]
+    assert len(query_interface.client.multi_search.call_args.args[0]) == 1
+
+
+def test_async_search_documents_matches_sync_query(query_interface):
+    """Test async searches use the same criteria as the sync path."""
+
+    async def fake_async_find(limit=10, **criteria):
+        return [{"id": "doc_1", "filename": "a.pdf"}]
+
+    query_interface.client.async_find.side_effect = fake_async_find
+
+    results = asyncio.run(query_interface.multi_async_search([
+        {"filename": "a.pdf"}, {"project_id": 3, "limit": 5}
+    ]))
+
+    assert [rows[0]["id"] for rows in results] == ["doc_1", "doc_1"]
+    query_interface.client.async_find.assert_any_call(limit=10, filename="a.pdf")
+    query_interface.client.async_find.assert_any_call(limit=5, project_id=3)
+
+
+def test_search_documents_prefers_most_selective_filter(query_interface):
+    """Test the single-filter search picks criteria in selectivity order."""
+
+    query_interface.client.find.return_value = []
+
+    query_interface.search_documents(query="brief", project_name="Smith", filename="a.pdf")
+    query_interface.client.find.assert_called_with(limit=10, filename="a.pdf")
+
+    query_interface.search_documents(query="brief", project_name="Smith", project_id=0)
+    query_interface.client.find.assert_called_with(limit=10, project_id=0)
+
+    query_interface.search_documents()
+    query_interface.client.find.assert_called_with(limit=10)
+
+
+def test_search_documents_tries_exact_lookups_first(query_interface):
+    """Test ID- and filename-shaped queries use equality lookups before BM25."""
+
+    hit = SearchHit("doc_1")
+    query_interface.client.search_by_project_id.return_value = [hit]
+    query_interface.client.search_by_filename_exact.return_value = []
+    query_interface.client.find.return_value = []
+
+    assert query_interface.search_documents(query="42") == [hit]
+    query_interface.client.search_by_project_id.assert_called_once_with(42, 10)
+    query_interface.client.find.assert_not_called()
+
+    query_interface.search_documents(query="Smith Brief.PDF", limit=5)
+    query_interface.client.search_by_filename_exact.assert_called_once_with("Smith Brief.PDF", 5)
+    query_interface.client.find.assert_called_once_with(limit=5, query="Smith Brief.PDF")
+
+    query_interface.search_documents(query="settlement agreement")
+    query_interface.client.search_by_filename_exact.assert_called_once()
+
+
+def test_search_documents_non_ascii_digits_fall_through(query_interface):
+    """Test digit-like Unicode queries go to BM25 instead of the project ID lookup."""
+
+    query_interface.client.find.return_value = []
+
+    assert query_interface.search_documents(query="²") == []
+    assert asyncio.run(query_interface._async_exact_search("①", 10)) == []
+    query_interface.client.search_by_project_id.assert_not_called()
+
+
+def test_advanced_search_combines_all_filters_in_one_request(query_interface):
+    """Test every given predicate is sent together rather than fanned out."""
+
+    query_interface.client.find.return_value = [SearchHit("doc_1")]
+
+    results = query_interface.advanced_search({
+        "project_id": 7, "filename": "brief", "project_name": "Smith", "query": "motion", "limit": 5
+    })
+
+    assert results == [SearchHit("doc_1")]
+    query_interface.client.find.assert_called_once_with(
+        limit=5, project_id=7, filename="brief", project_name="Smith", query="motion"
+    )
+    assert query_interface.advanced_search({"limit": 5}) == []
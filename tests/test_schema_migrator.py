@@ -0,0 +1,91 @@
+"""Test schema migrator functionality."""
+
+import asyncio
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock, patch
+
+from src.migration.core.schema_migrator import EMPTY_JSON_ARRAY, SchemaMigrator, _pg_value
+from src.migration.models.config import GCSConfig, MigrationConfig, MSSQLConfig, SupabaseConfig
+
+
+@pytest.fixture
+def migrator():
+    """Create a schema migrator with Supabase mocked out."""
+    config = MigrationConfig(
+        mssql=MSSQLConfig(server="localhost", database="test", username="user", password="pass"),
+        supabase=SupabaseConfig(url="https://test.supabase.co", key="key", service_role_key="service"),
+        gcs=GCSConfig(project_id="test-project", bucket_name="test-bucket")
+    )
+    with patch('src.migration.core.schema_migrator.create_client'):
+        yield SchemaMigrator(config)
+
+
+def table_returning(rows):
+    """Build a mock table whose select().execute() returns rows."""
+    table = Mock()
+    table.select.return_value.execute.return_value.data = rows
+    return table
+
+
+def test_migrate_documents_records_each_chunk_before_copying_the_next(migrator):
+    """Test storage_files rows are written per copy chunk rather than after every copy."""
+
+    source_rows = {
+        "doc": [{"id": i, "projectid": i, "filename": f"{i}.pdf"} for i in range(5)],
+        "docrevision": [],
+        "project": [{"id": i, "projectname": f"P{i}"} for i in range(5)],
+    }
+    events = []
+
+    def copy_files(copies):
+        events.append(("copy", len(copies)))
+        return [source != "docs/Bennett Legal/P1/1.pdf" for source, _ in copies]
+
+    migrator.migration_org_user_id = "user"
+    files_table = Mock()
+    files_table.insert.side_effect = lambda record: events.append(("insert", record["name"])) or Mock()
+
+    with patch('src.migration.core.schema_migrator.DOCUMENT_COPY_CHUNK', 2), \
+            patch.object(migrator, 'get_source_table', side_effect=lambda name: table_returning(source_rows[name])), \
+            patch.object(migrator, 'get_table', return_value=files_table), \
+            patch.object(migrator, 'create_case_folder_structure', AsyncMock(return_value={'documents': 'folder'})), \
+            patch.object(migrator, 'get_file_size', return_value=1), \
+            patch.object(migrator, 'compute_file_checksum', return_value="sum"), \
+            patch.object(migrator, 'copy_files_to_destination_bucket', side_effect=copy_files):
+        file_id_map = asyncio.run(migrator.migrate_documents({str(i): f"case_{i}" for i in range(5)}))
+
+    assert events == [
+        ("copy", 2), ("insert", "0.pdf"),
+        ("copy", 2), ("insert", "2.pdf"), ("insert", "3.pdf"),
+        ("copy", 1), ("insert", "4.pdf"),
+    ]
+    assert sorted(file_id_map) == ["0", "2", "3", "4"]
+
+
+def test_find_existing_contact_prefers_full_names_and_earlier_contacts(migrator):
+    """Test full-name combinations are tried before (first, last) and the first contact indexed wins."""
+
+    migrator._index_contact("c1", "John", "Smith", "John  Q  SMITH")
+    migrator._index_contact("c2", "john", "smith", "John Smith")
+    migrator._index_contact("c3", "Jane", "Doe", "")
+    migrator._index_contact("c4", " JANE ", "DOE", None)
+    migrator._index_contact("c5", "Johnny", "Smith", "john smith")
+
+    # "first last" is tried before "first middle last"
+    assert migrator.find_existing_contact("John", "Q", "Smith") == "c2"
+    assert migrator.find_existing_contact(" JOHN ", "", "smith ") == "c2"
+    assert migrator.find_existing_contact("john", "", "q smith") == "c1"
+    # No full name matches, so the (first, last) index decides
+    assert migrator.find_existing_contact("Jane", None, "Doe") == "c3"
+    assert migrator.find_existing_contact("Bob", "", "Jones") is None
+
+
+def test_pg_value_converts_jsonb_and_timestamps():
+    """Test values are converted to what asyncpg expects for their column."""
+
+    assert _pg_value("addresses", []) is EMPTY_JSON_ARRAY
+    assert _pg_value("emails", [{"email": "a@b.c"}]) == '[{"email":"a@b.c"}]'
+    assert _pg_value("created_at", "2024-01-02T03:04:05+00:00") == datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    assert _pg_value("created_at", None) is None
+    assert _pg_value("full_name", "[]") == "[]"
@@ -0,0 +1,75 @@
+"""Test Supabase migrator functionality."""
+
+import asyncio
+import pytest
+from unittest.mock import Mock, patch
+
+# pyodbc needs the system unixODBC library to import
+pytest.importorskip("pyodbc", exc_type=ImportError)
+
+from src.migration.core.supabase_migrator import SupabaseMigrator
+from src.migration.models.config import GCSConfig, MigrationConfig, MSSQLConfig, SupabaseConfig
+from src.migration.models.migration import MigrationStats
+
+
+@pytest.fixture
+def migrator():
+    """Create a migrator whose upserts fail for records marked bad."""
+    config = MigrationConfig(
+        mssql=MSSQLConfig(server="localhost", database="test", username="user", password="pass"),
+        supabase=SupabaseConfig(url="https://test.supabase.co", key="key", service_role_key="service"),
+        gcs=GCSConfig(project_id="test-project", bucket_name="test-bucket")
+    )
+    with patch('src.migration.core.supabase_migrator.create_client'):
+        migrator = SupabaseMigrator(config)
+
+    def upsert(records, on_conflict):
+        if records[0].get("bad"):
+            raise RuntimeError("constraint violation")
+        return Mock(execute=Mock(return_value=Mock(data=records)))
+
+    migrator.supabase.table.return_value.upsert.side_effect = upsert
+    return migrator
+
+
+def failure(name, records):
+    """Build a failed batch record as log_batch_failure stores it."""
+    return {"table_name": name, "error_message": "boom", "batch_size": len(records), "batch_data": records}
+
+
+def test_retry_failed_batches_drops_resolved_recorded_batches(migrator):
+    """Test recorded batches are removed once every record succeeds, including empty ones."""
+
+    empty = failure("empty", [])
+    partial = failure("partial", [{"id": 1}, {"id": 2, "bad": True}])
+    complete = failure("complete", [{"id": 3}, {"id": 4}])
+    migrator.failed_batches = [empty, partial, complete]
+
+    assert asyncio.run(migrator.retry_failed_batches()) == 3
+    assert migrator.failed_batches == [partial]
+
+
+def test_retry_failed_batches_keeps_only_unresolved_iterable_batches(migrator):
+    """Test lazily read batches are kept only while some of their records still fail."""
+
+    partial = failure("partial", [{"id": 1, "bad": True}, {"id": 2}])
+    failures = iter([failure("empty", []), partial, failure("complete", [{"id": 3}])])
+
+    assert asyncio.run(migrator.retry_failed_batches(failures)) == 2
+    assert migrator.failed_batches == [partial]
+
+
+def test_merge_sums_stats_and_collects_failures(migrator):
+    """Test a worker's statistics and failed batches are folded into the parent."""
+
+    with patch('src.migration.core.supabase_migrator.create_client'):
+        worker = SupabaseMigrator(migrator.config)
+    migrator.stats = MigrationStats(total_docs=10, migrated_docs=8, errors=1)
+    worker.stats = MigrationStats(total_docs=5, migrated_docs=5, files_uploaded=2)
+    migrator.failed_batches = [failure("a", [{"id": 1}])]
+    worker.failed_batches = [failure("b", [{"id": 2}])]
+
+    migrator.merge(worker)
+
+    assert migrator.stats == MigrationStats(total_docs=15, migrated_docs=13, files_uploaded=2, errors=1)
+    assert [batch["table_name"] for batch in migrator.failed_batches] == ["a", "b"]
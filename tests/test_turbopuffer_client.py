@@ -0,0 +1,367 @@
+"""Test Turbopuffer client query building."""
+
+import asyncio
+import httpx
+import pytest
+import turbopuffer
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src.indexing.turbopuffer_client import (
+    PROJECT_COVERAGE_LIMIT, SEARCH_ATTRIBUTES, SEARCH_CACHE_SIZE, WRITE_CHUNK_ROWS, ZERO_VECTOR, DocumentColumns,
+    SearchHit, TurbopufferClient, _get_namespace, _get_tpuf, tokenize
+)
+from src.migration.models.config import TurbopufferConfig
+
+
+@pytest.fixture(autouse=True)
+def fresh_sdk_clients():
+    """Drop shared SDK clients so each test sees its own mocks."""
+    _get_tpuf.cache_clear()
+    _get_namespace.cache_clear()
+    yield
+    _get_tpuf.cache_clear()
+    _get_namespace.cache_clear()
+
+
+@pytest.fixture
+def client():
+    """Create a Turbopuffer client with the SDK mocked out."""
+    with patch('src.indexing.turbopuffer_client.turbopuffer.Turbopuffer'):
+        yield TurbopufferClient(TurbopufferConfig(api_key="test-key"))
+
+
+def test_build_search_query_combines_criteria(client):
+    """Test all criteria are combined into one filtered, ranked query."""
+
+    params = client.build_search_query(
+        project_id=7, project_name="Smith", filename=".pdf", query="contract", limit=5
+    )
+
+    assert params == {
+        'top_k': 5,
+        'include_attributes': SEARCH_ATTRIBUTES,
+        'filters': ("And", [
+            ("project_id", "Eq", 7),
+            ("filename_tokens", "Contains", "pdf"),
+            ("project_name_tokens", "Contains", "smith"),
+        ]),
+        'rank_by': ('filename', 'BM25', 'contract'),
+    }
+    assert client.build_search_query(filename="a", substring=True)['filters'] == ("filename", "IGlob", "*a*")
+    assert client.build_search_query() is None
+
+
+def test_multi_search_single_request(client):
+    """Test several queries are sent in one request and split per query."""
+
+    client.namespace.multi_query.return_value = SimpleNamespace(results=[
+        SimpleNamespace(rows=[SimpleNamespace(id="a", filename="a.pdf")]),
+        SimpleNamespace(rows=None),
+    ])
+    queries = [client.build_search_query(filename="a"), client.build_search_query(project_id=1)]
+
+    results = client.multi_search(queries)
+
+    client.namespace.multi_query.assert_called_once_with(queries=queries)
+    assert results == [[SearchHit("a", filename="a.pdf")], []]
+
+
+def test_async_search_reuses_lazy_client(client):
+    """Test the async client is created on first use and reused afterwards."""
+
+    async def query(**params):
+        return SimpleNamespace(rows=[SimpleNamespace(id="a")])
+
+    with patch('src.indexing.turbopuffer_client.turbopuffer.AsyncTurbopuffer') as async_sdk:
+        async_sdk.return_value.namespace.return_value.query.side_effect = query
+
+        async def run():
+            first = await client.async_search_by_filename("a.pdf")
+            second = await client.async_full_text_search("contract")
+            return first, second
+
+        assert asyncio.run(run()) == ([SearchHit("a")], [SearchHit("a")])
+        assert async_sdk.call_count == 1
+
+
+def test_search_results_cached_until_write(client):
+    """Test repeated searches hit the cache and writes invalidate it."""
+
+    client.namespace.query.return_value = SimpleNamespace(rows=[SimpleNamespace(id="a")])
+    params = client.build_search_query(filename="a.pdf")
+
+    assert client.search(params) == [SearchHit("a")]
+    assert client.search(dict(params)) == [SearchHit("a")]
+    assert client.search_by_project_id(1) == [SearchHit("a")]
+    assert client.namespace.query.call_count == 2
+
+    client.delete_documents(["doc_1"])
+    client.search(params)
+    assert client.namespace.query.call_count == 3
+
+
+def test_search_cache_expires_and_evicts(client):
+    """Test cached results expire after the TTL and the LRU stays bounded."""
+
+    client.namespace.query.return_value = SimpleNamespace(rows=[])
+
+    with patch('src.indexing.turbopuffer_client.time.monotonic', return_value=0.0):
+        client.search_by_project_id(1)
+    with patch('src.indexing.turbopuffer_client.time.monotonic', return_value=61.0):
+        client.search_by_project_id(1)
+    assert client.namespace.query.call_count == 2
+
+    for i in range(SEARCH_CACHE_SIZE + 10):
+        client._cache_put(("search", i), [], SEARCH_CACHE_SIZE, 60.0)
+    assert len(client._search_cache) == SEARCH_CACHE_SIZE
+    assert ("search", 0) not in client._search_cache
+
+
+def test_batch_index_shares_zero_vector(client):
+    """Test columnar batches reference one shared placeholder vector."""
+
+    columns = DocumentColumns()
+    for i in range(3):
+        columns.append(f"doc_{i}", "a.pdf", "docs/P/a.pdf", "P", 1, i, "gs://a", "https://a")
+
+    client.batch_index_documents(columns)
+
+    written = client.namespace.write.call_args.kwargs
+    assert written['schema'] is TurbopufferClient.DOCUMENT_SCHEMA
+    assert all(vector is ZERO_VECTOR for vector in written['upsert_columns']['vector'])
+
+
+def test_metadata_only_falls_back_to_vectors_when_rejected():
+    """Test metadata-only writes omit vectors until the server rejects one."""
+
+    with patch('src.indexing.turbopuffer_client.turbopuffer.Turbopuffer'):
+        client = TurbopufferClient(TurbopufferConfig(api_key="test-key", metadata_only=True))
+
+    client.index_document({"id": "doc_1", "filename": "a.pdf"})
+    assert 'vector' not in client.namespace.write.call_args.kwargs['upsert_rows'][0]
+
+    response = httpx.Response(400, request=httpx.Request("POST", "https://example.invalid"))
+    client.namespace.write.side_effect = [
+        turbopuffer.BadRequestError("vector required", response=response, body=None),
+        None,
+    ]
+    client.index_document({"id": "doc_2", "filename": "b.pdf"})
+
+    assert client.namespace.write.call_args.kwargs['upsert_rows'][0]['vector'] is ZERO_VECTOR
+    client.namespace.write.side_effect = None
+    client.index_document({"id": "doc_3", "filename": "c.pdf"})
+    assert client.namespace.write.call_args.kwargs['upsert_rows'][0]['vector'] is ZERO_VECTOR
+
+
+def test_tokenize_filenames():
+    """Test names split into unique lowercase tokens."""
+
+    assert tokenize("Smith_v-Jones Final.Contract.PDF") == ["smith", "v", "jones", "final", "contract", "pdf"]
+    assert tokenize("docs/a/a.pdf") == ["docs", "a", "pdf"]
+    assert tokenize("...") == []
+
+
+def test_filename_search_matches_tokens_then_substring(client):
+    """Test token lookups come first, with raw wildcards and misses using IGlob."""
+
+    client.namespace.query.side_effect = [
+        SimpleNamespace(rows=[]),
+        SimpleNamespace(rows=[SimpleNamespace(id="a")]),
+    ]
+
+    assert client.search_by_filename("Contract.pdf") == [SearchHit("a")]
+
+    first, second = [call.kwargs['filters'] for call in client.namespace.query.call_args_list]
+    assert first == ("And", [
+        ("filename_tokens", "Contains", "contract"),
+        ("filename_tokens", "Contains", "pdf"),
+    ])
+    assert second == ("filename", "IGlob", "*Contract.pdf*")
+    assert client.build_search_query(filename="Smith%.pdf")['filters'] == ("filename", "IGlob", "Smith*.pdf")
+    assert client.build_search_query(filename="a[1]*", substring=True)['filters'] == (
+        "filename", "IGlob", "*a[[]1][*]*"
+    )
+
+
+def test_writes_store_name_tokens(client):
+    """Test indexed documents carry filename and project name tokens."""
+
+    client.index_document({"id": "doc_1", "filename": "Final_Brief.docx", "project_name": "Smith v Jones"})
+
+    row = client.namespace.write.call_args.kwargs['upsert_rows'][0]
+    assert row['filename_tokens'] == ["final", "brief", "docx"]
+    assert row['project_name_tokens'] == ["smith", "v", "jones"]
+
+
+def test_writes_normalize_numeric_attributes(client):
+    """Test string and Decimal IDs are written as plain ints."""
+
+    client.batch_index_documents([{"id": "doc_1", "project_id": "7", "document_id": Decimal("12")}])
+
+    row = client.namespace.write.call_args.kwargs['upsert_rows'][0]
+    assert type(row['project_id']) is int and row['project_id'] == 7
+    assert type(row['document_id']) is int and row['document_id'] == 12
+
+
+def test_writes_reject_non_integral_numeric_attributes(client):
+    """Test fractional IDs raise instead of being truncated."""
+
+    client.batch_index_documents([{"id": "doc_1", "project_id": 7.0}])
+    assert client.namespace.write.call_args.kwargs['upsert_rows'][0]['project_id'] == 7
+
+    for value in (7.5, Decimal("12.3"), "7.5"):
+        with pytest.raises(ValueError):
+            client.batch_index_documents([{"id": "doc_1", "project_id": value}])
+
+
+def test_batch_index_writes_bounded_chunks(client):
+    """Test large batches are split into WRITE_CHUNK_ROWS-sized writes."""
+
+    documents = [{"id": f"doc_{i}", "filename": "a.pdf"} for i in range(WRITE_CHUNK_ROWS * 2 + 1)]
+
+    client.batch_index_documents(documents)
+
+    sizes = [len(call.kwargs['upsert_rows']) for call in client.namespace.write.call_args_list]
+    assert sizes == [WRITE_CHUNK_ROWS, WRITE_CHUNK_ROWS, 1]
+    assert 'filename_tokens' not in documents[0]
+
+
+def test_batch_index_documents_async_overlaps_chunks(client):
+    """Test async indexing writes every chunk with bounded concurrency."""
+
+    in_flight = []
+    peak = []
+
+    async def write(**payload):
+        in_flight.append(1)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0)
+        in_flight.pop()
+
+    columns = DocumentColumns()
+    for i in range(WRITE_CHUNK_ROWS * 3):
+        columns.append(f"doc_{i}", "a.pdf", "docs/P/a.pdf", "P", 1, i, "gs://a", "https://a")
+
+    with patch('src.indexing.turbopuffer_client.turbopuffer.AsyncTurbopuffer') as async_sdk:
+        async_sdk.return_value.namespace.return_value.write.side_effect = write
+        asyncio.run(client.batch_index_documents_async(columns, concurrency=2))
+
+    assert len(peak) == 3
+    assert max(peak) == 2
+
+
+def test_search_hits_fill_missing_attributes(client):
+    """Test rows missing attributes become hits with empty defaults."""
+
+    client.namespace.query.return_value = SimpleNamespace(rows=[
+        SimpleNamespace(id=5, filename="a.pdf", project_id=None),
+    ])
+
+    hits = list(client.iter_search_by_project_id(1))
+
+    assert hits == [SearchHit("5", filename="a.pdf")]
+    assert not hasattr(hits[0], "__dict__")
+
+
+def test_clients_share_sdk_connection():
+    """Test clients with the same credentials reuse one SDK client and namespace."""
+
+    with patch('src.indexing.turbopuffer_client.turbopuffer.Turbopuffer') as sdk:
+        first = TurbopufferClient(TurbopufferConfig(api_key="test-key"))
+        second = TurbopufferClient(TurbopufferConfig(api_key="test-key"))
+        other = TurbopufferClient(TurbopufferConfig(api_key="other-key"))
+
+    assert sdk.call_count == 2
+    assert first.namespace is second.namespace
+    assert first._search_cache is not second._search_cache
+
+
+def test_delete_documents_dedups_and_chunks(client):
+    """Test deletes drop duplicate IDs and send bounded chunks."""
+
+    ids = [f"doc_{i}" for i in range(WRITE_CHUNK_ROWS + 5)]
+
+    client.delete_documents(ids + ids[:10])
+
+    chunks = [call.kwargs['deletes'] for call in client.namespace.write.call_args_list]
+    assert [len(chunk) for chunk in chunks] == [WRITE_CHUNK_ROWS, 5]
+    assert chunks[0][0] == "doc_0"
+
+    client.delete_documents([])
+    assert client.namespace.write.call_count == 2
+
+
+def test_get_index_stats_cached(client):
+    """Test index statistics are cached until the TTL expires and errors are not cached."""
+
+    client.namespace.query.return_value = SimpleNamespace(rows=[SimpleNamespace(id="doc_1")])
+
+    with patch('src.indexing.turbopuffer_client.time.monotonic', side_effect=[0.0, 10.0, 15.0, 50.0]):
+        assert client.get_index_stats() == {"status": "active", "sample_count": 1}
+        assert client.get_index_stats()["status"] == "active"
+        assert client.namespace.query.call_count == 1
+
+        client.get_index_stats(force_refresh=True)
+        assert client.namespace.query.call_count == 2
+
+        client.namespace.query.side_effect = RuntimeError("down")
+        assert client.get_index_stats()["status"] == "error"
+        assert client._stats_cache[1]["status"] == "active"
+
+
+def test_search_by_filename_exact_uses_equality(client):
+    """Test exact lookups filter filenames, or GCS paths, by equality."""
+
+    client.namespace.query.return_value = SimpleNamespace(rows=[])
+
+    client.search_by_filename_exact("a.pdf")
+    client.search_by_filename_exact("docs/P/a.pdf", limit=3)
+
+    first, second = [call.kwargs for call in client.namespace.query.call_args_list]
+    assert first['filters'] == ("filename", "Eq", "a.pdf")
+    assert second['filters'] == ("gcs_path", "Eq", "docs/P/a.pdf")
+    assert second['top_k'] == 3
+
+
+def test_writes_share_one_schema_object(client):
+    """Test every write passes the class-level schema rather than a rebuilt copy."""
+
+    client.index_document({"id": "doc_1", "filename": "a.pdf"})
+    client.batch_index_documents([{"id": "doc_2", "filename": "b.pdf"}])
+
+    schemas = [call.kwargs['schema'] for call in client.namespace.write.call_args_list]
+    assert all(schema is TurbopufferClient.DOCUMENT_SCHEMA for schema in schemas)
+
+
+def test_project_listing_answers_scoped_searches(client):
+    """Test a cached complete project listing serves narrower searches until a write."""
+
+    client.namespace.query.return_value = SimpleNamespace(rows=[
+        SimpleNamespace(id="a", filename="Final_Brief.docx", project_id=7),
+        SimpleNamespace(id="b", filename="Exhibit-A.pdf", project_id=7),
+    ])
+
+    assert len(client.get_project_documents(7)) == 2
+    assert client.find(project_id=7, filename="brief") == [SearchHit("a", filename="Final_Brief.docx", project_id=7)]
+    assert [hit.id for hit in client.find(project_id=7, filename="EXHIB")] == ["b"]
+    assert [hit.id for hit in client.find(project_id=7, limit=1)] == ["a"]
+    assert client.find(project_id=7, filename="memo") == []
+    assert client.namespace.query.call_count == 1
+
+    client.delete_document("b")
+    client.find(project_id=7, filename="brief")
+    assert client.namespace.query.call_count == 2
+
+
+def test_truncated_project_listing_is_not_cached(client):
+    """Test listings that hit the limit are not used to answer searches."""
+
+    client.namespace.query.return_value = SimpleNamespace(
+        rows=[SimpleNamespace(id=f"doc_{i}") for i in range(PROJECT_COVERAGE_LIMIT)]
+    )
+
+    client.get_project_documents(7)
+
+    assert client.search_within_project(7, lambda hit: True) is None